@@ -0,0 +1,103 @@
+# benchmarks/bench_enemy_pool.py
+
+"""
+Compare per-object Enemy updates against the batched EnemyPool.
+
+Usage:
+    python benchmarks/bench_enemy_pool.py
+    python benchmarks/bench_enemy_pool.py --counts 10 1000 --frames 120
+    python benchmarks/bench_enemy_pool.py --dt 0.016
+
+By default every frame uses dt == move_interval, so each enemy takes exactly one
+step per frame (the worst case for the game loop). With a 60 FPS dt only the
+enemies due to move are woken, which is where the pool's scheduler pays off.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from drunner_core import enemy as enemy_mod
+from drunner_core.enemy import Enemy, EnemyPool
+from drunner_core.level import Level, Tile
+from drunner_core.rng import CounterRng
+
+INTERVAL = 0.35
+
+
+def _open_level(size: int) -> Level:
+    """
+    Square room with a wall border; START/EXIT in opposite corners.
+    """
+    rows = [[Tile.WALL] * size]
+    for _ in range(size - 2):
+        rows.append([Tile.WALL] + [Tile.FLOOR] * (size - 2) + [Tile.WALL])
+    rows.append([Tile.WALL] * size)
+    rows[1][1] = Tile.START
+    rows[size - 2][size - 2] = Tile.EXIT
+    return Level.from_rows(rows, name=f"bench_{size}")
+
+
+def _spawns(level: Level, count: int) -> list[tuple[int, int]]:
+    rng = random.Random(42)
+    return [
+        (rng.randint(1, level.width - 2), rng.randint(1, level.height - 2)) for _ in range(count)
+    ]
+
+
+def _time_frames(update, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        update()
+    return (time.perf_counter() - start) / frames
+
+
+def bench(count: int, frames: int, objects_limit: int, dt: float) -> None:
+    level = _open_level(max(32, int((count * 2) ** 0.5) + 2))
+    spawns = _spawns(level, count)
+
+    pool = EnemyPool(seed=1)
+    for x, y in spawns:
+        pool.add(x, y, move_interval=INTERVAL)
+    pool_ms = _time_frames(lambda: pool.update(dt, level), frames) * 1000
+
+    if count <= objects_limit:
+        enemies = [
+            Enemy(x=x, y=y, move_interval=INTERVAL, rng=CounterRng.split(1, i))
+            for i, (x, y) in enumerate(spawns)
+        ]
+
+        def _objects() -> None:
+            for e in enemies:
+                e.update(dt, level)
+
+        objects_ms = f"{_time_frames(_objects, frames) * 1000:10.3f}"
+    else:
+        objects_ms = f"{'skipped':>10}"
+
+    backend = "numpy" if enemy_mod.np is not None else "lists"
+    print(f"{count:>8}  {objects_ms} ms  {pool_ms:10.3f} ms  ({backend})")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="EnemyPool vs list[Enemy] frame cost")
+    p.add_argument("--counts", type=int, nargs="+", default=[10, 1_000, 100_000])
+    p.add_argument("--frames", type=int, default=30)
+    p.add_argument(
+        "--objects-limit",
+        type=int,
+        default=100_000,
+        help="Skip the per-object baseline above this many enemies.",
+    )
+    p.add_argument("--dt", type=float, default=INTERVAL, help="Frame time in seconds.")
+    args = p.parse_args()
+
+    print(f"{'enemies':>8}  {'list[Enemy]':>13}  {'EnemyPool':>13}")
+    for count in args.counts:
+        bench(count, args.frames, args.objects_limit, args.dt)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/bench_pathfinding.py
+
+"""
+Query latency of flat A* vs HPA* (HierarchicalPathfinder) on a generated dungeon.
+
+Usage:
+    python benchmarks/bench_pathfinding.py
+    python benchmarks/bench_pathfinding.py --size 1001 --queries 100 --cluster-size 16
+
+Start/goal pairs are random walkable tiles that are far apart (Manhattan
+distance >= size / 2), i.e. the long-range queries HPA* is meant for. "HPA* 1st"
+is the abstract search plus refining only the first hop (iter_path), which is
+what a replanning enemy pays per query; "HPA*" refines the whole path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from drunner_core.generators import generate_level
+from drunner_core.pathfinding import HierarchicalPathfinder, astar
+
+
+def _pairs(level, count: int, seed: int) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    walkable = [(x, y) for x, y, _t in level.iter_tiles() if level.is_walkable(x, y)]
+    rng = random.Random(seed)
+    min_dist = max(level.width, level.height) // 2
+
+    pairs = []
+    for _ in range(count * 50):
+        a, b = rng.choice(walkable), rng.choice(walkable)
+        if abs(a[0] - b[0]) + abs(a[1] - b[1]) >= min_dist:
+            pairs.append((a, b))
+            if len(pairs) == count:
+                break
+    return pairs
+
+
+def _time_queries(find, pairs) -> tuple[list[float], list[int]]:
+    times: list[float] = []
+    lengths: list[int] = []
+    for a, b in pairs:
+        start = time.perf_counter()
+        path = find(a, b)
+        times.append((time.perf_counter() - start) * 1000)
+        lengths.append(len(path) if path else 0)
+    return times, lengths
+
+
+def _summary(name: str, times: list[float]) -> str:
+    p95 = statistics.quantiles(times, n=20)[-1] if len(times) > 1 else times[0]
+    return f"{name:<9} mean {statistics.fmean(times):8.3f} ms   p95 {p95:8.3f} ms"
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Flat A* vs HPA* path query latency")
+    p.add_argument("--size", type=int, default=501, help="Map width and height (odd).")
+    p.add_argument("--queries", type=int, default=50)
+    p.add_argument("--cluster-size", type=int, default=16)
+    p.add_argument("--seed", type=int, default=1)
+    args = p.parse_args()
+
+    level = generate_level(args.seed, args.size, args.size)
+
+    start = time.perf_counter()
+    hpa = HierarchicalPathfinder(level, cluster_size=args.cluster_size)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"map {level.width}x{level.height}, {hpa.node_count} entrance nodes")
+    print(f"HPA* build {build_ms:.1f} ms (cluster {args.cluster_size})")
+
+    pairs = _pairs(level, args.queries, args.seed)
+    if not pairs:
+        print("No far-apart walkable pairs found.")
+        return
+
+    # Flat baseline on a prebuilt grid, so only the search itself is timed.
+    grid, stride = level.walkable_grid()
+
+    def flat(a: tuple[int, int], b: tuple[int, int]) -> list[int] | None:
+        s = (a[1] + 1) * stride + a[0] + 1
+        g = (b[1] + 1) * stride + b[0] + 1
+        return astar(grid, stride, s, g)
+
+    flat_t, flat_len = _time_queries(flat, pairs)
+    hpa_t, hpa_len = _time_queries(hpa.find_path, pairs)
+
+    def first_steps(a: tuple[int, int], b: tuple[int, int]) -> list[tuple[int, int]] | None:
+        it = hpa.iter_path(a, b)
+        return None if it is None else [next(it), next(it, b)]
+
+    first_t, _ = _time_queries(first_steps, pairs)
+
+    print(f"{len(pairs)} queries")
+    print(_summary("A*", flat_t))
+    print(_summary("HPA*", hpa_t))
+    print(_summary("HPA* 1st", first_t))
+
+    ratios = [h / f for h, f in zip(hpa_len, flat_len, strict=True) if f]
+    if ratios:
+        print(f"HPA* path length / optimal: mean {statistics.fmean(ratios):.3f}")
+
+
+if __name__ == "__main__":
+    main()
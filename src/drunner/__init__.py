@@ -6,5 +6,12 @@ drunner package.
 This package exposes top-level package metadata (e.g., the current version).
 """
 
+import os
+
+# pygame prints a banner to stdout on import. Every entry point (`python -m
+# drunner`, the `drunner` script) imports this package before pygame, so
+# stdout stays clean for command output such as `drunner stats --json`.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
 __all__ = ["__version__"]  # Public symbols re-exported by the package.
 __version__ = "0.1.0"  # Semantic version of the drunner package.
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import json
+import os
 import secrets
 import traceback
 import uuid
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from drunner.log import recent_records
+
+# tail_text_file(): read size per seek and default cap on the bytes kept.
+TAIL_BLOCK_SIZE = 8192
+TAIL_MAX_BYTES = 64 * 1024
+
 
 @dataclass(frozen=True)
 class CrashReport:
@@ -25,6 +32,8 @@ class CrashReport:
     log_file: str | None = None
     log_tail: str | None = None
     version: str | None = None
+    # Last log records from memory (drunner.log.RingBufferHandler), oldest first.
+    log_records: list[str] | None = None
 
 
 def _make_run_id() -> str:
@@ -85,16 +94,43 @@ def sanitize_config(cfg: Any) -> dict[str, Any]:
     return out
 
 
-def tail_text_file(path: Path, max_lines: int = 80) -> str | None:
+def tail_text_file(path: Path, max_lines: int = 80, max_bytes: int = TAIL_MAX_BYTES) -> str | None:
     """
-    Return the last max_lines lines from a text file (best-effort).
+    Return the last max_lines lines from a text file, at most max_bytes of it
+    (best-effort).
+
+    Reads backwards from the end in blocks, so the cost depends on the size of
+    the tail, not of the file. If max_bytes cuts a line, the kept part starts
+    at the next whole UTF-8 character; invalid bytes are replaced.
     """
     if not path or not path.exists():
         return None
 
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-        return "\n".join(lines[-max_lines:])
+        with path.open("rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            chunks: list[bytes] = []
+            size = newlines = 0
+            # One newline more than max_lines guarantees the first kept line is whole.
+            while pos > 0 and size < max_bytes and newlines <= max_lines:
+                step = min(TAIL_BLOCK_SIZE, pos, max_bytes - size)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                size += len(chunk)
+                newlines += chunk.count(b"\n")
+
+        data = b"".join(reversed(chunks))
+        if pos > 0:
+            # Started mid-file: skip continuation bytes of a cut multi-byte character.
+            skip = 0
+            while skip < min(3, len(data)) and data[skip] & 0xC0 == 0x80:
+                skip += 1
+            data = data[skip:]
+
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        return "\n".join(lines[-max_lines:]) if max_lines > 0 else ""
     except Exception:
         return None
 
@@ -108,11 +144,14 @@ def write_crash_report(
     seed: int | None = None,
     log_file_path: Path | None = None,
     version: str | None = None,
+    log_records: Sequence[str] | None = None,
 ) -> Path:
     """
     Write a crash report JSON under reports/ and return the created path.
 
-    If seed/run_id are not provided, they are generated.
+    If seed/run_id are not provided, they are generated. log_records defaults
+    to the in-memory ring buffer of the "drunner" logger; the log file is
+    only tailed when there is no buffer.
     """
     rid = run_id or _make_run_id()
     s = seed if seed is not None else _make_seed()
@@ -125,6 +164,11 @@ def write_crash_report(
 
     stack = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
 
+    records = list(log_records) if log_records is not None else recent_records()
+    log_tail = None
+    if records is None and log_file_path:
+        log_tail = tail_text_file(log_file_path)
+
     report = CrashReport(
         run_id=rid,
         timestamp=ts,
@@ -134,8 +178,9 @@ def write_crash_report(
         stacktrace=stack,
         config=sanitize_config(cfg),
         log_file=str(log_file_path) if log_file_path else None,
-        log_tail=tail_text_file(log_file_path) if log_file_path else None,
+        log_tail=log_tail,
         version=version,
+        log_records=records,
     )
 
     payload: dict[str, Any] = asdict(report)
@@ -155,6 +200,7 @@ def run_guarded(
     log_file_path: Path | None = None,
     version: str | None = None,
     logger: Any | None = None,
+    log_records: Sequence[str] | None = None,
 ) -> Any:
     """
     Execute func(). On exception, write crash report and re-raise.
@@ -174,6 +220,7 @@ def run_guarded(
             seed=s,
             log_file_path=log_file_path,
             version=version,
+            log_records=log_records,
         )
         if logger is not None:
             logger.exception("Unhandled exception. Crash report saved: %s", crash_path)
@@ -5,7 +5,8 @@ from __future__ import annotations
 import argparse
 import sys
 
-from drunner.main import run
+from drunner.main import run, run_frames, run_stats, run_telemetry, run_thumbnails
+from drunner.stats import GROUP_COLUMNS
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -29,7 +30,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--seed",
         type=int,
         default=None,
-        help="Seed for generator (int). If omitted, uses current time.",
+        help="Seed for generator and enemy RNG (int). If omitted, uses current time.",
     )
     play.add_argument(
         "--width", type=int, default=None, help="Generated level width in tiles (default: 41)"
@@ -38,6 +39,70 @@ def build_parser() -> argparse.ArgumentParser:
         "--height", type=int, default=None, help="Generated level height in tiles (default: 31)"
     )
 
+    # Headless rendering (no window; SDL dummy video driver).
+    thumbs = sub.add_parser("thumbnails", help="Render PNG thumbnails of all levels (headless)")
+    thumbs.add_argument(
+        "--levels",
+        default=None,
+        help="Directory to scan for level JSON files (relative to levels/, default: all).",
+    )
+    thumbs.add_argument(
+        "--out", default=None, help="Output directory (relative to reports/, default: thumbnails)"
+    )
+    thumbs.add_argument(
+        "--size", type=int, default=256, help="Longest thumbnail edge in pixels (default: 256)"
+    )
+    thumbs.add_argument(
+        "--jobs", type=int, default=None, help="Worker processes (default: one per CPU)"
+    )
+
+    frames = sub.add_parser("frames", help="Render a run as PNG frames (headless, no input)")
+    frames.add_argument(
+        "--level",
+        default=None,
+        help="Path to a level JSON file (relative to levels/). Default: generated from --seed.",
+    )
+    frames.add_argument(
+        "--frames", type=int, default=120, help="Number of frames to write (default: 120)"
+    )
+    frames.add_argument(
+        "--every", type=int, default=1, help="Simulation ticks per frame (default: 1)"
+    )
+    frames.add_argument("--seed", type=int, default=None, help="Run seed (default: 0)")
+    frames.add_argument(
+        "--out",
+        default=None,
+        help="Output directory (relative to reports/, default: frames/<level>_<seed>)",
+    )
+
+    stats = sub.add_parser("stats", help="Aggregate run reports (win rate, durations)")
+    stats.add_argument(
+        "--by", choices=GROUP_COLUMNS, default="level_source", help="Group runs by this field"
+    )
+    stats.add_argument("--limit", type=int, default=20, help="Groups to show (most runs first)")
+    stats.add_argument(
+        "--ingest",
+        nargs="+",
+        default=None,
+        metavar="FILE",
+        help="JSONL archives (.jsonl/.jsonl.gz) to add to the index first",
+    )
+    stats.add_argument(
+        "--rebuild", action="store_true", help="Drop the index and read every report again"
+    )
+    stats.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+
+    telemetry = sub.add_parser("telemetry", help="Convert a per-frame telemetry dump to CSV/JSON")
+    telemetry.add_argument(
+        "file", help="Telemetry dump (relative to reports/, e.g. telemetry_*.bin)"
+    )
+    telemetry.add_argument(
+        "--format", choices=("csv", "json"), default="csv", help="Output format (default: csv)"
+    )
+    telemetry.add_argument(
+        "--out", default=None, help="Output file (relative to reports/, default: stdout)"
+    )
+
     return p
 
 
@@ -66,4 +131,24 @@ def main(argv: list[str] | None = None) -> int:
             height=args.height,
         )
 
+    if args.cmd == "thumbnails":
+        return run_thumbnails(args.levels, out=args.out, size=args.size, jobs=args.jobs)
+
+    if args.cmd == "stats":
+        return run_stats(
+            by=args.by,
+            limit=args.limit,
+            ingest=args.ingest,
+            rebuild=args.rebuild,
+            as_json=args.json,
+        )
+
+    if args.cmd == "telemetry":
+        return run_telemetry(args.file, fmt=args.format, out=args.out)
+
+    if args.cmd == "frames":
+        return run_frames(
+            args.level, frames=args.frames, every=args.every, seed=args.seed, out=args.out
+        )
+
     return 2
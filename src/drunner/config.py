@@ -13,11 +13,16 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from drunner.report import DEFAULT_MAX_BYTES, REPORT_FORMATS
+
 try:
     import tomllib  # Python 3.11+
 except ModuleNotFoundError:  # pragma: no cover
     tomllib = None  # TOML parsing not available on older Python versions
 
+# Accepted values of [logging] rotate (see drunner.log.RotatingLogHandler).
+LOG_ROTATIONS = ("size", "hourly", "daily", "none")
+
 
 @dataclass(frozen=True)
 class AppConfig:
@@ -41,6 +46,28 @@ class AppConfig:
     window_height: int
     fps: int
     title: str
+    enemy_blocking: bool = False
+    fov_radius: int = 0
+    fog_of_war: bool = True
+    dirty_rects: bool = True
+    min_tile_size: int = 16
+    tick_rate: int = 60
+    vsync: bool = False
+    profiler_overlay: bool = False
+    idle_throttle: bool = True
+    minimap: bool = True
+    minimap_size: int = 160
+    report_format: str = "file"
+    report_max_bytes: int = DEFAULT_MAX_BYTES
+    report_compress: bool = True
+    log_ring_size: int = 500
+    log_queue_size: int = 10_000
+    log_rotate: str = "size"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_compress: bool = True
+    log_keep: int = 10
+    log_max_age_days: float = 30.0
+    telemetry_frames: int = 36_000
 
 
 def _project_root() -> Path:
@@ -84,6 +111,7 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     paths = data.get("paths", {})
     logging_cfg = data.get("logging", {})
     game = data.get("game", {})
+    reports = data.get("reports", {})
 
     # Resolve directories relative to project root
     logs_dir = root / paths.get("logs_dir", "logs")
@@ -99,6 +127,14 @@ def load_config(config_path: Path | None = None) -> AppConfig:
 
     log_file = logs_dir / str(logging_cfg.get("file_name", "drunner.log"))
 
+    log_rotate = str(logging_cfg.get("rotate", "size")).lower()
+    if log_rotate not in LOG_ROTATIONS:
+        raise ValueError(f"[logging] rotate must be one of {LOG_ROTATIONS}, got {log_rotate!r}")
+
+    report_format = str(reports.get("format", "file")).lower()
+    if report_format not in REPORT_FORMATS:
+        raise ValueError(f"[reports] format must be one of {REPORT_FORMATS}, got {report_format!r}")
+
     return AppConfig(
         root_dir=root,
         logs_dir=logs_dir,
@@ -112,4 +148,26 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         window_height=int(game.get("window_height", 540)),
         fps=int(game.get("fps", 60)),
         title=str(game.get("title", "Dungeon Runner")),
+        enemy_blocking=bool(game.get("enemy_blocking", False)),
+        fov_radius=int(game.get("fov_radius", 0)),
+        fog_of_war=bool(game.get("fog_of_war", True)),
+        dirty_rects=bool(game.get("dirty_rects", True)),
+        min_tile_size=max(1, int(game.get("min_tile_size", 16))),
+        tick_rate=max(1, int(game.get("tick_rate", 60))),
+        vsync=bool(game.get("vsync", False)),
+        profiler_overlay=bool(game.get("profiler_overlay", False)),
+        telemetry_frames=max(0, int(game.get("telemetry_frames", 36_000))),
+        idle_throttle=bool(game.get("idle_throttle", True)),
+        minimap=bool(game.get("minimap", True)),
+        minimap_size=max(16, int(game.get("minimap_size", 160))),
+        report_format=report_format,
+        report_max_bytes=max(0, int(reports.get("max_bytes", DEFAULT_MAX_BYTES))),
+        report_compress=bool(reports.get("compress", True)),
+        log_ring_size=max(0, int(logging_cfg.get("ring_buffer_size", 500))),
+        log_queue_size=max(0, int(logging_cfg.get("queue_size", 10_000))),
+        log_rotate=log_rotate,
+        log_max_bytes=max(0, int(logging_cfg.get("max_bytes", 10 * 1024 * 1024))),
+        log_compress=bool(logging_cfg.get("compress", True)),
+        log_keep=max(0, int(logging_cfg.get("keep", 10))),
+        log_max_age_days=max(0.0, float(logging_cfg.get("max_age_days", 30.0))),
     )
@@ -4,16 +4,37 @@
 Logging setup for drunner.
 
 Creates a logger with console and file handlers, based on the application's
-configuration.
+configuration, plus an in-memory ring buffer of the most recent records (at
+every level) that crash reports include without touching the log file.
+
+The console and file handlers run on a background QueueListener: logging
+from the game loop only puts the record on a bounded queue. When the queue
+is full, records are dropped (and counted) rather than blocking the caller.
+shutdown_logging() (also run at exit) writes out what is still queued.
+
+The log file rotates by size or by the hour/day (see RotatingLogHandler):
+rotated files are renamed drunner_<timestamp>.log, gzipped on a background
+thread and pruned to a count/age limit.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from logging import Logger
+from logging.handlers import BaseRotatingHandler, QueueHandler, QueueListener
 from pathlib import Path
 
 from drunner.config import AppConfig
+from drunner.report import gzip_file, segment_order, segment_path
 
 
 def _level(level_name: str, default: int) -> int:
@@ -34,13 +55,222 @@ def _level(level_name: str, default: int) -> int:
         return default
 
 
+# Background listener started by configure_logging() (None when not running).
+_listener: QueueListener | None = None
+
+
+def _merge_message(record: logging.LogRecord) -> logging.LogRecord:
+    """
+    Copy of record with its arguments merged into msg, so the text is fixed
+    at log time (later changes to the arguments do not show up).
+    """
+    record = copy.copy(record)
+    record.msg = record.getMessage()
+    record.args = None
+    return record
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the last `capacity` records in memory.
+
+    The message text (and any traceback) is fixed when the record is emitted;
+    the rest of the line (timestamp, level, ...) is formatted when read. That
+    keeps the logging thread's cost low, holds no traceback frames alive, and
+    needs no I/O on the crash path.
+    """
+
+    def __init__(self, capacity: int = 500, level: int = logging.DEBUG) -> None:
+        super().__init__(level)
+        self.capacity = capacity
+        self._records: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            record = _merge_message(record)
+            if record.exc_info:
+                formatter = self.formatter or logging.Formatter()
+                record.exc_text = formatter.formatException(record.exc_info)
+                record.exc_info = None
+            self._records.append(record)
+        except Exception:
+            self.handleError(record)
+
+    def records(self) -> list[str]:
+        """
+        Buffered records, formatted, oldest first.
+        """
+        with self.lock:  # type: ignore[union-attr]
+            snapshot = list(self._records)
+        return [self.format(r) for r in snapshot]
+
+    def clear(self) -> None:
+        """
+        Drop every buffered record.
+        """
+        with self.lock:  # type: ignore[union-attr]
+            self._records.clear()
+
+
+def recent_records(name: str = "drunner") -> list[str] | None:
+    """
+    Records from the ring buffer of logger `name`, or None if it has none.
+    """
+    for handler in logging.getLogger(name).handlers:
+        if isinstance(handler, RingBufferHandler):
+            return handler.records()
+    return None
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks: records that do not fit are counted in
+    `dropped` and discarded.
+
+    Formatting is left to the listener; only the message arguments are
+    merged here, so later changes to them do not show up in the log.
+    """
+
+    def __init__(self, q: queue.Queue[logging.LogRecord | None]) -> None:
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return _merge_message(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    # The stop sentinel must wait for room in a full queue instead of failing.
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+class RotatingLogHandler(BaseRotatingHandler):
+    """
+    Log file that rotates by size ("size") or on the hour/day ("hourly",
+    "daily"); "none" never rotates.
+
+    A rotated file is renamed <stem>_<timestamp><suffix> next to the log.
+    Compressing it (compress) and deleting rotated files beyond the newest
+    `keep` or older than `max_age_days` (0 = no limit) happen on a
+    background thread, so rotating costs the writer one rename. The same
+    cleanup also runs once at startup for files left by earlier runs.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        rotate: str = "size",
+        max_bytes: int = 10 * 1024 * 1024,
+        compress: bool = True,
+        keep: int = 10,
+        max_age_days: float = 30.0,
+    ) -> None:
+        super().__init__(path, "a", encoding="utf-8")
+        self.path = Path(path)
+        self.rotate_when = rotate
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.keep = keep
+        self.max_age_days = max_age_days
+        self.rollover_at = self._next_rollover(
+            self.path.stat().st_mtime if self.path.exists() else time.time()
+        )
+
+        self._jobs: queue.SimpleQueue[Path | None] = queue.SimpleQueue()
+        self._archiver = threading.Thread(target=self._archive, name="log-archiver", daemon=True)
+        self._archiver.start()
+        self._jobs.put(self.path)  # startup cleanup
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rotate_when == "size":
+            if self.max_bytes <= 0:
+                return False
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.max_bytes
+        return self.rollover_at is not None and time.time() >= self.rollover_at
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore[assignment]
+        if self.path.exists() and self.path.stat().st_size:
+            os.replace(self.path, segment_path(self.path))
+            self._jobs.put(self.path)
+        self.rollover_at = self._next_rollover(time.time())
+        self.stream = self._open()
+
+    def close(self) -> None:
+        """
+        Close the file, then wait for pending compression and cleanup.
+        """
+        super().close()
+        if self._archiver.is_alive():
+            self._jobs.put(None)
+            self._archiver.join()
+
+    def rotated_files(self) -> list[Path]:
+        """
+        Rotated files (plain and gzipped), oldest first.
+        """
+        stem, suffix = self.path.stem, self.path.suffix
+        rotated = [
+            p
+            for p in self.path.parent.glob(f"{stem}_*{suffix}*")
+            if p.name.endswith((suffix, f"{suffix}.gz"))
+        ]
+        rotated.sort(key=lambda p: segment_order(p, stem))
+        return rotated
+
+    def _next_rollover(self, since: float) -> float | None:
+        if self.rotate_when not in ("hourly", "daily"):
+            return None
+        start = datetime.fromtimestamp(since).replace(minute=0, second=0, microsecond=0)
+        if self.rotate_when == "hourly":
+            return (start + timedelta(hours=1)).timestamp()
+        return (start.replace(hour=0) + timedelta(days=1)).timestamp()
+
+    def _archive(self) -> None:
+        while self._jobs.get() is not None:
+            try:
+                self._cleanup()
+            except OSError as e:
+                # Never raise on the archiver thread; the log file itself is fine.
+                print(f"drunner: log cleanup failed: {e}", file=sys.stderr)
+
+    def _cleanup(self) -> None:
+        rotated = self.rotated_files()
+        if self.compress:
+            rotated = [gzip_file(p) if p.suffix == self.path.suffix else p for p in rotated]
+
+        expired = set()
+        if self.keep > 0:
+            expired.update(rotated[: -self.keep])
+        if self.max_age_days > 0:
+            cutoff = time.time() - self.max_age_days * 86400
+            expired.update(p for p in rotated if p.stat().st_mtime < cutoff)
+        for p in expired:
+            p.unlink(missing_ok=True)
+
+
 def configure_logging(cfg: AppConfig) -> Logger:
     """
     Configure and return the application's logger.
 
     Adds:
       - Console handler (level from cfg.console_level)
-      - File handler (level from cfg.file_level, writing to cfg.log_file)
+      - File handler (level from cfg.file_level, writing to cfg.log_file,
+        rotated per cfg.log_rotate; see RotatingLogHandler)
+        (both behind a queue of cfg.log_queue_size records, 0 = direct)
+      - Ring buffer of the last cfg.log_ring_size records at any level
+        (skipped if 0; see recent_records())
 
     Args:
         cfg: Application config.
@@ -64,19 +294,69 @@ def configure_logging(cfg: AppConfig) -> Logger:
     ch = logging.StreamHandler()
     ch.setLevel(_level(cfg.console_level, logging.INFO))
     ch.setFormatter(fmt)
-    logger.addHandler(ch)
 
-    # File output
+    # File output (rotation, compression and retention from [logging])
     _ensure_parent(cfg.log_file)  # Make sure the log directory exists.
-    fh = logging.FileHandler(cfg.log_file, encoding="utf-8")
+    fh = RotatingLogHandler(
+        cfg.log_file,
+        rotate=cfg.log_rotate,
+        max_bytes=cfg.log_max_bytes,
+        compress=cfg.log_compress,
+        keep=cfg.log_keep,
+        max_age_days=cfg.log_max_age_days,
+    )
     fh.setLevel(_level(cfg.file_level, logging.DEBUG))
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
+
+    if cfg.log_queue_size > 0:
+        global _listener
+        q: queue.Queue[logging.LogRecord | None] = queue.Queue(cfg.log_queue_size)
+        logger.addHandler(DroppingQueueHandler(q))
+        _listener = _Listener(q, ch, fh, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+    else:
+        logger.addHandler(ch)
+        logger.addHandler(fh)
+
+    # Recent records for crash reports (DEBUG too, whatever the file level).
+    if cfg.log_ring_size > 0:
+        rb = RingBufferHandler(cfg.log_ring_size)
+        rb.setFormatter(fmt)
+        logger.addHandler(rb)
 
     logger.debug("Logger configured. file=%s", cfg.log_file)
     return logger
 
 
+def shutdown_logging(name: str = "drunner") -> int:
+    """
+    Stop the background listener after it has handled every queued record.
+
+    The console and file handlers are then attached to logger `name`
+    directly, so anything logged afterwards is still written. Returns the
+    number of records dropped because the queue was full (also logged as a
+    warning). Safe to call more than once.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return 0
+    listener.stop()
+
+    logger = logging.getLogger(name)
+    dropped = 0
+    for handler in list(logger.handlers):
+        if isinstance(handler, DroppingQueueHandler):
+            dropped += handler.dropped
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+    if dropped:
+        logger.warning("Dropped %d log records (logging queue full)", dropped)
+    return dropped
+
+
 def _ensure_parent(p: Path) -> None:
     """
     Ensure the parent directory for a file path exists.
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import json
+import logging
 import sys
 import time
 from pathlib import Path
 
 from drunner.bugreport import write_crash_report
-from drunner.config import load_config
+from drunner.config import AppConfig, load_config
 from drunner.log import configure_logging
-from drunner.security import SecurityError, require_suffix, safe_resolve
+from drunner.security import (
+    SecurityError,
+    clamp_int,
+    require_suffix,
+    safe_resolve,
+    validate_seed,
+)
+from drunner.stats import INDEX_FILE as STATS_INDEX_FILE
+from drunner.stats import ReportIndex, format_table
 from drunner_core.game import run_game
 from drunner_core.generators import generate_level
-from drunner_core.level_io import LevelIOError, save_level
+from drunner_core.headless import init_headless, render_frames, render_thumbnails
+from drunner_core.level import LevelValidationError
+from drunner_core.level_io import LevelIOError, load_level, save_level
+from drunner_core.sprites import SpriteAtlas, SpriteAtlasError
+from drunner_core.telemetry import TelemetryFormatError, read_telemetry, write_csv, write_json
 
 
 def run(
@@ -68,12 +82,15 @@ def run(
             level_path = gen_file
 
         else:
+            # Without the generator, --seed still makes enemy movement reproducible.
+            run_seed = int(seed) if seed is not None else None
+
             if level:
                 p = safe_resolve(cfg.levels_dir, level)
                 require_suffix(p, ".json")
                 level_path = p
 
-        run_game(cfg, logger, level_path=level_path)
+        run_game(cfg, logger, level_path=level_path, seed=run_seed)
 
         logger.info("Exiting Dungeon Runner")
         return 0
@@ -85,19 +102,245 @@ def run(
         return 2
 
     except Exception as e:
-        crash_path = write_crash_report(
-            project_root=cfg.root_dir,
-            exc=e,
-            cfg=cfg,
-            run_id=run_id,
-            seed=run_seed,
-            log_file_path=Path(cfg.log_file) if getattr(cfg, "log_file", None) else None,
-            version=None,
+        return _crashed(cfg, logger, e, run_id=run_id, seed=run_seed)
+
+
+def _crashed(
+    cfg: AppConfig,
+    logger: logging.Logger,
+    exc: Exception,
+    *,
+    run_id: str | None = None,
+    seed: int | None = None,
+) -> int:
+    """
+    Handle an unexpected exception of a command: write a crash report, log
+    and print where it is, and return exit code 1.
+    """
+    crash_path = write_crash_report(
+        project_root=cfg.root_dir,
+        exc=exc,
+        cfg=cfg,
+        run_id=run_id,
+        seed=seed,
+        log_file_path=Path(cfg.log_file) if getattr(cfg, "log_file", None) else None,
+        version=None,
+    )
+
+    logger.exception("Unhandled exception. Crash report saved: %s", crash_path)
+
+    print("ERROR: Unexpected crash.", file=sys.stderr)
+    print(f"Crash report: {crash_path}", file=sys.stderr)
+    print(f"See log file: {cfg.log_file}", file=sys.stderr)
+    return 1
+
+
+def run_thumbnails(
+    levels: str | None = None,
+    *,
+    out: str | None = None,
+    size: int = 256,
+    jobs: int | None = None,
+) -> int:
+    """
+    Render thumbnails for every level under levels/ (or levels/<levels>) headless.
+
+    Thumbnails go to reports/thumbnails (or reports/<out>), cached by level
+    content. Returns 0 if every level rendered, 2 on bad input or if any
+    level failed (each failure is logged).
+    """
+    cfg = load_config()
+    logger = configure_logging(cfg)
+
+    try:
+        size = clamp_int(size, 16, 4096, field_name="size")
+        if jobs is not None:
+            jobs = clamp_int(jobs, 1, 256, field_name="jobs")
+        levels_dir = safe_resolve(cfg.levels_dir, levels or ".")
+        out_dir = safe_resolve(cfg.reports_dir, out or "thumbnails")
+        if not levels_dir.is_dir():
+            raise FileNotFoundError(f"Levels directory not found: {levels_dir}")
+
+        started = time.perf_counter()
+        results = render_thumbnails(levels_dir, out_dir, size, assets_dir=cfg.assets_dir, jobs=jobs)
+        failed = [r for r in results if r.error]
+        for r in failed:
+            logger.error("Thumbnail failed for %s: %s", r.level, r.error)
+        logger.info(
+            "Thumbnails: %d levels (%d cached, %d failed) in %.2fs -> %s",
+            len(results),
+            sum(r.cached for r in results),
+            len(failed),
+            time.perf_counter() - started,
+            out_dir,
         )
+        return 2 if failed else 0
 
-        logger.exception("Unhandled exception. Crash report saved: %s", crash_path)
+    except (FileNotFoundError, SecurityError) as e:
+        logger.error("%s", e)
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
 
-        print("ERROR: Unexpected crash.", file=sys.stderr)
-        print(f"Crash report: {crash_path}", file=sys.stderr)
-        print(f"See log file: {cfg.log_file}", file=sys.stderr)
-        return 1
+    except Exception as e:
+        return _crashed(cfg, logger, e)
+
+
+def run_frames(
+    level: str | None = None,
+    *,
+    frames: int = 120,
+    every: int = 1,
+    seed: int | None = None,
+    out: str | None = None,
+) -> int:
+    """
+    Render a run of level (enemies only, no input) headless as PNG frames.
+
+    Frames go to reports/frames/<level>_<seed> (or reports/<out>).
+    Returns 0 on success, 2 on bad input or an invalid level.
+    """
+    cfg = load_config()
+    logger = configure_logging(cfg)
+
+    try:
+        frames = clamp_int(frames, 1, 100_000, field_name="frames")
+        every = clamp_int(every, 1, 10_000, field_name="every")
+        run_seed = validate_seed(seed) or 0
+        if level:
+            level_path = require_suffix(safe_resolve(cfg.levels_dir, level), ".json")
+            lvl = load_level(level_path)
+        else:
+            lvl = generate_level(run_seed, 41, 31)
+        out_dir = safe_resolve(cfg.reports_dir, out or f"frames/{lvl.name}_{run_seed}")
+
+        init_headless()
+        atlas: SpriteAtlas | None = None
+        try:
+            atlas = SpriteAtlas.load(cfg.assets_dir) or None
+        except SpriteAtlasError as e:
+            logger.warning("Sprites disabled: %s", e)
+
+        written = render_frames(cfg, lvl, out_dir, frames, seed=run_seed, every=every, atlas=atlas)
+        logger.info(
+            "Rendered %d frames of %s (seed=%d) -> %s", len(written), lvl.name, run_seed, out_dir
+        )
+        return 0
+
+    except (FileNotFoundError, SecurityError, LevelIOError, LevelValidationError) as e:
+        logger.error("%s", e)
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    except Exception as e:
+        return _crashed(cfg, logger, e, seed=seed)
+
+
+def run_stats(
+    *,
+    by: str = "level_source",
+    limit: int = 20,
+    ingest: list[str] | None = None,
+    rebuild: bool = False,
+    as_json: bool = False,
+) -> int:
+    """
+    Update the run report index (reports/index.sqlite3) and print aggregates.
+
+    ingest: JSONL archives (.jsonl / .jsonl.gz, any location) to stream in
+    before the reports directory is scanned.
+    Returns 0 on success, 2 on bad input.
+    """
+    cfg = load_config()
+    logger = configure_logging(cfg)
+
+    try:
+        limit = clamp_int(limit, 1, 10_000, field_name="limit")
+        archives = []
+        for name in ingest or []:
+            p = Path(name)
+            if not p.name.endswith((".jsonl", ".jsonl.gz")):
+                raise SecurityError(f"{p.name}: invalid file type (expected .jsonl or .jsonl.gz)")
+            if not p.is_file():
+                raise FileNotFoundError(f"Archive not found: {p}")
+            archives.append(p)
+
+        started = time.perf_counter()
+        with ReportIndex(cfg.reports_dir / STATS_INDEX_FILE) as index:
+            if rebuild:
+                index.rebuild()
+            for archive in archives:
+                scan = index.ingest(archive)
+                logger.info(
+                    "Ingested %s: %d new runs, %d invalid lines", archive, scan.runs, scan.invalid
+                )
+            scan = index.update(cfg.reports_dir)
+            logger.info(
+                "Report index: %d new runs from %d sources (%d unchanged, %d invalid) in %.2fs",
+                scan.runs,
+                scan.sources,
+                scan.skipped,
+                scan.invalid,
+                time.perf_counter() - started,
+            )
+            totals = index.totals()
+            rows = index.aggregate(by, limit)
+
+        if as_json:
+            print(json.dumps({"totals": totals, "by": by, "groups": rows}, indent=2))
+        else:
+            print(
+                f"{totals['runs']} runs, {totals['wins']} won "
+                f"(win rate {totals['win_rate']:.1%}); top {len(rows)} by {by}:"
+            )
+            print(format_table(rows))
+        return 0
+
+    except (FileNotFoundError, SecurityError) as e:
+        logger.error("%s", e)
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    except Exception as e:
+        return _crashed(cfg, logger, e)
+
+
+def run_telemetry(file: str, *, fmt: str = "csv", out: str | None = None) -> int:
+    """
+    Convert a telemetry dump (reports/telemetry_*.bin) to CSV or JSON.
+
+    file and out are relative to reports/; without out the result goes to
+    stdout. Returns 0 on success, 2 on bad input.
+    """
+    cfg = load_config()
+    logger = configure_logging(cfg)
+
+    try:
+        path = require_suffix(safe_resolve(cfg.reports_dir, file), ".bin")
+        if not path.is_file():
+            raise FileNotFoundError(f"Telemetry file not found: {path}")
+        out_path = require_suffix(safe_resolve(cfg.reports_dir, out), f".{fmt}") if out else None
+        dump = read_telemetry(path)
+
+        write = write_json if fmt == "json" else write_csv
+        if out_path is None:
+            write(dump, sys.stdout)
+            return 0
+
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with out_path.open("w", encoding="utf-8", newline="") as f:
+            write(dump, f)
+        logger.info(
+            "Telemetry: %d records (%d frames) written to %s",
+            len(dump.records),
+            dump.frames,
+            out_path,
+        )
+        return 0
+
+    except (FileNotFoundError, SecurityError, TelemetryFormatError) as e:
+        logger.error("%s", e)
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    except Exception as e:
+        return _crashed(cfg, logger, e)
@@ -1,15 +1,40 @@
 # src/drunner/report.py
 
+"""
+Run reports, written once per run on win/lose.
+
+Two sinks (config.toml [reports] format):
+- "file": one reports/run_<timestamp>_<run_id>.json per run (indented)
+- "jsonl": one line per run appended to reports/runs.jsonl; when the file
+  would exceed max_bytes it is rotated to runs_<timestamp>.jsonl(.gz)
+
+The game hands reports to a ReportWriter, which writes them on a background
+thread so the frame that shows the result never waits on disk I/O.
+"""
+
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import queue
 import secrets
+import shutil
+import threading
 import uuid
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+REPORT_FORMATS = ("file", "jsonl")
+
+# Active JSONL segment inside the reports directory.
+RUNS_FILE = "runs.jsonl"
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
 
 @dataclass(frozen=True)
 class RunReport:
@@ -25,6 +50,8 @@ class RunReport:
     level_source: str
     score: int | None = None
     version: str | None = None
+    # Frame timing summary (FrameProfiler.summary()), if the run was profiled.
+    profile: dict[str, Any] | None = None
 
 
 def _make_run_id() -> str:
@@ -46,9 +73,119 @@ def _default_reports_dir(project_root: Path) -> Path:
     return project_root / "reports"
 
 
-def write_run_report(
+class JsonlReportSink:
+    """
+    Append-only JSONL file of run reports with size-based rotation.
+
+    Each report is one compact JSON line written with a single append, so
+    lines from concurrent writers do not interleave. Rotated segments are
+    renamed to runs_<timestamp>.jsonl next to the active file and gzipped
+    (runs_<timestamp>.jsonl.gz) if compress is set.
+    """
+
+    def __init__(
+        self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES, compress: bool = True
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress = compress
+
+    def append(self, report: RunReport) -> Path:
+        """
+        Append report as one line and return the file it went to.
+        """
+        return self.append_many([report])
+
+    def append_many(self, reports: Sequence[RunReport]) -> Path:
+        """
+        Append reports, one line each, in a single write; return the file.
+        """
+        data = b"".join(
+            json.dumps(asdict(r), ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for r in reports
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.max_bytes > 0:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                self.rotate()
+
+        with self.path.open("ab") as f:
+            f.write(data)
+        return self.path
+
+    def rotate(self) -> Path | None:
+        """
+        Move the active file to a timestamped segment; return the segment path.
+        """
+        if not self.path.exists():
+            return None
+        segment = segment_path(self.path)
+        os.replace(self.path, segment)
+        return gzip_file(segment) if self.compress else segment
+
+    def segments(self) -> list[Path]:
+        """
+        Rotated segments (oldest first) followed by the active file, if present.
+        """
+        stem = self.path.stem
+        rotated = [
+            p
+            for p in self.path.parent.glob(f"{stem}_*.jsonl*")
+            if p.name.endswith((".jsonl", ".jsonl.gz"))
+        ]
+        rotated.sort(key=lambda p: segment_order(p, stem))
+        return rotated + ([self.path] if self.path.exists() else [])
+
+
+def segment_path(path: Path) -> Path:
+    """
+    Name for rotating path: <stem>_<timestamp><suffix> next to it, with a
+    _<n> counter added if that name (or its .gz) is already taken.
+    """
+    stem, suffix = path.stem, path.suffix
+    ts = _make_timestamp()
+    segment = path.with_name(f"{stem}_{ts}{suffix}")
+    n = 1
+    while segment.exists() or segment.with_name(segment.name + ".gz").exists():
+        segment = path.with_name(f"{stem}_{ts}_{n}{suffix}")
+        n += 1
+    return segment
+
+
+def segment_order(path: Path, stem: str) -> tuple[str, int]:
+    """
+    Sort key of a rotated <stem>_<timestamp>[_<n>].<ext> file: timestamp,
+    then the same-millisecond counter.
+    """
+    parts = path.name[len(stem) + 1 :].split(".", 1)[0].split("_")
+    return "_".join(parts[:3]), int(parts[3]) if len(parts) > 3 else 0
+
+
+def gzip_file(path: Path) -> Path:
+    """
+    Replace path with path.gz and return the new path.
+
+    Compresses to a temporary name, then swaps, so a crash never leaves a
+    partial .gz. The .gz keeps the original modification time.
+    """
+    target = path.with_name(path.name + ".gz")
+    tmp = path.with_name(path.name + ".gz.tmp")
+    with path.open("rb") as src, gzip.open(tmp, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    st = path.stat()
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+def make_run_report(
     *,
-    project_root: Path,
     result: str,
     duration_seconds: float,
     level_source: str,
@@ -56,33 +193,215 @@ def write_run_report(
     run_id: str | None = None,
     score: int | None = None,
     version: str | None = None,
-) -> Path:
+    profile: dict[str, Any] | None = None,
+) -> RunReport:
     """
-    Write reports/run_<timestamp>_<run_id>.json and return the created path.
+    Build a RunReport stamped with the current time (run_id/seed generated if None).
     """
-    rid = run_id or _make_run_id()
-    ts = _make_timestamp()
-    s = seed if seed is not None else _make_seed()
-
-    report = RunReport(
-        run_id=rid,
-        timestamp=ts,
-        seed=s,
+    return RunReport(
+        run_id=run_id or _make_run_id(),
+        timestamp=_make_timestamp(),
+        seed=seed if seed is not None else _make_seed(),
         duration_seconds=float(duration_seconds),
         result=str(result),
         level_source=str(level_source),
         score=score,
         version=version,
+        profile=profile,
     )
 
-    reports_dir = _default_reports_dir(project_root)
+
+def save_run_reports(
+    reports: Sequence[RunReport],
+    *,
+    project_root: Path,
+    report_format: str = "file",
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    compress: bool = True,
+    reports_dir: Path | None = None,
+) -> list[Path]:
+    """
+    Write reports in one batch; return the path of each, in order.
+
+    "jsonl" appends them all with one write; "file" creates one
+    run_<timestamp>_<run_id>.json each. They go to reports_dir (the
+    configured [paths] reports_dir), or project_root/reports if None.
+    """
+    _check_format(report_format)
+    if reports_dir is None:
+        reports_dir = _default_reports_dir(project_root)
+    if report_format == "jsonl":
+        path = JsonlReportSink(reports_dir / RUNS_FILE, max_bytes, compress).append_many(reports)
+        return [path] * len(reports)
+
     reports_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for report in reports:
+        path = reports_dir / f"run_{report.timestamp}_{report.run_id}.json"
+        payload: dict[str, Any] = asdict(report)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        paths.append(path)
+    return paths
+
+
+def write_run_report(
+    *,
+    project_root: Path,
+    result: str,
+    duration_seconds: float,
+    level_source: str,
+    seed: int | None = None,
+    run_id: str | None = None,
+    score: int | None = None,
+    version: str | None = None,
+    profile: dict[str, Any] | None = None,
+    report_format: str = "file",
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    compress: bool = True,
+    reports_dir: Path | None = None,
+) -> Path:
+    """
+    Write the run report and return the path it was written to.
+
+    report_format "file" creates reports/run_<timestamp>_<run_id>.json;
+    "jsonl" appends a line to reports/runs.jsonl (see JsonlReportSink, which
+    max_bytes and compress configure). reports_dir overrides
+    project_root/reports.
+    """
+    _check_format(report_format)
+    report = make_run_report(
+        result=result,
+        duration_seconds=duration_seconds,
+        level_source=level_source,
+        seed=seed,
+        run_id=run_id,
+        score=score,
+        version=version,
+        profile=profile,
+    )
+    return save_run_reports(
+        [report],
+        project_root=project_root,
+        report_format=report_format,
+        max_bytes=max_bytes,
+        compress=compress,
+        reports_dir=reports_dir,
+    )[0]
+
+
+def _check_format(report_format: str) -> None:
+    if report_format not in REPORT_FORMATS:
+        raise ValueError(
+            f"Unknown report format {report_format!r} (expected one of {REPORT_FORMATS})"
+        )
+
+
+class ReportWriteError(RuntimeError):
+    """
+    Raised by ReportWriter.close() when reports could not be written.
+    """
+
+    def __init__(self, message: str, reports: Sequence[RunReport]) -> None:
+        super().__init__(message)
+        self.reports = list(reports)
+
+
+class ReportWriter:
+    """
+    Background thread that writes run reports.
+
+    submit() only queues the report. The thread takes everything queued so
+    far as one batch (one JSONL append, or one file per report). close()
+    waits until every submitted report is written and retries any batch that
+    failed on the thread once; if that fails too it raises ReportWriteError
+    (so the caller's crash handling records it).
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        report_format: str = "file",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compress: bool = True,
+        reports_dir: Path | None = None,
+    ) -> None:
+        _check_format(report_format)
+        self.project_root = project_root
+        self.reports_dir = reports_dir
+        self.report_format = report_format
+        self.max_bytes = max_bytes
+        self.compress = compress
+
+        # Paths of written reports and batches that failed on the thread (only
+        # touched by the thread until close() has joined it).
+        self.written: list[Path] = []
+        self._failed: list[tuple[list[RunReport], BaseException]] = []
+
+        self._queue: queue.SimpleQueue[RunReport | None] = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="report-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, report: RunReport) -> None:
+        """
+        Queue report for writing (never blocks on I/O).
+        """
+        if self._closed:
+            raise RuntimeError("ReportWriter is closed")
+        self._queue.put(report)
+
+    def close(self) -> list[Path]:
+        """
+        Write everything submitted, stop the thread and return the written paths.
+
+        Safe to call more than once.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
 
-    filename = f"run_{ts}_{rid}.json"
-    path = reports_dir / filename
+        failed, self._failed = self._failed, []
+        errors: list[BaseException] = []
+        lost: list[RunReport] = []
+        for batch, _exc in failed:
+            try:
+                self.written.extend(self._save(batch))
+            except Exception as e:
+                errors.append(e)
+                lost.extend(batch)
+        if lost:
+            ids = ", ".join(r.run_id for r in lost)
+            raise ReportWriteError(
+                f"Could not write {len(lost)} run report(s) ({ids}): {errors[0]}", lost
+            ) from errors[0]
+        return list(self.written)
 
-    payload: dict[str, Any] = asdict(report)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            reports = [r for r in batch if r is not None]
+            stop = len(reports) != len(batch)
+            if not reports:
+                continue
+            try:
+                self.written.extend(self._save(reports))
+            except Exception as e:
+                self._failed.append((reports, e))
 
-    return path
+    def _save(self, reports: list[RunReport]) -> list[Path]:
+        return save_run_reports(
+            reports,
+            project_root=self.project_root,
+            report_format=self.report_format,
+            max_bytes=self.max_bytes,
+            compress=self.compress,
+            reports_dir=self.reports_dir,
+        )
@@ -0,0 +1,375 @@
+# src/drunner/stats.py
+
+"""
+SQLite index of run reports and the aggregates behind `drunner stats`.
+
+The index (reports/index.sqlite3) holds one row per RunReport and one row per
+report source it has read. A scan only reads what changed since the last one:
+
+- run_<timestamp>_<run_id>.json files and rotated runs_*.jsonl(.gz) segments
+  are skipped when their name, mtime and size are unchanged
+- the active runs.jsonl is append-only, so only the bytes past the stored
+  offset are read. A file that shrank or whose first line changed was
+  rotated and is read again from the start (the first line is compared by
+  hash, so a new runs.jsonl that already grew past the old offset is not
+  mistaken for the old one).
+
+Rows are unique by (run_id, timestamp), so reading a report twice (e.g. the
+active file and then its rotated segment) never counts a run twice.
+
+Aggregates group by level_source, seed or version. Counts come from one
+GROUP BY over a covering index; duration percentiles are looked up per group
+in the same index (ORDER BY duration LIMIT 1 OFFSET k), so no query sorts the
+table.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from drunner.report import RUNS_FILE
+
+INDEX_FILE = "index.sqlite3"
+
+# Columns `drunner stats --by` accepts.
+GROUP_COLUMNS = ("level_source", "seed", "version")
+
+# Duration percentiles reported per group.
+PERCENTILES = (50, 90, 99)
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    seed INTEGER,
+    duration_seconds REAL,
+    result TEXT,
+    level_source TEXT,
+    score INTEGER,
+    version TEXT,
+    UNIQUE (run_id, timestamp)
+);
+CREATE INDEX IF NOT EXISTS runs_by_level ON runs (level_source, duration_seconds, result);
+CREATE INDEX IF NOT EXISTS runs_by_seed ON runs (seed, duration_seconds, result);
+CREATE INDEX IF NOT EXISTS runs_by_version ON runs (version, duration_seconds, result);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    head TEXT NOT NULL DEFAULT ''
+);
+"""
+
+# Version 1 sources had no head column: forget them (runs are unique, so
+# reading every source again counts nothing twice).
+_MIGRATE_V1 = """
+ALTER TABLE sources ADD COLUMN head TEXT NOT NULL DEFAULT '';
+DELETE FROM sources;
+"""
+
+_COLUMNS = (
+    "run_id",
+    "timestamp",
+    "seed",
+    "duration_seconds",
+    "result",
+    "level_source",
+    "score",
+    "version",
+)
+
+_INSERT = f"INSERT OR IGNORE INTO runs VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+# Rows per executemany() call while ingesting.
+_BATCH = 10_000
+
+
+@dataclass
+class ScanResult:
+    """
+    What one update() or ingest() read.
+    """
+
+    sources: int = 0
+    skipped: int = 0
+    runs: int = 0
+    invalid: int = 0
+
+
+class ReportIndex:
+    """
+    SQLite index of run reports (see module docstring).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, 1, _SCHEMA_VERSION):
+            raise sqlite3.DatabaseError(f"{path}: unsupported index version {version}")
+        with self._db:
+            if version == 1:
+                self._db.executescript(_MIGRATE_V1)
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> ReportIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    # --- ingest ---
+
+    def update(self, reports_dir: Path) -> ScanResult:
+        """
+        Index the reports in reports_dir that are new or changed since the last scan.
+        """
+        result = ScanResult()
+        if not reports_dir.is_dir():
+            return result
+
+        known = {
+            path: (mtime_ns, size, offset, head)
+            for path, mtime_ns, size, offset, head in self._db.execute(
+                "SELECT path, mtime_ns, size, offset, head FROM sources"
+            )
+        }
+        with self._db:
+            for entry in os.scandir(reports_dir):
+                name = entry.name
+                is_report = name.startswith("run_") and name.endswith(".json")
+                is_jsonl = name.startswith(Path(RUNS_FILE).stem) and name.endswith(
+                    (".jsonl", ".jsonl.gz")
+                )
+                if not (is_report or is_jsonl) or not entry.is_file():
+                    continue
+
+                st = entry.stat()
+                stored = known.get(entry.path)
+                if stored is not None and stored[:2] == (st.st_mtime_ns, st.st_size):
+                    result.skipped += 1
+                    continue
+
+                path = Path(entry.path)
+                offset = 0
+                head = _first_line_hash(path) if name == RUNS_FILE else ""
+                if (
+                    name == RUNS_FILE
+                    and stored is not None
+                    and st.st_size >= stored[2]
+                    and head == stored[3]
+                ):
+                    offset = stored[2]  # append-only: read only the new lines
+                if is_report:
+                    end = st.st_size
+                    self._insert(_read_report_file(path), result)
+                else:
+                    end = self._ingest_jsonl(path, offset, result)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                    (entry.path, st.st_mtime_ns, st.st_size, end, head),
+                )
+                result.sources += 1
+        return result
+
+    def ingest(self, path: Path) -> ScanResult:
+        """
+        Stream a JSONL (or .jsonl.gz) archive into the index.
+
+        Archives are tracked like report files: ingesting an unchanged file
+        again reads nothing.
+        """
+        result = ScanResult()
+        st = path.stat()
+        key = str(path.resolve())
+        stored = self._db.execute(
+            "SELECT mtime_ns, size FROM sources WHERE path = ?", (key,)
+        ).fetchone()
+        if stored == (st.st_mtime_ns, st.st_size):
+            result.skipped += 1
+            return result
+
+        with self._db:
+            end = self._ingest_jsonl(path, 0, result)
+            self._db.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                (key, st.st_mtime_ns, st.st_size, end, ""),
+            )
+        result.sources += 1
+        return result
+
+    def rebuild(self) -> None:
+        """
+        Forget every run and source (the next update() reads everything again).
+        """
+        with self._db:
+            self._db.execute("DELETE FROM runs")
+            self._db.execute("DELETE FROM sources")
+
+    def _ingest_jsonl(self, path: Path, offset: int, result: ScanResult) -> int:
+        # Returns the offset after the last complete line (a line still being
+        # appended is read by the next scan).
+        consumed = [0]
+        if path.name.endswith(".gz"):
+            with gzip.open(path, "rb") as f:
+                self._insert(_read_lines(f, consumed), result)
+            return path.stat().st_size
+
+        with path.open("rb") as f:
+            f.seek(offset)
+            self._insert(_read_lines(f, consumed), result)
+        # Only the lines actually read: anything appended meanwhile is past it.
+        return offset + consumed[0]
+
+    def _insert(self, rows: Iterable[tuple[Any, ...] | None], result: ScanResult) -> None:
+        batch: list[tuple[Any, ...]] = []
+        for row in rows:
+            if row is None:
+                result.invalid += 1
+                continue
+            batch.append(row)
+            if len(batch) >= _BATCH:
+                result.runs += self._insert_batch(batch)
+                batch = []
+        if batch:
+            result.runs += self._insert_batch(batch)
+
+    def _insert_batch(self, batch: list[tuple[Any, ...]]) -> int:
+        before = self._db.total_changes
+        self._db.executemany(_INSERT, batch)
+        return self._db.total_changes - before
+
+    # --- queries ---
+
+    def totals(self) -> dict[str, Any]:
+        """
+        Runs, wins and win rate over the whole index.
+        """
+        runs, wins = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(result = 'WON'), 0) FROM runs"
+        ).fetchone()
+        return {"runs": runs, "wins": wins, "win_rate": round(wins / runs, 4) if runs else 0.0}
+
+    def aggregate(self, by: str = "level_source", limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Per-group stats for the `limit` groups with the most runs.
+
+        Each row: {by: value, "runs", "wins", "win_rate", "mean_s", "p50_s",
+        "p90_s", "p99_s"} (nearest-rank duration percentiles).
+        """
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {by!r} (expected one of {GROUP_COLUMNS})")
+
+        groups = self._db.execute(
+            f"SELECT {by}, COUNT(*), SUM(result = 'WON'), AVG(duration_seconds) FROM runs "
+            f"GROUP BY {by} ORDER BY COUNT(*) DESC, {by} LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+        rows = []
+        for value, runs, wins, mean in groups:
+            row: dict[str, Any] = {
+                by: value,
+                "runs": runs,
+                "wins": wins,
+                "win_rate": round(wins / runs, 4),
+                "mean_s": round(mean, 3),
+            }
+            for q in PERCENTILES:
+                rank = max(1, -(-runs * q // 100))
+                (d,) = self._db.execute(
+                    f"SELECT duration_seconds FROM runs WHERE {by} IS ? "
+                    "ORDER BY duration_seconds LIMIT 1 OFFSET ?",
+                    (value, rank - 1),
+                ).fetchone()
+                row[f"p{q}_s"] = round(d, 3)
+            rows.append(row)
+        return rows
+
+
+def _row(data: Any) -> tuple[Any, ...] | None:
+    # RunReport dict -> runs row (None if it is not a run report).
+    if not isinstance(data, dict) or not data.get("run_id") or not data.get("timestamp"):
+        return None
+    try:
+        duration = float(data.get("duration_seconds", 0.0))
+    except (TypeError, ValueError):
+        return None
+    return (
+        str(data["run_id"]),
+        str(data["timestamp"]),
+        data.get("seed"),
+        duration,
+        data.get("result"),
+        data.get("level_source"),
+        data.get("score"),
+        data.get("version"),
+    )
+
+
+def _read_report_file(path: Path) -> Iterator[tuple[Any, ...] | None]:
+    try:
+        yield _row(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        yield None
+
+
+def _read_lines(f: IO[bytes], consumed: list[int]) -> Iterator[tuple[Any, ...] | None]:
+    # Adds the length of every complete line to consumed[0].
+    for line in f:
+        if not line.endswith(b"\n"):
+            return  # partial last line, still being written
+        consumed[0] += len(line)
+        if not line.strip():
+            continue
+        try:
+            yield _row(json.loads(line))
+        except ValueError:
+            yield None
+
+
+def _first_line_hash(path: Path) -> str:
+    # Identifies one runs.jsonl across rotations ("" until a line is complete).
+    with path.open("rb") as f:
+        line = f.readline(1 << 16)
+    return hashlib.sha1(line).hexdigest() if line.endswith(b"\n") else ""
+
+
+def format_table(rows: list[dict[str, Any]]) -> str:
+    """
+    Rows of equal keys as a plain text table (header + aligned columns).
+    """
+    if not rows:
+        return "(no runs)"
+    keys = list(rows[0])
+    cells = [keys] + [["-" if r[k] is None else str(r[k]) for k in keys] for r in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(keys))]
+    lines = []
+    for row in cells:
+        # Text left-aligned in the first column, numbers right-aligned after it.
+        first = row[0].ljust(widths[0])
+        rest = [c.rjust(w) for c, w in zip(row[1:], widths[1:], strict=True)]
+        lines.append("  ".join([first, *rest]).rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,108 @@
+# src/drunner_core/camera.py
+
+"""
+Scrolling camera for levels that do not fit the window at a readable tile size.
+
+The camera picks the largest tile size that fits the whole level, but never goes
+below min_tile_size; if the level is then larger than the window it scrolls to
+keep the player in view. Renderers cull to the tile range returned by
+tile_range(), so drawing cost depends on the window size, not the level size.
+"""
+
+from __future__ import annotations
+
+from drunner_core.level import Level
+from drunner_core.render import RenderParams, compute_render_params, tile_range
+
+
+class Camera:
+    """
+    Viewport over a level, in pixels (view size) and tiles (scroll position).
+    """
+
+    def __init__(
+        self, level: Level, view_width: int, view_height: int, min_tile_size: int = 16
+    ) -> None:
+        fit = compute_render_params(level, view_width, view_height)
+        self.level_width = level.width
+        self.level_height = level.height
+        self.view_width = view_width
+        self.view_height = view_height
+        self.tile_size = max(fit.tile_size, min_tile_size)
+
+        # Top-left tile shown (only changes when the level overflows an axis).
+        self.x = 0
+        self.y = 0
+        self._params = self._compute_params()
+
+    @property
+    def params(self) -> RenderParams:
+        """
+        Render params for the current scroll position.
+        """
+        return self._params
+
+    @property
+    def scrolls(self) -> bool:
+        """
+        True if the level is larger than the view on at least one axis.
+        """
+        ts = self.tile_size
+        return self.level_width * ts > self.view_width or self.level_height * ts > self.view_height
+
+    def follow(self, x: int, y: int) -> bool:
+        """
+        Scroll so tile (x, y) stays inside the middle half of the view.
+
+        Returns True if the camera moved (the frame needs a full redraw).
+        """
+        nx = self._follow_axis(self.x, x, self.view_width, self.level_width)
+        ny = self._follow_axis(self.y, y, self.view_height, self.level_height)
+        if (nx, ny) == (self.x, self.y):
+            return False
+        self.x, self.y = nx, ny
+        self._params = self._compute_params()
+        return True
+
+    def center_on(self, x: int, y: int) -> None:
+        """
+        Jump so tile (x, y) is centered (clamped to the level edges).
+        """
+        ts = self.tile_size
+        self.x = self._clamp(x - self.view_width // ts // 2, self.view_width, self.level_width)
+        self.y = self._clamp(y - self.view_height // ts // 2, self.view_height, self.level_height)
+        self._params = self._compute_params()
+
+    def tile_range(self) -> tuple[int, int, int, int]:
+        """
+        Inclusive (x0, y0, x1, y1) of the tiles inside the view.
+        """
+        p = self._params
+        return tile_range(self.level_width, self.level_height, p, self.view_width, self.view_height)
+
+    def _follow_axis(self, pos: int, target: int, view_px: int, level_tiles: int) -> int:
+        span = view_px // self.tile_size
+        if level_tiles <= span:
+            return 0
+        margin = span // 4
+        if target < pos + margin:
+            pos = target - margin
+        elif target > pos + span - 1 - margin:
+            pos = target - (span - 1 - margin)
+        return self._clamp(pos, view_px, level_tiles)
+
+    def _clamp(self, pos: int, view_px: int, level_tiles: int) -> int:
+        span = view_px // self.tile_size
+        return max(0, min(pos, level_tiles - span)) if level_tiles > span else 0
+
+    def _compute_params(self) -> RenderParams:
+        ts = self.tile_size
+        ox = -self.x * ts
+        oy = -self.y * ts
+
+        # Center axes where the whole level fits.
+        if self.level_width * ts <= self.view_width:
+            ox = (self.view_width - self.level_width * ts) // 2
+        if self.level_height * ts <= self.view_height:
+            oy = (self.view_height - self.level_height * ts) // 2
+        return RenderParams(tile_size=ts, offset_x=ox, offset_y=oy)
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-import random
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
-from drunner_core.level import Level
+from drunner_core.flowfield import FlowField
+from drunner_core.fov import TileBitset
+from drunner_core.level import EnemyKind, Level
+from drunner_core.occupancy import OccupancyGrid
+from drunner_core.rng import GOLDEN_GAMMA, MIX_MUL_1, MIX_MUL_2, CounterRng, RandomSource
+from drunner_core.scheduler import TimerWheel
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # Optional speed-up; EnemyPool falls back to plain lists.
 
 DIRECTIONS_4: tuple[tuple[int, int], ...] = (
     (1, 0),
@@ -14,6 +26,13 @@ DIRECTIONS_4: tuple[tuple[int, int], ...] = (
     (0, -1),
 )
 
+# Upper bound on moves replayed for one enemy in a single update (large dt after a
+# stall); the rest of the backlog is dropped, keeping the enemy's step phase.
+MAX_CATCH_UP_STEPS = 8
+
+# EnemyPool schedules moves on an integer clock in microseconds.
+_US_PER_SECOND = 1_000_000
+
 
 @dataclass(slots=True)
 class Enemy:
@@ -22,6 +41,10 @@ class Enemy:
 
     Moves one tile every move_interval seconds. On each move tick it may keep
     direction, or pick a new direction; if blocked it always picks a new one.
+
+    CHASE enemies instead take the next step from a shared FlowField toward the
+    player, and fall back to the random walk when the field has no step for them.
+    PATROL enemies step along their precomputed route loop (see drunner_core.patrol).
     """
 
     x: int
@@ -35,12 +58,21 @@ class Enemy:
     move_interval: float = 0.35
     _accum: float = 0.0
 
-    # Randomness (injectable for tests / determinism)
-    rng: random.Random = field(default_factory=random.Random)
+    # Randomness (injectable for tests / determinism). Any object with
+    # random()/shuffle() works, e.g. random.Random or CounterRng.split(run_seed, i).
+    rng: RandomSource = field(default_factory=CounterRng.from_entropy)
 
     # Chance to change direction on each step even if not blocked
     direction_change_chance: float = 0.35
 
+    # Behaviour and the shared flow field CHASE enemies read from
+    kind: EnemyKind = EnemyKind.RANDOM
+    flow: FlowField | None = None
+
+    # Expanded patrol loop (route[0] is the spawn) and the index of the current tile
+    route: tuple[tuple[int, int], ...] = ()
+    _route_pos: int = 0
+
     def update(self, dt: float, level: Level) -> None:
         """
         Per-frame update. Advances movement on a timer.
@@ -52,15 +84,35 @@ class Enemy:
         self._accum += float(dt)
 
         # Allow multiple steps if dt is large (e.g., window lag/focus loss),
-        # while still keeping deterministic step size.
+        # while still keeping deterministic step size. After a long stall the
+        # backlog beyond MAX_CATCH_UP_STEPS is dropped instead of replayed.
+        steps = 0
         while self._accum >= self.move_interval:
+            if steps == MAX_CATCH_UP_STEPS:
+                self._accum %= self.move_interval
+                break
             self._accum -= self.move_interval
             self._step(level)
+            steps += 1
 
     def _step(self, level: Level) -> None:
         """
         Execute a single tile step according to the current direction and RNG.
         """
+        if self.kind == EnemyKind.PATROL and self.route:
+            pos = (self._route_pos + 1) % len(self.route)
+            nx, ny = self.route[pos]
+            self.dx, self.dy = nx - self.x, ny - self.y
+            self.x, self.y, self._route_pos = nx, ny, pos
+            return
+
+        if self.kind == EnemyKind.CHASE and self.flow is not None:
+            dx, dy = self.flow.next_step(self.x, self.y)
+            if dx or dy:
+                self.dx, self.dy = dx, dy
+                self.x, self.y = self.x + dx, self.y + dy
+                return
+
         nx, ny = self.x + self.dx, self.y + self.dy
 
         if (not level.is_walkable(nx, ny)) or (self.rng.random() < self.direction_change_chance):
@@ -83,3 +135,639 @@ class Enemy:
                 return dx, dy
 
         return (0, 0)
+
+
+class EnemyPool:
+    """
+    Structure-of-arrays container for many enemies.
+
+    Positions, directions, timers, per-enemy settings and CounterRng state live in
+    parallel arrays (NumPy when installed, plain lists otherwise) and update()
+    advances every enemy in one batch, including the random draws and the flow
+    field lookups of CHASE enemies and the route-table lookups of PATROL enemies.
+    Each enemy follows exactly the same rules and
+    RNG call sequence as an Enemy using the same CounterRng, so both walk
+    identically.
+
+    Moves are event-driven: each timed enemy sits in a TimerWheel keyed by its next
+    move time (integer microseconds), so update() only touches the enemies that
+    are due and its cost follows the number of moves, not the number of enemies.
+
+    Once attached to a level the pool keeps an OccupancyGrid up to date on every
+    move: enemy-on-tile tests are O(1), swaps with the player are detectable and
+    block_enemies can stop enemies from stacking on one tile.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        # Run seed used to split a CounterRng per enemy when add() gets no rng.
+        self.seed = seed
+
+        # Shared flow field for CHASE enemies (None: they random-walk).
+        self.flow: FlowField | None = None
+        self._flow_view: tuple[FlowField, Any] | None = None
+
+        # Refuse moves onto a tile that another enemy already occupies.
+        self.block_enemies = False
+        self.occupancy: OccupancyGrid | None = None
+
+        self._x: Any = []
+        self._y: Any = []
+        self._dx: Any = []
+        self._dy: Any = []
+        self._interval_us: Any = []
+        self._due: Any = []
+        self._chance: Any = []
+        self._kind: Any = []
+
+        # Next-move schedule for timed enemies; interval <= 0 enemies step every update.
+        self._wheel = TimerWheel()
+        self._instant: list[int] = []
+
+        # Patrol loops of all enemies concatenated; per enemy offset, length and
+        # current position (length 0: no route).
+        self._route_x = array("i")
+        self._route_y = array("i")
+        self._route_off: Any = []
+        self._route_len: Any = []
+        self._route_pos: Any = []
+
+        # RNG state: CounterRng objects in list mode, key/counter arrays in NumPy mode.
+        self._rngs: list[CounterRng] = []
+        self._rng_key: Any = None
+        self._rng_ctr: Any = None
+
+        # Padded walkability grid for (level, level.revision); rebuilt when
+        # attached to a different level or after Level.set_tile().
+        self._grid_key: tuple[Level, int] | None = None
+        self._grid: Any = None
+        self._stride = 0
+
+    @classmethod
+    def from_enemies(cls, enemies: Iterable[Enemy]) -> EnemyPool:
+        """
+        Build a pool that continues from the current state of Enemy objects.
+
+        The enemies must use CounterRng; their generators are copied, not shared.
+        """
+        pool = cls()
+        for e in enemies:
+            if not isinstance(e.rng, CounterRng):
+                raise TypeError("EnemyPool.from_enemies requires enemies using CounterRng")
+            pool.add(
+                e.x,
+                e.y,
+                dx=e.dx,
+                dy=e.dy,
+                move_interval=e.move_interval,
+                direction_change_chance=e.direction_change_chance,
+                rng=e.rng,
+                accum=e._accum,
+                kind=e.kind,
+                route=e.route,
+                route_pos=e._route_pos,
+            )
+        return pool
+
+    def add(
+        self,
+        x: int,
+        y: int,
+        *,
+        dx: int = 1,
+        dy: int = 0,
+        move_interval: float = 0.35,
+        direction_change_chance: float = 0.35,
+        rng: CounterRng | None = None,
+        accum: float = 0.0,
+        kind: EnemyKind = EnemyKind.RANDOM,
+        route: Sequence[tuple[int, int]] | None = None,
+        route_pos: int = 0,
+    ) -> int:
+        """
+        Append one enemy and return its index in the pool.
+
+        Without rng, the generator is split from the pool seed and the new index
+        (or drawn from OS entropy when the pool has no seed). route is an expanded
+        patrol loop starting at the spawn (PatrolTable.route()).
+        """
+        self._unpack()
+        index = len(self._x)
+        if rng is None:
+            rng = (
+                CounterRng.split(self.seed, index)
+                if self.seed is not None
+                else CounterRng.from_entropy()
+            )
+
+        self._x.append(int(x))
+        self._y.append(int(y))
+        self._dx.append(int(dx))
+        self._dy.append(int(dy))
+        if move_interval > 0:
+            interval_us = max(1, round(move_interval * _US_PER_SECOND))
+            due = self._wheel.now + interval_us - round(accum * _US_PER_SECOND)
+            self._wheel.schedule(index, due)
+        else:
+            interval_us = 0
+            due = 0
+            self._instant.append(index)
+        self._interval_us.append(interval_us)
+        self._due.append(due)
+        self._chance.append(float(direction_change_chance))
+        self._kind.append(int(kind))
+        self._rngs.append(CounterRng(key=rng.key, counter=rng.counter))
+
+        self._route_off.append(len(self._route_x))
+        self._route_len.append(len(route) if route else 0)
+        self._route_pos.append(int(route_pos))
+        for rx, ry in route or ():
+            self._route_x.append(int(rx))
+            self._route_y.append(int(ry))
+
+        if self.occupancy is not None:
+            self.occupancy.add(int(x), int(y))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        Return the (x, y) tile of the enemy at index.
+        """
+        return int(self._x[index]), int(self._y[index])
+
+    def iter_positions(self) -> Iterator[tuple[int, int]]:
+        """
+        Yield (x, y) for every enemy in index order.
+        """
+        if isinstance(self._x, list):
+            return zip(self._x, self._y, strict=True)
+        return zip(self._x.tolist(), self._y.tolist(), strict=True)
+
+    def positions_in(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[tuple[int, int]]:
+        """
+        Yield tiles inside the inclusive rectangle holding at least one enemy.
+
+        Uses the occupancy index once attached (cost bounded by the rectangle);
+        before that, falls back to filtering every position.
+        """
+        if self.occupancy is not None:
+            return self.occupancy.occupied_in(x0, y0, x1, y1)
+        return iter(
+            {(x, y): None for x, y in self.iter_positions() if x0 <= x <= x1 and y0 <= y <= y1}
+        )
+
+    def moves_in(self, x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int, int, int]]:
+        """
+        (from_x, from_y, to_x, to_y) of moves made this tick (since begin_tick())
+        that start or end inside the inclusive rectangle; renderers use them to
+        interpolate between ticks. Empty until attach().
+        """
+        if self.occupancy is None:
+            return []
+        return self.occupancy.moves_in(x0, y0, x1, y1)
+
+    def attach(self, level: Level) -> None:
+        """
+        Bind the pool to a level: walkability grid plus a fresh occupancy index.
+
+        update() calls this automatically when it sees a different level or the
+        level's revision changed.
+        """
+        key = self._grid_key
+        if key is not None and key[0] is level and key[1] == level.revision:
+            return
+
+        grid, stride = level.walkable_grid()
+        self._grid = (
+            np.frombuffer(bytes(grid), dtype=np.uint8).astype(bool) if np is not None else grid
+        )
+        self._stride = stride
+        self._grid_key = (level, level.revision)
+        self.occupancy = OccupancyGrid.from_positions(
+            level.width, level.height, self.iter_positions()
+        )
+
+    def begin_tick(self) -> None:
+        """
+        Start a new simulation tick (resets swap detection).
+        """
+        if self.occupancy is not None:
+            self.occupancy.begin_tick()
+
+    def moved_this_tick(self) -> bool:
+        """
+        Return True if any enemy moved since begin_tick() (needs attach()).
+        """
+        return self.occupancy is not None and self.occupancy.has_moves()
+
+    def next_move_in(self) -> float | None:
+        """
+        Seconds of simulated time until the next scheduled enemy move: 0.0 if
+        one is due (or moves every update), None without enemies.
+        """
+        if not len(self):
+            return None
+        if self._instant:
+            return 0.0
+        due = self._wheel.next_due()
+        if due is None:
+            return None
+        return max(0, due - self._wheel.now) / _US_PER_SECOND
+
+    def collides(self, player_from: tuple[int, int], player_to: tuple[int, int]) -> bool:
+        """
+        Return True if the player, who moved from player_from to player_to during
+        this tick, ran into an enemy: one stands on player_to, or one moved from
+        player_to to player_from (the two swapped tiles).
+        """
+        if self.any_at(*player_to):
+            return True
+        if self.occupancy is None or player_from == player_to:
+            return False
+        return self.occupancy.crossed(player_to, player_from)
+
+    def aggro(self, visible: TileBitset) -> int:
+        """
+        Turn RANDOM enemies standing on a visible tile into CHASE enemies.
+
+        visible is the player's field of view; an enemy on one of its tiles has
+        line of sight to the player. Returns how many enemies switched.
+        """
+        if not len(self):
+            return 0
+        if np is not None:
+            self._pack()
+            bits = np.unpackbits(np.frombuffer(visible.data, dtype=np.uint8), bitorder="little")
+            seen = bits[self._y * visible.width + self._x].astype(bool)
+            seen &= self._kind == EnemyKind.RANDOM
+            self._kind[seen] = EnemyKind.CHASE
+            return int(seen.sum())
+
+        switched = 0
+        for i, kind in enumerate(self._kind):
+            if kind == EnemyKind.RANDOM and visible.is_set(self._x[i], self._y[i]):
+                self._kind[i] = int(EnemyKind.CHASE)
+                switched += 1
+        return switched
+
+    def any_at(self, x: int, y: int) -> bool:
+        """
+        Return True if any enemy currently stands on (x, y).
+        """
+        if not len(self):
+            return False
+        if self.occupancy is not None:
+            return self.occupancy.is_occupied(x, y)
+        if np is not None:
+            self._pack()
+            return bool(np.any((self._x == x) & (self._y == y)))
+        return any(ex == x and ey == y for ex, ey in zip(self._x, self._y, strict=True))
+
+    def update(self, dt: float, level: Level) -> None:
+        """
+        Per-frame update for all enemies (same timer rules as Enemy.update).
+        """
+        if not len(self):
+            return
+
+        self.attach(level)
+        if np is not None:
+            self._pack()
+
+        wheel = self._wheel
+        wheel.advance(wheel.now + max(0, round(float(dt) * _US_PER_SECOND)))
+
+        if self._instant:
+            self._step_batch(self._instant)
+
+        # Wake only the enemies that are due. A large dt replays missed moves in
+        # rounds (one move per due enemy each), like Enemy.update's loop.
+        for _ in range(MAX_CATCH_UP_STEPS):
+            keys = wheel.pop_due()
+            if not keys:
+                return
+            keys.sort()
+            self._step_batch(keys)
+            self._reschedule(keys)
+
+        self._drop_backlog(wheel.pop_due())
+
+    # --- Scheduling -------------------------------------------------------
+
+    def _step_batch(self, keys: list[int]) -> None:
+        if np is not None:
+            self._step_numpy(np.array(keys, dtype=np.int64))
+        else:
+            for i in keys:
+                self._step_one(i)
+
+    def _reschedule(self, keys: list[int]) -> None:
+        """
+        Schedule the next move of enemies that just moved (drift-free).
+        """
+        due, interval = self._due, self._interval_us
+        if np is not None:
+            idx = np.array(keys, dtype=np.int64)
+            due[idx] += interval[idx]
+            self._wheel.schedule_many(idx, due[idx])
+            return
+
+        for i in keys:
+            due[i] += interval[i]
+            self._wheel.schedule(i, due[i])
+
+    def _drop_backlog(self, keys: list[int]) -> None:
+        """
+        Skip moves still owed after MAX_CATCH_UP_STEPS, keeping each step phase.
+        """
+        now = self._wheel.now
+        for i in keys:
+            interval = int(self._interval_us[i])
+            due = now + interval - (now - int(self._due[i])) % interval
+            self._due[i] = due
+            self._wheel.schedule(i, due)
+
+    # --- NumPy path -------------------------------------------------------
+
+    def _step_numpy(self, idx: Any) -> None:
+        is_patrol = (self._kind[idx] == EnemyKind.PATROL) & (self._route_len[idx] > 0)
+        if is_patrol.any():
+            self._patrol_numpy(idx[is_patrol])
+            idx = idx[~is_patrol]
+            if idx.size == 0:
+                return
+
+        if self.flow is not None:
+            is_chase = self._kind[idx] == EnemyKind.CHASE
+            if is_chase.any():
+                # Chasers without a step (unreachable) random-walk with the rest.
+                stuck = self._chase_numpy(idx[is_chase])
+                idx = np.concatenate((idx[~is_chase], stuck))
+                if idx.size == 0:
+                    return
+
+        grid, stride = self._grid, self._stride
+        xs, ys, dxs, dys = self._x, self._y, self._dx, self._dy
+
+        fwd_ok = grid[(ys[idx] + dys[idx] + 1) * stride + xs[idx] + dxs[idx] + 1]
+        redirect = ~fwd_ok
+
+        # Only enemies whose way ahead is open draw random() (as in Enemy._step).
+        open_i = idx[fwd_ok]
+        if open_i.size:
+            draws = (self._next_u64(open_i) >> np.uint64(11)) * (1.0 / (1 << 53))
+            redirect[fwd_ok] = draws < self._chance[open_i]
+
+        turn = idx[redirect]
+        if turn.size:
+            dxs[turn], dys[turn] = self._pick_directions(turn)
+
+        nx = xs[idx] + dxs[idx]
+        ny = ys[idx] + dys[idx]
+        ok = grid[(ny + 1) * stride + nx + 1]
+        self._commit_numpy(idx[ok], nx[ok], ny[ok])
+
+    def _patrol_numpy(self, idx: Any) -> None:
+        """
+        Advance PATROL enemies one tile along their route loops.
+        """
+        pos = self._route_pos[idx] + 1
+        pos[pos >= self._route_len[idx]] = 0
+        j = self._route_off[idx] + pos
+
+        # Short-lived views: the route arrays must stay resizable for add().
+        nx = np.frombuffer(self._route_x, dtype=np.intc)[j].astype(np.int64)
+        ny = np.frombuffer(self._route_y, dtype=np.intc)[j].astype(np.int64)
+
+        self._dx[idx] = nx - self._x[idx]
+        self._dy[idx] = ny - self._y[idx]
+        self._commit_numpy(idx, nx, ny)
+
+        # A blocked patrol (block_enemies) waits on its tile.
+        moved = (self._x[idx] == nx) & (self._y[idx] == ny)
+        self._route_pos[idx[moved]] = pos[moved]
+
+    def _chase_numpy(self, idx: Any) -> Any:
+        """
+        Step CHASE enemies along the flow field; return those with no step.
+        """
+        flow = self.flow
+        if self._flow_view is None or self._flow_view[0] is not flow:
+            # Zero-copy view; FlowField updates dist in place.
+            self._flow_view = (flow, np.frombuffer(flow.dist, dtype=np.intc))
+        dist = self._flow_view[1]
+
+        i = (self._y[idx] + 1) * self._stride + self._x[idx] + 1
+        d = dist[i]
+        nd = dist[i[:, None] + _offsets_array(self._stride)]
+        ok = (nd == (d - 1)[:, None]) & (d > 0)[:, None]
+
+        has = ok.any(axis=1)
+        step = _DIRECTIONS_ARRAY[ok.argmax(axis=1)[has]]
+        sel = idx[has]
+        self._dx[sel] = step[:, 0]
+        self._dy[sel] = step[:, 1]
+        self._commit_numpy(sel, self._x[sel] + step[:, 0], self._y[sel] + step[:, 1])
+        return idx[~has]
+
+    def _commit_numpy(self, idx: Any, nx: Any, ny: Any) -> None:
+        """
+        Move enemies at idx to walkable tiles (nx, ny), keeping occupancy in sync.
+        """
+        xs, ys = self._x, self._y
+        moving = (nx != xs[idx]) | (ny != ys[idx])
+        idx, nx, ny = idx[moving], nx[moving], ny[moving]
+        if idx.size == 0:
+            return
+
+        occ = self.occupancy
+        w = occ.width
+        src = ys[idx] * w + xs[idx]
+        dst = ny * w + nx
+
+        if self.block_enemies:
+            # Sequential so two enemies cannot claim the same free tile.
+            counts = occ.counts
+            for i, a, b, tx, ty in zip(
+                idx.tolist(), src.tolist(), dst.tolist(), nx.tolist(), ny.tolist(), strict=True
+            ):
+                if counts[b]:
+                    continue
+                occ.move(a, b)
+                xs[i], ys[i] = tx, ty
+            return
+
+        xs[idx] = nx
+        ys[idx] = ny
+        counts = np.frombuffer(occ.counts, dtype=np.uintc)
+        if idx.size * 8 >= counts.size:
+            # Large batch: two bincounts beat unbuffered ufunc.at.
+            delta = np.bincount(dst, minlength=counts.size)
+            delta -= np.bincount(src, minlength=counts.size)
+            np.add(counts, delta, out=counts, casting="unsafe")
+        else:
+            np.subtract.at(counts, src, 1)
+            np.add.at(counts, dst, 1)
+        occ.record_moves(src * counts.size + dst)
+
+    def _pick_directions(self, idx: Any) -> tuple[Any, Any]:
+        """
+        Batched CounterRng.shuffle of DIRECTIONS_4, then first walkable direction.
+        """
+        m = idx.size
+        rows = np.arange(m)
+        perm = np.tile(np.arange(4), (m, 1))
+
+        # Fisher-Yates with the same draw order as CounterRng.shuffle.
+        for i in (3, 2, 1):
+            j = ((self._next_u64(idx) >> np.uint64(32)) * np.uint64(i + 1)) >> np.uint64(32)
+            j = j.astype(np.int64)
+            tmp = perm[:, i].copy()
+            perm[:, i] = perm[rows, j]
+            perm[rows, j] = tmp
+
+        dirs = _DIRECTIONS_ARRAY[perm]  # (m, 4, 2)
+        cx = self._x[idx][:, None] + dirs[:, :, 0]
+        cy = self._y[idx][:, None] + dirs[:, :, 1]
+        ok = self._grid[(cy + 1) * self._stride + cx + 1]
+
+        chosen = dirs[rows, ok.argmax(axis=1)]
+        chosen[~ok.any(axis=1)] = 0
+        return chosen[:, 0], chosen[:, 1]
+
+    def _next_u64(self, idx: Any) -> Any:
+        """
+        Vectorised CounterRng.next_u64 for the enemies at idx.
+        """
+        ctr = self._rng_ctr[idx] + np.uint64(1)
+        self._rng_ctr[idx] = ctr
+        z = self._rng_key[idx] + ctr * np.uint64(GOLDEN_GAMMA)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(MIX_MUL_1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(MIX_MUL_2)
+        return z ^ (z >> np.uint64(31))
+
+    # --- Pure-Python fallback ---------------------------------------------
+
+    def _step_one(self, i: int) -> None:
+        grid, stride = self._grid, self._stride
+        x, y = self._x[i], self._y[i]
+
+        if self._kind[i] == EnemyKind.PATROL and self._route_len[i]:
+            pos = (self._route_pos[i] + 1) % self._route_len[i]
+            j = self._route_off[i] + pos
+            nx, ny = self._route_x[j], self._route_y[j]
+            self._dx[i], self._dy[i] = nx - x, ny - y
+            if self._commit_one(i, nx, ny):
+                self._route_pos[i] = pos
+            return
+
+        if self.flow is not None and self._kind[i] == EnemyKind.CHASE:
+            dx, dy = self.flow.next_step(x, y)
+            if dx or dy:
+                self._dx[i], self._dy[i] = dx, dy
+                self._commit_one(i, x + dx, y + dy)
+                return
+
+        nx, ny = x + self._dx[i], y + self._dy[i]
+
+        if (not grid[(ny + 1) * stride + nx + 1]) or (self._rngs[i].random() < self._chance[i]):
+            self._dx[i], self._dy[i] = self._pick_direction(i)
+            nx, ny = x + self._dx[i], y + self._dy[i]
+
+        if grid[(ny + 1) * stride + nx + 1]:
+            self._commit_one(i, nx, ny)
+
+    def _commit_one(self, i: int, nx: int, ny: int) -> bool:
+        """
+        Move enemy i to walkable tile (nx, ny), keeping occupancy in sync.
+
+        Returns False if the move was blocked by another enemy.
+        """
+        x, y = self._x[i], self._y[i]
+        if (nx, ny) == (x, y):
+            return True
+
+        occ = self.occupancy
+        src = occ.index(x, y)
+        dst = occ.index(nx, ny)
+        if self.block_enemies and occ.counts[dst]:
+            return False
+
+        occ.move(src, dst)
+        self._x[i], self._y[i] = nx, ny
+        return True
+
+    def _pick_direction(self, i: int) -> tuple[int, int]:
+        """
+        Same shuffle-then-probe rule as Enemy._pick_direction, on the padded grid.
+        """
+        grid, stride = self._grid, self._stride
+        x, y = self._x[i], self._y[i]
+
+        directions = list(DIRECTIONS_4)
+        self._rngs[i].shuffle(directions)
+
+        for dx, dy in directions:
+            if grid[(y + dy + 1) * stride + x + dx + 1]:
+                return dx, dy
+
+        return (0, 0)
+
+    # --- Storage ----------------------------------------------------------
+
+    def _pack(self) -> None:
+        """
+        Convert list storage to NumPy arrays (after adds, before batch work).
+        """
+        if not isinstance(self._x, list):
+            return
+        self._x = np.array(self._x, dtype=np.int64)
+        self._y = np.array(self._y, dtype=np.int64)
+        self._dx = np.array(self._dx, dtype=np.int64)
+        self._dy = np.array(self._dy, dtype=np.int64)
+        self._interval_us = np.array(self._interval_us, dtype=np.int64)
+        self._due = np.array(self._due, dtype=np.int64)
+        self._chance = np.array(self._chance, dtype=np.float64)
+        self._kind = np.array(self._kind, dtype=np.int8)
+        self._route_off = np.array(self._route_off, dtype=np.int64)
+        self._route_len = np.array(self._route_len, dtype=np.int64)
+        self._route_pos = np.array(self._route_pos, dtype=np.int64)
+        self._rng_key = np.array([r.key for r in self._rngs], dtype=np.uint64)
+        self._rng_ctr = np.array([r.counter for r in self._rngs], dtype=np.uint64)
+        self._rngs = []
+
+    def _unpack(self) -> None:
+        """
+        Convert NumPy storage back to lists so add() stays O(1) amortised.
+        """
+        if isinstance(self._x, list):
+            return
+        self._x = self._x.tolist()
+        self._y = self._y.tolist()
+        self._dx = self._dx.tolist()
+        self._dy = self._dy.tolist()
+        self._interval_us = self._interval_us.tolist()
+        self._due = self._due.tolist()
+        self._chance = self._chance.tolist()
+        self._kind = self._kind.tolist()
+        self._route_off = self._route_off.tolist()
+        self._route_len = self._route_len.tolist()
+        self._route_pos = self._route_pos.tolist()
+        self._rngs = [
+            CounterRng(key=k, counter=c)
+            for k, c in zip(self._rng_key.tolist(), self._rng_ctr.tolist(), strict=True)
+        ]
+        self._rng_key = None
+        self._rng_ctr = None
+
+
+_DIRECTIONS_ARRAY: Any = np.array(DIRECTIONS_4, dtype=np.int64) if np is not None else None
+
+
+def _offsets_array(stride: int) -> Any:
+    """
+    Padded-grid index offsets of DIRECTIONS_4 for a given row stride.
+    """
+    return np.array([dx + dy * stride for dx, dy in DIRECTIONS_4], dtype=np.int64)
@@ -0,0 +1,175 @@
+# src/drunner_core/flowfield.py
+
+"""
+Shared BFS flow field toward a target tile (usually the player).
+
+One field is computed per target move and every chasing enemy reads its next
+step from it in O(1), so chase AI cost does not grow with the number of enemies.
+When the target moves to an adjacent tile the previous field is repaired in
+place instead of being rebuilt.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+from drunner_core.level import Level
+
+UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    Distance-to-target for every walkable tile (4-way BFS, unit step cost).
+
+    Distances are stored in a flat int32 array indexed like Level.walkable_grid()
+    (padded by one wall tile), so neighbour lookups need no bounds checks.
+    """
+
+    def __init__(self, level: Level) -> None:
+        self.level = level
+        self._grid, self._stride = level.walkable_grid()
+        self._revision = level.revision
+        self._width = level.width
+        self._height = level.height
+        s = self._stride
+
+        # Neighbour index offsets, in DIRECTIONS_4 order: +x, -x, +y, -y.
+        self._offsets: tuple[int, ...] = (1, -1, s, -s)
+        self._steps: tuple[tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+        self.dist = array("i", [UNREACHABLE]) * len(self._grid)
+        self._blank = array("i", [UNREACHABLE]) * len(self._grid)
+        self.target: tuple[int, int] | None = None
+
+        # Bumped on every change so consumers can tell when the field moved.
+        self.version = 0
+
+    @property
+    def stride(self) -> int:
+        """
+        Row stride of the padded distance array.
+        """
+        return self._stride
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Flat index of tile (x, y) in dist.
+        """
+        return (y + 1) * self._stride + x + 1
+
+    def distance(self, x: int, y: int) -> int | None:
+        """
+        Steps from (x, y) to the target, or None if unreachable / out of bounds.
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        d = self.dist[self.index(x, y)]
+        return d if d >= 0 else None
+
+    def next_step(self, x: int, y: int) -> tuple[int, int]:
+        """
+        Return the (dx, dy) step toward the target, or (0, 0) if already there or
+        unreachable. Ties are broken in DIRECTIONS_4 order.
+        """
+        i = self.index(x, y)
+        d = self.dist[i]
+        if d <= 0:
+            return (0, 0)
+
+        dist = self.dist
+        for off, step in zip(self._offsets, self._steps, strict=True):
+            if dist[i + off] == d - 1:
+                return step
+        return (0, 0)
+
+    def retarget(self, x: int, y: int) -> None:
+        """
+        Point the field at (x, y). Repairs incrementally after a one-tile move,
+        otherwise rebuilds with a full BFS. A change to the level's tiles (its
+        revision moved) always forces a rebuild.
+        """
+        stale = self._revision != self.level.revision
+        if self.target == (x, y) and not stale:
+            return
+
+        if stale:
+            self._grid, _ = self.level.walkable_grid()
+            self._revision = self.level.revision
+
+        t = self.index(x, y)
+        if not self._grid[t]:
+            raise ValueError(f"Flow field target is not walkable: ({x},{y})")
+
+        old = self.target
+        if not stale and old is not None and abs(old[0] - x) + abs(old[1] - y) == 1:
+            self._shift(self.index(*old), t)
+        else:
+            self._rebuild(t)
+
+        self.target = (x, y)
+        self.version += 1
+
+    def _rebuild(self, t: int) -> None:
+        dist = self.dist
+        grid = self._grid
+        offsets = self._offsets
+
+        # Reset in place (memoryview keeps any zero-copy views of dist valid).
+        memoryview(dist)[:] = memoryview(self._blank)
+        dist[t] = 0
+
+        queue = deque([t])
+        while queue:
+            u = queue.popleft()
+            nd = dist[u] + 1
+            for off in offsets:
+                v = u + off
+                if grid[v] and dist[v] == UNREACHABLE:
+                    dist[v] = nd
+                    queue.append(v)
+
+    def _shift(self, t_old: int, t_new: int) -> None:
+        """
+        Repair the field after the target moved from t_old to adjacent t_new.
+
+        Every distance changes by at most one. Tiles whose shortest path already
+        ran through t_new lose one; they are found by walking old-distance +1
+        edges out from t_new. The rest keep their value unless they lost every
+        neighbour at distance d-1, which can only spread outwards from t_old, so
+        that wave is followed layer by layer. Cost is proportional to the tiles
+        that change (plus their border), not to the level size.
+        """
+        dist = self.dist
+        offsets = self._offsets
+
+        # Phase 1: tiles that get one step closer (old distances, then apply).
+        closer = {t_new}
+        stack = [t_new]
+        while stack:
+            u = stack.pop()
+            nd = dist[u] + 1
+            for off in offsets:
+                v = u + off
+                if dist[v] == nd and v not in closer:
+                    closer.add(v)
+                    stack.append(v)
+        for v in closer:
+            dist[v] -= 1
+
+        # Phase 2: tiles that lost their support get one step further away.
+        queued = {t_old}
+        queue = deque([t_old])
+        while queue:
+            u = queue.popleft()
+            d = dist[u]
+            if d > 0 and any(dist[u + off] == d - 1 for off in offsets):
+                continue  # still supported by a neighbour, value unchanged
+
+            dist[u] = d + 1
+            for off in offsets:
+                v = u + off
+                if dist[v] == d + 1 and v not in closer and v not in queued:
+                    queued.add(v)
+                    queue.append(v)
@@ -0,0 +1,311 @@
+# src/drunner_core/fov.py
+
+"""
+Field of view: recursive shadowcasting with cached results, plus fog of war.
+
+Visibility is exposed as TileBitset (one bit per tile) so rendering (fog) and
+enemy logic (line-of-sight aggro) share the same representation. Results are
+cached per origin in an LRU and dropped when the level's tiles change.
+
+Enemy aggro reuses the player's field of view instead of casting one per enemy:
+an enemy standing on a tile the player can see has line of sight to the player,
+so checking hundreds of enemies is one bit test each.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+
+from drunner_core.level import Level, Tile
+
+# Octant transforms (xx, xy, yx, yy) for the 8 shadowcasting octants.
+_OCTANTS: tuple[tuple[int, int, int, int], ...] = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+
+
+# Byte -> 8 per-tile bytes lookup tables for TileBitset.expand(), per value.
+_EXPAND_TABLES: dict[int, list[bytes]] = {}
+
+
+class TileBitset:
+    """
+    Set of tiles stored as one bit per tile (bit index = y * width + x).
+    """
+
+    __slots__ = ("data", "height", "width")
+
+    def __init__(self, width: int, height: int, data: bytes | bytearray | None = None) -> None:
+        self.width = width
+        self.height = height
+        size = (width * height + 7) // 8
+        if data is not None and len(data) != size:
+            raise ValueError(f"Bitset data must be {size} bytes, got {len(data)}")
+        self.data = bytearray(data) if data is not None else bytearray(size)
+
+    def __contains__(self, pos: object) -> bool:
+        x, y = pos  # type: ignore[misc]
+        return self.is_set(x, y)
+
+    def __len__(self) -> int:
+        return int.from_bytes(self.data, "little").bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TileBitset):
+            return NotImplemented
+        return (self.width, self.height, self.data) == (other.width, other.height, other.data)
+
+    def is_set(self, x: int, y: int) -> bool:
+        """
+        Return True if (x, y) is in the set (False outside the grid).
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        i = y * self.width + x
+        return bool(self.data[i >> 3] & (1 << (i & 7)))
+
+    def add(self, x: int, y: int) -> None:
+        """
+        Add tile (x, y).
+        """
+        i = y * self.width + x
+        self.data[i >> 3] |= 1 << (i & 7)
+
+    def add_indices(self, indices: Iterable[int]) -> None:
+        """
+        Add tiles by flat index.
+        """
+        data = self.data
+        for i in indices:
+            data[i >> 3] |= 1 << (i & 7)
+
+    def union_update(self, other: TileBitset) -> None:
+        """
+        Add every tile of other (same dimensions).
+        """
+        merged = int.from_bytes(self.data, "little") | int.from_bytes(other.data, "little")
+        self.data[:] = merged.to_bytes(len(self.data), "little")
+
+    def clear(self) -> None:
+        """
+        Remove every tile.
+        """
+        self.data[:] = bytes(len(self.data))
+
+    def copy(self) -> TileBitset:
+        """
+        Return an independent copy.
+        """
+        return TileBitset(self.width, self.height, self.data)
+
+    def expand(self, value: int = 1) -> bytes:
+        """
+        One byte per tile (row-major): value where the bit is set, else 0.
+        """
+        table = _expand_table(value)
+        return b"".join([table[b] for b in self.data])[: self.width * self.height]
+
+    def expand_region(self, x0: int, y0: int, x1: int, y1: int, value: int = 1) -> bytes:
+        """
+        expand() restricted to the inclusive tile rectangle, row-major.
+
+        Only the bytes covering the rectangle's rows are expanded.
+        """
+        table = _expand_table(value)
+        data = self.data
+        rows = []
+        for y in range(y0, y1 + 1):
+            start = y * self.width + x0
+            end = start + x1 - x0 + 1
+            b0 = start >> 3
+            row = b"".join([table[b] for b in data[b0 : (end + 7) >> 3]])
+            rows.append(row[start - 8 * b0 : end - 8 * b0])
+        return b"".join(rows)
+
+    def indices(self) -> Iterator[int]:
+        """
+        Yield the flat index of every tile in the set, ascending.
+        """
+        for byte_i, byte in enumerate(self.data):
+            while byte:
+                low = byte & -byte
+                yield (byte_i << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def positions(self) -> Iterator[tuple[int, int]]:
+        """
+        Yield (x, y) of every tile in the set, row by row.
+        """
+        w = self.width
+        for i in self.indices():
+            yield i % w, i // w
+
+
+def _expand_table(value: int) -> list[bytes]:
+    table = _EXPAND_TABLES.get(value)
+    if table is None:
+        table = _EXPAND_TABLES[value] = [
+            bytes(value if b & (1 << k) else 0 for k in range(8)) for b in range(256)
+        ]
+    return table
+
+
+def compute_fov(level: Level, x: int, y: int, radius: int) -> list[int]:
+    """
+    Return flat indices (y * width + x) of tiles visible from (x, y).
+
+    Recursive shadowcasting over the 8 octants; WALL tiles block sight but are
+    themselves visible. The origin is always visible.
+    """
+    width, height = level.width, level.height
+    tiles = level.tiles
+    lit = {y * width + x}
+    r2 = radius * radius
+
+    def cast(row: int, start: float, end: float, xx: int, xy: int, yx: int, yy: int) -> None:
+        if start < end:
+            return
+        new_start = start
+        for j in range(row, radius + 1):
+            dy = -j
+            blocked = False
+            for dx in range(-j, 1):
+                l_slope = (dx - 0.5) / (dy + 0.5)
+                r_slope = (dx + 0.5) / (dy - 0.5)
+                if start < r_slope:
+                    continue
+                if end > l_slope:
+                    break
+
+                tx = x + dx * xx + dy * xy
+                ty = y + dx * yx + dy * yy
+                inside = 0 <= tx < width and 0 <= ty < height
+                if inside and dx * dx + dy * dy <= r2:
+                    lit.add(ty * width + tx)
+
+                opaque = not inside or tiles[ty][tx] == Tile.WALL
+                if blocked:
+                    if opaque:
+                        new_start = r_slope
+                    else:
+                        blocked = False
+                        start = new_start
+                elif opaque and j < radius:
+                    blocked = True
+                    cast(j + 1, start, l_slope, xx, xy, yx, yy)
+                    new_start = r_slope
+            if blocked:
+                break
+
+    for octant in _OCTANTS:
+        cast(1, 1.0, 0.0, *octant)
+    return sorted(lit)
+
+
+class FieldOfView:
+    """
+    Cached field of view for one level and sight radius.
+
+    Results are kept in an LRU keyed by origin and cleared whenever
+    Level.revision changes (see Level.set_tile). Returned bitsets are shared
+    cache entries; copy() them before modifying.
+    """
+
+    def __init__(self, level: Level, radius: int = 8, cache_size: int = 256) -> None:
+        if radius < 0:
+            raise ValueError(f"FOV radius must be >= 0, got {radius}")
+        self.level = level
+        self.radius = radius
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+        self._cache: OrderedDict[tuple[int, int], tuple[list[int], TileBitset]] = OrderedDict()
+        self._revision = level.revision
+
+    def visible_from(self, x: int, y: int) -> TileBitset:
+        """
+        Tiles visible from (x, y) as a (shared, read-only) bitset.
+        """
+        return self._lookup(x, y)[1]
+
+    def visible_indices(self, x: int, y: int) -> list[int]:
+        """
+        Flat indices of tiles visible from (x, y), ascending (shared, read-only).
+        """
+        return self._lookup(x, y)[0]
+
+    def can_see(self, origin: tuple[int, int], target: tuple[int, int]) -> bool:
+        """
+        Return True if target is within the field of view from origin.
+        """
+        return self.visible_from(*origin).is_set(*target)
+
+    def _lookup(self, x: int, y: int) -> tuple[list[int], TileBitset]:
+        if self._revision != self.level.revision:
+            self._cache.clear()
+            self._revision = self.level.revision
+
+        key = (x, y)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        indices = compute_fov(self.level, x, y, self.radius)
+        bits = TileBitset(self.level.width, self.level.height)
+        bits.add_indices(indices)
+        entry = (indices, bits)
+
+        self._cache[key] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+
+class FogOfWar:
+    """
+    Player visibility state: tiles visible right now and tiles ever seen.
+    """
+
+    def __init__(self, fov: FieldOfView) -> None:
+        self.fov = fov
+        level = fov.level
+        self.visible = TileBitset(level.width, level.height)
+        self.explored = TileBitset(level.width, level.height)
+        # Flat indices of self.visible, ascending (shared FOV cache entry).
+        self.visible_indices: list[int] = []
+        self._origin: tuple[int, int] | None = None
+        self._revision = -1
+
+        # Bumped whenever visible/explored change (lets renderers cache overlays).
+        self.version = 0
+
+    def update(self, x: int, y: int) -> bool:
+        """
+        Recompute visibility from (x, y); return True if it changed.
+
+        Only runs when the origin or the level changed, and updating the
+        explored set costs O(visible tiles), not O(map).
+        """
+        revision = self.fov.level.revision
+        if self._origin == (x, y) and self._revision == revision:
+            return False
+
+        self._origin = (x, y)
+        self._revision = revision
+        self.visible = self.fov.visible_from(x, y)
+        self.visible_indices = self.fov.visible_indices(x, y)
+        self.explored.add_indices(self.visible_indices)
+        self.version += 1
+        return True
@@ -7,32 +7,51 @@ Responsibilities:
 - Load a level (JSON file or ASCII fallback)
 - Spawn player and enemies
 - Process input events
-- Update entities on a fixed-ish timestep (dt from clock)
+- Update entities on a fixed simulation tick (cfg.tick_rate), independent of FPS
 - Evaluate win/lose conditions and write a run report once
-- Render the current frame
+- Render at display rate, interpolating entities between ticks
 """
 
 from __future__ import annotations
 
-import random
+import math
+import secrets
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pygame
 
-from drunner.report import write_run_report
-from drunner_core.enemy import Enemy
-from drunner_core.game_helpers import find_spawn
+from drunner.report import ReportWriteError, ReportWriter, make_run_report
+from drunner_core.camera import Camera
+from drunner_core.flowfield import FlowField
+from drunner_core.fov import FieldOfView, FogOfWar
+from drunner_core.game_helpers import apply_next_move, find_spawn, spawn_enemies
 from drunner_core.level import Level, Tile
 from drunner_core.level_io import load_level
-from drunner_core.movement import try_move
+from drunner_core.minimap import Minimap
 from drunner_core.player import Player
-from drunner_core.render import compute_render_params, draw_enemies, draw_level, draw_player
+from drunner_core.profiler import FRAME, FrameProfiler
+from drunner_core.render import (
+    BACKGROUND_COLOR,
+    DirtyRectRenderer,
+    FogSurfaceCache,
+    LevelSurfaceCache,
+    ProfilerOverlay,
+    draw_enemies,
+    draw_player,
+)
+from drunner_core.sprites import SpriteAtlas, SpriteAtlasError
 from drunner_core.state import GameState
+from drunner_core.telemetry import TelemetryRecorder
 
 TIME_LIMIT_SECONDS = 60
 RESULT_HOLD_MS = 1200
 
+# Longest frame the simulation catches up on. After a longer stall (debugger,
+# window drag) the game pauses for the excess instead of running a burst of
+# ticks that would make the next frame even slower.
+MAX_FRAME_SECONDS = 0.25
+
 if TYPE_CHECKING:
     # Imported only for type hints (avoids runtime imports/circular dependencies).
     import logging
@@ -40,7 +59,65 @@ if TYPE_CHECKING:
     from drunner.config import AppConfig
 
 
-def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = None) -> None:
+# Movement keys -> (dx, dy).
+_KEY_MOVES: dict[int, tuple[int, int]] = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_s: (0, 1),
+}
+
+
+def _open_window(cfg: AppConfig, logger: logging.Logger) -> tuple[pygame.Surface, bool]:
+    """
+    Create the display surface, with vsync if requested and available.
+
+    Returns the surface and whether vsync is active.
+    """
+    size = (cfg.window_width, cfg.window_height)
+    if cfg.vsync:
+        try:
+            # vsync needs a renderer-backed window (SCALED).
+            return pygame.display.set_mode(size, pygame.SCALED, vsync=1), True
+        except pygame.error as exc:
+            logger.warning("Vsync unavailable (%s); falling back to the fps cap", exc)
+    return pygame.display.set_mode(size), False
+
+
+def _log_profile(logger: logging.Logger, profiler: FrameProfiler) -> None:
+    """
+    Log the whole-run frame timing summary, one line per phase.
+    """
+    summary = profiler.summary()
+    logger.info(
+        "Frames: %d in %.2fs (%.1f fps), CPU %.2fs",
+        summary["frames"],
+        summary["seconds"],
+        summary["fps"],
+        summary["cpu_seconds"],
+    )
+    logger.info("Frame timing (ms, p50/p95/p99/max):")
+    for name, stats in summary["phases"].items():
+        logger.info(
+            "  %-8s %7.3f %7.3f %7.3f %7.3f",
+            name,
+            stats["p50_ms"],
+            stats["p95_ms"],
+            stats["p99_ms"],
+            stats["max_ms"],
+        )
+
+
+def run_game(
+    cfg: AppConfig,
+    logger: logging.Logger,
+    level_path: Path | None = None,
+    seed: int | None = None,
+) -> None:
     """
     Run the main pygame loop.
 
@@ -48,6 +125,7 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
         cfg: Game/app configuration (window size, FPS, title).
         logger: Application logger for lifecycle messages.
         level_path: Optional path to a JSON level file. If None, uses a fallback demo level.
+        seed: Run seed for enemy randomness. If None, a random 32-bit seed is drawn.
     """
     # Load level (from JSON if provided, otherwise fallback)
     level = (
@@ -70,23 +148,26 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
     player = Player(x=sx, y=sy)
     logger.info("Player spawned at (%d,%d)", player.x, player.y)
 
-    # Project root for reports: prefer cfg.root_dir if it exists, else CWD
+    # Project root: prefer cfg.root_dir if it exists, else CWD (reports go to cfg.reports_dir)
     project_root = Path(getattr(cfg, "root_dir", Path.cwd()))
 
     report_written = False
+    # "<timestamp>_<run_id>" of the run report (names the telemetry dump).
+    report_tag: str | None = None
     level_source = str(level_path) if level_path else f"ascii:{level.name}"
 
-    # Keep one seed/run_id per run (seed can be used later for determinism)
-    run_seed = None
+    # Keep one seed/run_id per run; enemy RNGs are split from the seed so a run
+    # can be replayed with the same seed.
+    run_seed = int(seed) if seed is not None else secrets.randbits(32)
     run_id = None
+    logger.info("Run seed: %d", run_seed)
 
     def _write_report_once(result: str, duration_s: float) -> None:
-        nonlocal report_written
+        nonlocal report_written, report_tag
         if report_written:
             return
 
-        report_path = write_run_report(
-            project_root=project_root,
+        report = make_run_report(
             result=result,
             duration_seconds=duration_s,
             level_source=level_source,
@@ -94,63 +175,141 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
             run_id=run_id,
             score=None,
             version=None,
+            # Frames up to the result (the loop keeps running a moment longer).
+            profile=profiler.summary(),
         )
-        logger.info("Run report saved: %s", report_path)
+        reports.submit(report)
+        logger.debug("Run report queued: %s", report.run_id)
         report_written = True
+        report_tag = f"{report.timestamp}_{report.run_id}"
 
     state = GameState.RUNNING
     state_end_ticks: int | None = None
 
-    # Enemy entities (spawn from level if present; fallback otherwise)
-    spawn_points = level.enemies
-    enemies: list[Enemy] = (
-        [Enemy(x=int(x), y=int(y)) for (x, y) in spawn_points] if spawn_points else []
-    )
+    # Per-phase frame timing (F3 toggles the overlay; summary in report and log).
+    profiler = FrameProfiler()
+    # Per-frame records dumped next to the run report (cfg.telemetry_frames, 0 = off).
+    telemetry = TelemetryRecorder(cfg.telemetry_frames) if cfg.telemetry_frames > 0 else None
 
-    if not enemies:
-        # Fallback: place one enemy on a random walkable tile that isn't the player spawn.
-        candidates: list[tuple[int, int]] = []
-        for x, y, _tile in level.iter_tiles():
-            if (x, y) != (player.x, player.y) and level.is_walkable(x, y):
-                candidates.append((x, y))
+    # Enemy entities (spawn from level if present; fallback otherwise).
+    enemies = spawn_enemies(
+        level, (player.x, player.y), run_seed, blocking=cfg.enemy_blocking, logger=logger
+    )
 
-        if candidates:
-            ex, ey = random.choice(candidates)
-            enemies = [Enemy(x=ex, y=ey)]
-            logger.info("Enemy spawned (fallback, random) at (%d,%d)", ex, ey)
+    # Player field of view (cached per tile): fog of war and enemy aggro.
+    fog = FogOfWar(FieldOfView(level, radius=cfg.fov_radius)) if cfg.fov_radius > 0 else None
+    if fog is not None:
+        fog.update(player.x, player.y)
 
     pygame.init()
     start_ticks = pygame.time.get_ticks()
 
+    # Reports are written on a background thread (closed in the finally below),
+    # so the frame that shows the result never waits on disk I/O.
+    reports = ReportWriter(
+        project_root,
+        report_format=cfg.report_format,
+        max_bytes=cfg.report_max_bytes,
+        compress=cfg.report_compress,
+        reports_dir=cfg.reports_dir,
+    )
+
+    # Set at the end of the try below: the loop exited without an exception.
+    finished = False
     try:
         # Create the window and set the title.
-        screen = pygame.display.set_mode((cfg.window_width, cfg.window_height))
+        screen, vsync = _open_window(cfg, logger)
         pygame.display.set_caption(cfg.title)
 
-        params = compute_render_params(level, cfg.window_width, cfg.window_height)
+        # Camera: fit the level if tiles stay >= min_tile_size, else scroll.
+        camera = Camera(level, cfg.window_width, cfg.window_height, min_tile_size=cfg.min_tile_size)
+        camera.center_on(player.x, player.y)
+        params = camera.params
         logger.debug(
-            "Render params: tile_size=%d offset=(%d,%d)",
+            "Render params: tile_size=%d offset=(%d,%d) scrolling=%s",
             params.tile_size,
             params.offset_x,
             params.offset_y,
+            camera.scrolls,
+        )
+
+        # Sprites from assets/tiles (converted once; rects where there are none).
+        atlas: SpriteAtlas | None = None
+        try:
+            atlas = SpriteAtlas.load(cfg.assets_dir) or None
+        except SpriteAtlasError as e:
+            logger.warning("Sprites disabled: %s", e)
+        if atlas is not None:
+            logger.info("Sprites loaded: %s", ", ".join(atlas.names()))
+
+        # Static layers rendered once and blitted per frame (entities go on top).
+        level_surface = LevelSurfaceCache(atlas=atlas)
+        fog_surface = FogSurfaceCache()
+        dirty = (
+            DirtyRectRenderer(level_surface, fog_surface, atlas=atlas) if cfg.dirty_rects else None
         )
+        fog_layer = fog if cfg.fog_of_war else None
+        overlay = ProfilerOverlay(profiler, visible=cfg.profiler_overlay)
+        # Whole-level overview, only useful when the level does not fit the window.
+        minimap = Minimap(max_size=cfg.minimap_size)
+        show_minimap = cfg.minimap and camera.scrolls
 
         clock = pygame.time.Clock()
         running = True
 
+        # Fixed simulation tick; frames render whatever the display allows and
+        # interpolate entities by how far they are into the next tick.
+        tick_s = 1.0 / cfg.tick_rate
+        # With vsync the display paces frames; fps = 0 means uncapped.
+        frame_cap = 0 if vsync else cfg.fps
+        accumulator = 0.0
+        pending_moves: list[tuple[int, int]] = []
+        player_from = (player.x, player.y)
+        # Set when the last frame changed nothing on screen (see idle throttling).
+        idle = False
+
         logger.info(
-            "Pygame initialized (%dx%d @ %dfps)",
+            "Pygame initialized (%dx%d @ %s, %d ticks/s)",
             cfg.window_width,
             cfg.window_height,
-            cfg.fps,
+            "vsync" if vsync else f"{cfg.fps}fps" if cfg.fps > 0 else "uncapped fps",
+            cfg.tick_rate,
         )
 
         while running:
-            dt = clock.tick(cfg.fps) / 1000.0
-            now_ticks = pygame.time.get_ticks()
-            elapsed_s = (now_ticks - start_ticks) / 1000.0
-
-            # Handle input/events.
+            profiler.begin_frame()
+            frame_moves = 0
+
+            # Idle throttling: nothing is moving, so sleep until the next thing
+            # that can change the screen (enemy move, deadline, overlay refresh)
+            # or until an input event arrives, instead of spinning at full fps.
+            slept_s = 0.0
+            if idle and cfg.idle_throttle:
+                deadlines = [
+                    (state_end_ticks - pygame.time.get_ticks()) / 1000.0
+                    if state_end_ticks is not None
+                    else TIME_LIMIT_SECONDS - (pygame.time.get_ticks() - start_ticks) / 1000.0
+                ]
+                next_move = enemies.next_move_in() if state == GameState.RUNNING else None
+                if next_move is not None:
+                    # The move happens on the first tick at or past its due time.
+                    deadlines.append(math.ceil(next_move / tick_s) * tick_s - accumulator)
+                if overlay.visible:
+                    deadlines.append(overlay.refresh_ms / 1000.0)
+                wait_ms = int(min(deadlines) * 1000)
+                if wait_ms > (1000 // frame_cap if frame_cap else 1):
+                    t0 = pygame.time.get_ticks()
+                    event = pygame.event.wait(wait_ms)
+                    if event.type != pygame.NOEVENT:
+                        pygame.event.post(event)  # handled by the loop below
+                    slept_s = (pygame.time.get_ticks() - t0) / 1000.0
+
+            frame_s = clock.tick(frame_cap) / 1000.0
+            # An idle sleep is not a stall: the simulation catches up on all of it.
+            accumulator += min(frame_s, MAX_FRAME_SECONDS + slept_s)
+            profiler.mark("wait")
+
+            # Handle input/events (queued moves are applied one per tick).
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -160,29 +319,61 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
                         running = False  # ESC quits
                         continue
 
+                    if event.key == pygame.K_F3:
+                        overlay.toggle()
+                        if dirty is not None and not overlay.visible:
+                            dirty.invalidate()  # repaint what the panel covered
+                        continue
+
+                    if event.key == pygame.K_m:
+                        show_minimap = not show_minimap
+                        if dirty is not None and not show_minimap:
+                            dirty.invalidate()  # repaint what the minimap covered
+                        continue
+
                     # Ignore gameplay input once we have a final result (WON/LOST)
                     if state != GameState.RUNNING:
                         continue
 
-                    moved = False
-                    if event.key in (pygame.K_LEFT, pygame.K_a):
-                        moved = try_move(level, player, dx=-1, dy=0)
-                    elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                        moved = try_move(level, player, dx=1, dy=0)
-                    elif event.key in (pygame.K_UP, pygame.K_w):
-                        moved = try_move(level, player, dx=0, dy=-1)
-                    elif event.key in (pygame.K_DOWN, pygame.K_s):
-                        moved = try_move(level, player, dx=0, dy=1)
-
-                    if moved:
-                        logger.debug("Player moved to (%d,%d)", player.x, player.y)
-
-            if state == GameState.RUNNING:
-                for enemy in enemies:
-                    enemy.update(dt, level)
-
-            # --- Win/Lose checks (only while RUNNING) ---
-            if state == GameState.RUNNING:
+                    move = _KEY_MOVES.get(event.key)
+                    if move is not None:
+                        pending_moves.append(move)
+            profiler.mark("events")
+
+            while accumulator >= tick_s:
+                accumulator -= tick_s
+                if state != GameState.RUNNING:
+                    continue
+
+                now_ticks = pygame.time.get_ticks()
+                elapsed_s = (now_ticks - start_ticks) / 1000.0
+
+                # Player tile at the start of the tick (to catch player/enemy
+                # swaps, and to interpolate the player while rendering).
+                player_from = (player.x, player.y)
+                enemies.begin_tick()
+
+                moved = apply_next_move(level, player, pending_moves)
+                if moved:
+                    frame_moves += 1
+                    logger.debug("Player moved to (%d,%d)", player.x, player.y)
+                    if enemies.flow is not None:
+                        enemies.flow.retarget(player.x, player.y)
+                profiler.mark("input")
+
+                enemies.update(tick_s, level)
+
+                # Line-of-sight aggro: enemies the player can see start chasing.
+                if fog is not None:
+                    fog.update(player.x, player.y)
+                    if enemies.aggro(fog.visible):
+                        if enemies.flow is None:
+                            enemies.flow = FlowField(level)
+                            enemies.flow.retarget(player.x, player.y)
+                        logger.debug("Enemy aggro at (%d,%d)", player.x, player.y)
+                profiler.mark("enemies")
+
+                # --- Win/Lose checks ---
                 # Win: player reached the exit
                 if level.tile_at(player.x, player.y) == Tile.EXIT:
                     state = GameState.WON
@@ -192,8 +383,8 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
 
                     _write_report_once(state.name, elapsed_s)
 
-                # Lose: enemy collision
-                elif any((enemy.x == player.x and enemy.y == player.y) for enemy in enemies):
+                # Lose: enemy collision (same tile, or swapped tiles this tick)
+                elif enemies.collides(player_from, (player.x, player.y)):
                     state = GameState.LOST
                     logger.info("Result: LOST (enemy collision) in %.2fs", elapsed_s)
                     pygame.display.set_caption(f"{cfg.title} - LOST")
@@ -211,13 +402,68 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
                     state_end_ticks = now_ticks + RESULT_HOLD_MS
 
                     _write_report_once(state.name, elapsed_s)
-
-            # Render
-            screen.fill((20, 20, 20))
-            draw_level(screen, level, params)
-            draw_enemies(screen, enemies, params)
-            draw_player(screen, player, params)
-            pygame.display.flip()
+                profiler.mark("rules")
+
+            # Render (a camera scroll changes params; the dirty renderer then
+            # rebuilds its background and redraws the whole frame).
+            if camera.follow(player.x, player.y):
+                params = camera.params
+
+            # Fraction of the way into the next tick (entities ease from their
+            # previous tile toward the current one).
+            alpha = accumulator / tick_s if state == GameState.RUNNING else 1.0
+            visible = fog_layer.visible if fog_layer is not None else None
+
+            if dirty is not None:
+                # Only changed entities are redrawn; an idle frame updates nothing.
+                rects = dirty.render(
+                    screen, level, params, player, enemies, fog_layer, alpha, player_from
+                )
+                if show_minimap:
+                    area, changed = minimap.draw(
+                        screen, level, player, enemies, fog_layer, camera.tile_range()
+                    )
+                    if changed or area.collidelist(rects) != -1:
+                        rects.append(area)
+                if overlay.visible:
+                    panel, changed = overlay.draw(screen, pygame.time.get_ticks())
+                    if changed or panel.collidelist(rects) != -1:
+                        rects.append(panel)
+                profiler.mark("render")
+                if rects:
+                    pygame.display.update(rects)
+            else:
+                screen.fill(BACKGROUND_COLOR)
+                level_surface.draw(screen, level, params)
+                if fog_layer is not None:
+                    fog_surface.draw(screen, level, fog_layer, params)
+                draw_enemies(screen, enemies, params, visible=visible, alpha=alpha, atlas=atlas)
+                draw_player(screen, player, params, prev=player_from, alpha=alpha, atlas=atlas)
+                if show_minimap:
+                    minimap.draw(screen, level, player, enemies, fog_layer, camera.tile_range())
+                if overlay.visible:
+                    overlay.draw(screen, pygame.time.get_ticks())
+                profiler.mark("render")
+                pygame.display.flip()
+            profiler.mark("flip")
+            profiler.end_frame()
+            if telemetry is not None:
+                telemetry.record(
+                    profiler.last(FRAME),
+                    profiler.last("input") + profiler.last("enemies") + profiler.last("rules"),
+                    profiler.last("render"),
+                    len(enemies),
+                    frame_moves,
+                )
+
+            # Idle when the last tick moved nothing, no input is queued and (with
+            # dirty rects) nothing was redrawn.
+            moving = player_from != (player.x, player.y) or enemies.moved_this_tick()
+            idle = (
+                not pending_moves
+                and not (state == GameState.RUNNING and moving)
+                and (dirty is None or not rects)
+            )
 
             # Auto-exit shortly after result
             if state_end_ticks is not None and pygame.time.get_ticks() >= state_end_ticks:
@@ -227,7 +473,27 @@ def run_game(cfg: AppConfig, logger: logging.Logger, level_path: Path | None = N
             elapsed_s = (pygame.time.get_ticks() - start_ticks) / 1000.0
             logger.info("Result: ABORTED (quit) in %.2fs", elapsed_s)
 
+        _log_profile(logger, profiler)
+
+        if telemetry is not None and report_tag is not None:
+            path = telemetry.dump(cfg.reports_dir / f"telemetry_{report_tag}.bin")
+            logger.info("Telemetry saved: %s (%d frames)", path, len(telemetry))
+        finished = True
+
     finally:
         # Always clean up pygame, even if something crashes.
         pygame.quit()
         logger.info("Pygame quit cleanly")
+
+        # Wait for the queued report. A lost report raises ReportWriteError on a
+        # clean exit; while another exception is propagating it is only logged,
+        # so the crash report names the real error.
+        saved: list[Path] = []
+        try:
+            saved = reports.close()
+        except ReportWriteError:
+            if finished:
+                raise
+            logger.exception("Run report lost while handling another error")
+        for path in saved:
+            logger.info("Run report saved: %s", path)
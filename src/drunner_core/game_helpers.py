@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
-from drunner_core.level import Level, Tile
+import random
+from typing import TYPE_CHECKING
+
+from drunner_core.enemy import EnemyPool
+from drunner_core.flowfield import FlowField
+from drunner_core.level import EnemyKind, Level, Tile
+from drunner_core.movement import try_move
+from drunner_core.patrol import PatrolTable
+from drunner_core.player import Player
+
+if TYPE_CHECKING:
+    import logging
 
 
 def find_spawn(level: Level) -> tuple[int, int]:
@@ -14,3 +25,62 @@ def find_spawn(level: Level) -> tuple[int, int]:
             return x, y
 
     return (0, 0)
+
+
+def apply_next_move(level: Level, player: Player, pending_moves: list[tuple[int, int]]) -> bool:
+    """
+    Apply the oldest queued move (one per tick) and return True if the player moved.
+
+    Later moves stay queued for the following ticks, so the win and collision
+    checks run after every step (two key presses in one tick cannot carry the
+    player through an enemy or past the exit).
+    """
+    if not pending_moves:
+        return False
+    dx, dy = pending_moves.pop(0)
+    return try_move(level, player, dx=dx, dy=dy)
+
+
+def spawn_enemies(
+    level: Level,
+    player_pos: tuple[int, int],
+    seed: int,
+    blocking: bool = False,
+    logger: logging.Logger | None = None,
+) -> EnemyPool:
+    """
+    Build the run's EnemyPool from the level's enemy list, attached to level.
+
+    A level without enemies gets one random-walk enemy on a random walkable
+    tile other than player_pos (chosen from seed). Chasers get a flow field
+    toward player_pos.
+    """
+    # Stored as one EnemyPool so large maps update all enemies in a single batch.
+    enemies = EnemyPool(seed=seed)
+    enemies.block_enemies = blocking
+    # Patrol loops are expanded by load_level; levels built in code expand here.
+    patrols = level.patrols if level.patrols is not None else PatrolTable.from_level(level)
+    for i, (x, y) in enumerate(level.enemies):
+        enemies.add(int(x), int(y), kind=level.enemy_kind(i), route=patrols.route(i))
+
+    if not enemies:
+        # Fallback: place one enemy on a random walkable tile that isn't the player spawn.
+        candidates: list[tuple[int, int]] = []
+        for x, y, _tile in level.iter_tiles():
+            if (x, y) != player_pos and level.is_walkable(x, y):
+                candidates.append((x, y))
+
+        if candidates:
+            ex, ey = random.Random(seed).choice(candidates)
+            enemies.add(ex, ey)
+            if logger is not None:
+                logger.info("Enemy spawned (fallback, random) at (%d,%d)", ex, ey)
+
+    # Occupancy index: O(1) enemy-on-tile checks and swap detection.
+    enemies.attach(level)
+
+    # Chasers share one flow field toward the player, updated once per player move.
+    if EnemyKind.CHASE in level.enemy_kinds:
+        enemies.flow = FlowField(level)
+        enemies.flow.retarget(*player_pos)
+    return enemies
@@ -0,0 +1,289 @@
+# src/drunner_core/headless.py
+
+"""
+Offscreen rendering without a display: level thumbnails and run frames as PNG.
+
+Everything draws onto plain pygame Surfaces with the same functions the game
+uses (drunner_core.render), under SDL's dummy video driver so no window is
+opened and it runs on CI machines without a display server.
+
+Batch thumbnails are cached by content: the file name is a hash of the level
+file bytes, the thumbnail size and the sprite assets, so unchanged levels are
+never rendered twice (renamed or copied levels hit the cache too). Missing
+thumbnails are rendered across a process pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pygame
+
+from drunner_core.camera import Camera
+from drunner_core.flowfield import FlowField
+from drunner_core.fov import FieldOfView, FogOfWar
+from drunner_core.game_helpers import find_spawn, spawn_enemies
+from drunner_core.level import Level
+from drunner_core.level_io import load_level
+from drunner_core.minimap import Minimap, render_tiles
+from drunner_core.player import Player
+from drunner_core.render import (
+    BACKGROUND_COLOR,
+    FogSurfaceCache,
+    LevelSurfaceCache,
+    RenderParams,
+    draw_enemies,
+    draw_level,
+    draw_player,
+)
+from drunner_core.sprites import SpriteAtlas, SpriteAtlasError
+
+if TYPE_CHECKING:
+    from drunner.config import AppConfig
+
+# Bump when thumbnail rendering changes; it is part of every cache key.
+THUMBNAIL_FORMAT = 1
+
+# Written next to the thumbnails: level path (relative to the levels dir) -> file name.
+INDEX_FILE = "index.json"
+
+# Sprite atlas of a thumbnail worker process (set by _init_worker).
+_worker_atlas: SpriteAtlas | None = None
+
+
+def init_headless() -> None:
+    """
+    Initialize pygame's display module on the dummy video driver.
+
+    Does nothing if the display is already initialized (e.g. inside the game).
+    """
+    if not pygame.display.get_init():
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+
+
+def render_thumbnail(
+    level: Level, max_size: int = 256, atlas: SpriteAtlas | None = None
+) -> pygame.Surface:
+    """
+    The level's tiles on a surface whose longest edge is at most max_size.
+
+    Levels with fewer tiles than pixels get whole-pixel tiles (drawn like the
+    game, with sprites when atlas has them); larger ones are downsampled from
+    one pixel per tile.
+    """
+    longest = max(level.width, level.height)
+    if longest > max_size:
+        scale = max_size / longest
+        return render_tiles(
+            level, max(1, int(level.width * scale)), max(1, int(level.height * scale))
+        )
+
+    ts = max_size // longest
+    surface = pygame.Surface((level.width * ts, level.height * ts))
+    surface.fill(BACKGROUND_COLOR)
+    draw_level(surface, level, RenderParams(tile_size=ts, offset_x=0, offset_y=0), atlas=atlas)
+    return surface
+
+
+def render_frames(
+    cfg: AppConfig,
+    level: Level,
+    out_dir: Path,
+    frames: int,
+    seed: int = 0,
+    every: int = 1,
+    atlas: SpriteAtlas | None = None,
+) -> list[Path]:
+    """
+    Simulate level without input and save a PNG every `every` ticks.
+
+    The player stays on the spawn tile while enemies move exactly as in a run
+    with the same seed; the view is the game's (camera, fog, minimap) at
+    cfg's window size. Stops early when an enemy catches the player.
+    Returns the written files (frame_00000.png, ...) in order.
+    """
+    init_headless()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    sx, sy = find_spawn(level)
+    player = Player(x=sx, y=sy)
+    enemies = spawn_enemies(level, (player.x, player.y), seed, blocking=cfg.enemy_blocking)
+    fog = FogOfWar(FieldOfView(level, radius=cfg.fov_radius)) if cfg.fov_radius > 0 else None
+    if fog is not None:
+        fog.update(player.x, player.y)
+    fog_layer = fog if cfg.fog_of_war else None
+
+    camera = Camera(level, cfg.window_width, cfg.window_height, min_tile_size=cfg.min_tile_size)
+    camera.center_on(player.x, player.y)
+    minimap = Minimap(max_size=cfg.minimap_size) if cfg.minimap and camera.scrolls else None
+    level_surface = LevelSurfaceCache(atlas=atlas)
+    fog_surface = FogSurfaceCache()
+    screen = pygame.Surface((cfg.window_width, cfg.window_height))
+
+    tick_s = 1.0 / cfg.tick_rate
+    written: list[Path] = []
+    for tick in range(frames * every):
+        if tick:
+            enemies.begin_tick()
+            enemies.update(tick_s, level)
+            if fog is not None and enemies.aggro(fog.visible) and enemies.flow is None:
+                enemies.flow = FlowField(level)
+                enemies.flow.retarget(player.x, player.y)
+        caught = enemies.any_at(player.x, player.y)
+        if tick % every and not caught:
+            continue
+
+        params = camera.params
+        visible = fog_layer.visible if fog_layer is not None else None
+        screen.fill(BACKGROUND_COLOR)
+        level_surface.draw(screen, level, params)
+        if fog_layer is not None:
+            fog_surface.draw(screen, level, fog_layer, params)
+        draw_enemies(screen, enemies, params, visible=visible, atlas=atlas)
+        draw_player(screen, player, params, atlas=atlas)
+        if minimap is not None:
+            minimap.draw(screen, level, player, enemies, fog_layer, camera.tile_range())
+
+        path = out_dir / f"frame_{len(written):05d}.png"
+        pygame.image.save(screen, str(path))
+        written.append(path)
+        if caught:
+            break
+    return written
+
+
+def thumbnail_key(level_bytes: bytes, size: int, assets_key: str = "") -> str:
+    """
+    Cache key of a thumbnail: hash of the level file, size and sprite assets.
+    """
+    h = hashlib.sha256(f"drunner-thumbnail:{THUMBNAIL_FORMAT}:{size}:{assets_key}\n".encode())
+    h.update(level_bytes)
+    return h.hexdigest()
+
+
+def assets_fingerprint(assets_dir: Path | None) -> str:
+    """
+    Hash of the sprite files under assets_dir/tiles ("" without sprites).
+    """
+    tiles_dir = Path(assets_dir) / "tiles" if assets_dir is not None else None
+    if tiles_dir is None or not tiles_dir.is_dir():
+        return ""
+    h = hashlib.sha256()
+    for path in sorted(p for p in tiles_dir.iterdir() if p.is_file()):
+        h.update(f"{path.name}\0{path.stat().st_size}\0".encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class ThumbnailResult:
+    """
+    Outcome of one level in render_thumbnails().
+    """
+
+    level: Path
+    thumbnail: Path | None
+    cached: bool = False
+    error: str | None = None
+
+
+def render_thumbnails(
+    levels_dir: Path,
+    out_dir: Path,
+    size: int = 256,
+    assets_dir: Path | None = None,
+    jobs: int | None = None,
+) -> list[ThumbnailResult]:
+    """
+    Thumbnail every level JSON under levels_dir into out_dir/<key>.png.
+
+    Levels whose thumbnail is already in out_dir are skipped; the others are
+    rendered by `jobs` worker processes (default: one per CPU, 1 renders in
+    this process). Invalid levels are reported in the results, not raised.
+    out_dir/index.json maps each level (relative to levels_dir) to its file.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    assets_key = assets_fingerprint(assets_dir)
+    out_resolved = out_dir.resolve()
+
+    results: dict[Path, ThumbnailResult] = {}
+    todo: list[tuple[Path, Path]] = []
+    for path in sorted(levels_dir.rglob("*.json")):
+        if out_resolved in path.resolve().parents:
+            continue  # our own index.json when out_dir is inside levels_dir
+        try:
+            key = thumbnail_key(path.read_bytes(), size, assets_key)
+        except OSError as e:
+            results[path] = ThumbnailResult(path, None, error=str(e))
+            continue
+        target = out_dir / f"{key}.png"
+        if target.is_file():
+            results[path] = ThumbnailResult(path, target, cached=True)
+        else:
+            todo.append((path, target))
+
+    # Identical levels share one key: render each target once.
+    unique = list({target: path for path, target in todo}.items())
+    rendered: dict[Path, str | None] = {}
+    if jobs == 1 or len(unique) <= 1:
+        _init_worker(assets_dir)
+        for target, path in unique:
+            rendered[target] = _thumbnail_job(path, target, size)
+    elif unique:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(assets_dir,)
+        ) as pool:
+            futures = [pool.submit(_thumbnail_job, path, target, size) for target, path in unique]
+            for (target, _path), future in zip(unique, futures, strict=True):
+                rendered[target] = future.result()
+
+    for path, target in todo:
+        error = rendered[target]
+        results[path] = ThumbnailResult(path, None if error else target, error=error)
+
+    ordered = [results[p] for p in sorted(results)]
+    _write_index(levels_dir, out_dir, ordered)
+    return ordered
+
+
+def _init_worker(assets_dir: Path | None) -> None:
+    global _worker_atlas
+    init_headless()
+    _worker_atlas = None
+    if assets_dir is not None:
+        try:
+            _worker_atlas = SpriteAtlas.load(assets_dir) or None
+        except SpriteAtlasError:
+            _worker_atlas = None  # thumbnails fall back to colored tiles
+
+
+def _thumbnail_job(path: Path, target: Path, size: int) -> str | None:
+    """
+    Render one thumbnail to target; return an error message instead of raising.
+    """
+    try:
+        surface = render_thumbnail(load_level(path), size, atlas=_worker_atlas)
+        # Write under a private name first so readers never see partial files.
+        tmp = target.with_name(f".{target.stem}.{os.getpid()}.png")
+        pygame.image.save(surface, str(tmp))
+        os.replace(tmp, target)
+    except (OSError, ValueError, pygame.error) as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def _write_index(levels_dir: Path, out_dir: Path, results: Iterable[ThumbnailResult]) -> None:
+    index = {
+        r.level.relative_to(levels_dir).as_posix(): r.thumbnail.name
+        for r in results
+        if r.thumbnail is not None
+    }
+    (out_dir / INDEX_FILE).write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
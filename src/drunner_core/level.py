@@ -5,6 +5,10 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from drunner_core.patrol import PatrolTable
 
 
 class LevelValidationError(ValueError):
@@ -29,6 +33,16 @@ class Tile(IntEnum):
 WALKABLE_TILES: frozenset[Tile] = frozenset({Tile.FLOOR, Tile.START, Tile.EXIT})
 
 
+class EnemyKind(IntEnum):
+    """
+    Enemy behaviours selectable per enemy from level JSON ("type" field).
+    """
+
+    RANDOM = 0  # random walk (default)
+    CHASE = 1  # follow the shared flow field toward the player
+    PATROL = 2  # loop along a precomputed route (see drunner_core.patrol)
+
+
 @dataclass(slots=True)
 class Level:
     """
@@ -43,6 +57,18 @@ class Level:
     name: str = "unnamed"
     enemies: list[tuple[int, int]] = field(default_factory=list)
 
+    # Behaviour per enemy, parallel to enemies. Empty means all RANDOM.
+    enemy_kinds: list[EnemyKind] = field(default_factory=list)
+
+    # Patrol waypoints per enemy, parallel to enemies ([] = no route). Empty means none.
+    enemy_routes: list[list[tuple[int, int]]] = field(default_factory=list)
+
+    # Expanded patrol routes, filled by load_level (see PatrolTable.from_level).
+    patrols: PatrolTable | None = field(default=None, init=False, compare=False, repr=False)
+
+    # Bumped by set_tile() so caches derived from the tiles can invalidate.
+    revision: int = field(default=0, init=False, compare=False)
+
     def __post_init__(self) -> None:
         """
         Validate that tiles are a non-empty rectangular grid of Tile values.
@@ -82,6 +108,20 @@ class Level:
             if self.tile_at(ex, ey) == Tile.START:
                 raise LevelValidationError("Enemy cannot spawn on START tile")
 
+        if self.enemy_kinds and len(self.enemy_kinds) != len(self.enemies):
+            raise LevelValidationError(
+                f"enemy_kinds has {len(self.enemy_kinds)} entries for {len(self.enemies)} enemies"
+            )
+
+        if self.enemy_routes and len(self.enemy_routes) != len(self.enemies):
+            raise LevelValidationError(
+                f"enemy_routes has {len(self.enemy_routes)} entries for {len(self.enemies)} enemies"
+            )
+        for route in self.enemy_routes:
+            for wx, wy in route:
+                if not self.is_walkable(wx, wy):
+                    raise LevelValidationError(f"Patrol waypoint not walkable at ({wx},{wy})")
+
     @property
     def width(self) -> int:
         """
@@ -118,6 +158,52 @@ class Level:
             return False
         return self.tiles[y][x] in WALKABLE_TILES
 
+    def set_tile(self, x: int, y: int, tile: Tile) -> None:
+        """
+        Change the tile at (x, y) and bump revision. Raises if out of bounds.
+        """
+        if not self.in_bounds(x, y):
+            raise IndexError(f"Out of bounds: ({x},{y})")
+        if self.tiles[y][x] != tile:
+            self.tiles[y][x] = tile
+            self.revision += 1
+
+    def enemy_kind(self, index: int) -> EnemyKind:
+        """
+        Behaviour of the enemy at index (RANDOM when no kinds were given).
+        """
+        return self.enemy_kinds[index] if self.enemy_kinds else EnemyKind.RANDOM
+
+    def enemy_route(self, index: int) -> list[tuple[int, int]]:
+        """
+        Patrol waypoints of the enemy at index ([] when it has none).
+        """
+        return self.enemy_routes[index] if self.enemy_routes else []
+
+    def walkable_grid(self) -> tuple[bytearray, int]:
+        """
+        Return a flat walkability grid padded with a 1-tile wall border, and its stride.
+
+        Tile (x, y) lives at index (y + 1) * stride + (x + 1), so neighbour lookups
+        never need a bounds check. Used by batched systems (e.g. EnemyPool).
+        """
+        stride = self.width + 2
+        grid = bytearray(stride * (self.height + 2))
+        for y, row in enumerate(self.tiles):
+            base = (y + 1) * stride + 1
+            for x, t in enumerate(row):
+                if t in WALKABLE_TILES:
+                    grid[base + x] = 1
+        return grid, stride
+
+    def tile_bytes(self) -> bytes:
+        """
+        Return the tiles as one byte per tile (Tile value), row-major.
+
+        Compact input for bulk operations such as bytes.translate() palettes.
+        """
+        return b"".join(bytes(row) for row in self.tiles)
+
     def positions_of(self, tile: Tile) -> Iterable[tuple[int, int]]:
         """
         Yield all (x, y) positions matching a given tile type.
@@ -149,6 +235,8 @@ class Level:
         rows: Sequence[Sequence[int | Tile]],
         name: str = "unnamed",
         enemies: Sequence[Sequence[int]] | None = None,
+        enemy_kinds: Sequence[int | EnemyKind] | None = None,
+        enemy_routes: Sequence[Sequence[Sequence[int]]] | None = None,
     ) -> Level:
         """
         Build a Level from numeric rows (or Tiles).
@@ -166,7 +254,16 @@ class Level:
             for e in enemies:
                 enemy_list.append((int(e[0]), int(e[1])))
 
-        return cls(tiles=tiles, name=name, enemies=enemy_list)
+        kinds = [EnemyKind(int(k)) for k in enemy_kinds] if enemy_kinds else []
+        routes = (
+            [[(int(p[0]), int(p[1])) for p in route] for route in enemy_routes]
+            if enemy_routes and any(enemy_routes)
+            else []
+        )
+
+        return cls(
+            tiles=tiles, name=name, enemies=enemy_list, enemy_kinds=kinds, enemy_routes=routes
+        )
 
     @classmethod
     def from_ascii(cls, lines: Sequence[str], name: str = "ascii") -> Level:
@@ -6,7 +6,16 @@ import json
 from pathlib import Path
 from typing import Any
 
-from drunner_core.level import Level, LevelValidationError, Tile
+from drunner_core.level import EnemyKind, Level, LevelValidationError, Tile
+from drunner_core.patrol import PatrolTable, RouteError
+
+# Enemy "type" names accepted in level JSON ("basic" is the spec's name for random walk).
+ENEMY_TYPE_NAMES: dict[str, EnemyKind] = {
+    "basic": EnemyKind.RANDOM,
+    "random": EnemyKind.RANDOM,
+    "chase": EnemyKind.CHASE,
+    "patrol": EnemyKind.PATROL,
+}
 
 
 class LevelIOError(ValueError):
@@ -23,10 +32,19 @@ def load_level(path: Path) -> Level:
       {
         'version': 1,
         'name': 'demo',
-        'grid': [[1,1,1,...], [1,2,0,...], ...]
+        'grid': [[1,1,1,...], [1,2,0,...], ...],
+        'enemies': [
+          [x,y],
+          {'x': 5, 'y': 3, 'type': 'chase'},
+          {'x': 2, 'y': 1, 'type': 'patrol', 'route': [[8,1], [8,3]]},
+          ...
+        ]
       }
 
-    Tile encoding must match Tile enum integers.
+    Tile encoding must match Tile enum integers. Enemy entries are either [x,y]
+    (random walk) or objects with an optional "type" (see ENEMY_TYPE_NAMES).
+    Patrol enemies need a "route" of waypoints; the loop spawn -> waypoints ->
+    spawn is validated and expanded into level.patrols here.
     """
     if not path.exists():
         raise FileNotFoundError(f"Level file not found: {path}")
@@ -51,17 +69,13 @@ def load_level(path: Path) -> Level:
         raise LevelIOError(f'Invalid "enemies" in {path}. Expected list of [x,y].')
 
     enemies: list[tuple[int, int]] = []
+    enemy_kinds: list[EnemyKind] = []
+    enemy_routes: list[list[tuple[int, int]]] = []
     for item in enemies_raw:
-        if not isinstance(item, (list, tuple)) or len(item) != 2:
-            raise LevelIOError(f"Invalid enemy entry in {path}: {item!r}. Expected [x,y].")
-        try:
-            x = int(item[0])
-            y = int(item[1])
-        except (TypeError, ValueError) as e:
-            raise LevelIOError(
-                f"Invalid enemy coords in {path}: {item!r}. Expected integers."
-            ) from e
+        x, y, kind, route = _parse_enemy(item, path)
         enemies.append((x, y))
+        enemy_kinds.append(kind)
+        enemy_routes.append(route)
 
     if not isinstance(grid, list) or not grid:
         raise LevelIOError(f'{path.name}: missing "grid" (expected 2D list).')
@@ -70,11 +84,22 @@ def load_level(path: Path) -> Level:
         raise LevelIOError(f'{path.name}: invalid "grid" (expected 2D list of rows).')
 
     try:
-        level = Level.from_rows(grid, name=name, enemies=enemies)
+        level = Level.from_rows(
+            grid,
+            name=name,
+            enemies=enemies,
+            enemy_kinds=enemy_kinds,
+            enemy_routes=enemy_routes,
+        )
     except (ValueError, LevelValidationError) as e:
         raise LevelIOError(f"Invalid grid data in {path}: {e}") from e
 
     _validate_required_tiles(level, path)
+
+    try:
+        level.patrols = PatrolTable.from_level(level)
+    except RouteError as e:
+        raise LevelIOError(f"Invalid patrol route in {path}: {e}") from e
     return level
 
 
@@ -82,18 +107,86 @@ def save_level(level: Level, path: Path) -> None:
     """
     Save a level to JSON.
 
-    Produces schema v1 with integer tile values.
+    Produces schema v1 with integer tile values. Random-walk enemies are written
+    as [x,y]; other kinds as {"x", "y", "type"} objects (plus "route" for patrols).
     """
+    enemies: list[Any] = []
+    for i, (x, y) in enumerate(level.enemies):
+        kind = level.enemy_kind(i)
+        if kind == EnemyKind.RANDOM:
+            enemies.append([x, y])
+            continue
+
+        entry: dict[str, Any] = {"x": x, "y": y, "type": kind.name.lower()}
+        if kind == EnemyKind.PATROL:
+            entry["route"] = [[wx, wy] for wx, wy in level.enemy_route(i)]
+        enemies.append(entry)
+
     payload = {
         "version": 1,
         "name": level.name,
-        "enemies": [[x, y] for (x, y) in level.enemies],
+        "enemies": enemies,
         "grid": [[int(t) for t in row] for row in level.tiles],
     }
 
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
+def _parse_enemy(item: Any, source: Path) -> tuple[int, int, EnemyKind, list[tuple[int, int]]]:
+    """
+    Parse one "enemies" entry: [x,y] or {"x": .., "y": .., "type": .., "route": ..}.
+    """
+    route: list[tuple[int, int]] = []
+    if isinstance(item, dict):
+        raw_x, raw_y = item.get("x"), item.get("y")
+        type_name = str(item.get("type", "random")).lower()
+        if type_name not in ENEMY_TYPE_NAMES:
+            raise LevelIOError(
+                f"Invalid enemy type in {source}: {item!r}. "
+                f"Expected one of {sorted(ENEMY_TYPE_NAMES)}."
+            )
+        kind = ENEMY_TYPE_NAMES[type_name]
+        route = _parse_route(item, kind, source)
+    elif isinstance(item, (list, tuple)) and len(item) == 2:
+        raw_x, raw_y = item
+        kind = EnemyKind.RANDOM
+    else:
+        raise LevelIOError(f"Invalid enemy entry in {source}: {item!r}. Expected [x,y].")
+
+    try:
+        return int(raw_x), int(raw_y), kind, route
+    except (TypeError, ValueError) as e:
+        raise LevelIOError(f"Invalid enemy coords in {source}: {item!r}. Expected integers.") from e
+
+
+def _parse_route(item: dict[str, Any], kind: EnemyKind, source: Path) -> list[tuple[int, int]]:
+    """
+    Parse the "route" waypoints of an enemy object (required for patrols only).
+    """
+    raw = item.get("route")
+    if kind != EnemyKind.PATROL:
+        if raw is not None:
+            raise LevelIOError(f'Enemy in {source} has a "route" but is not a patrol: {item!r}')
+        return []
+
+    if not isinstance(raw, list) or not raw:
+        raise LevelIOError(
+            f'Patrol enemy in {source} needs a non-empty "route" of [x,y] waypoints: {item!r}'
+        )
+
+    route: list[tuple[int, int]] = []
+    for point in raw:
+        if not (isinstance(point, (list, tuple)) and len(point) == 2):
+            raise LevelIOError(f"Invalid patrol waypoint in {source}: {point!r}. Expected [x,y].")
+        try:
+            route.append((int(point[0]), int(point[1])))
+        except (TypeError, ValueError) as e:
+            raise LevelIOError(
+                f"Invalid patrol waypoint in {source}: {point!r}. Expected integers."
+            ) from e
+    return route
+
+
 def _validate_required_tiles(level: Level, source: Path) -> None:
     """
     Enforce minimal constraints so levels are playable.
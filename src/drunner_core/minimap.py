@@ -0,0 +1,190 @@
+# src/drunner_core/minimap.py
+
+"""
+Downsampled overview of the whole level, drawn in a screen corner.
+
+The tile layer is built in one bulk operation: Level.tile_bytes() is mapped
+through a per-channel palette (bytes.translate), wrapped with
+pygame.image.frombuffer and scaled down. Fog of war is a per-pixel alpha mask
+that is updated incrementally from the tiles that just came into view. Both
+layers are composited into one cached surface, so a frame costs one blit plus
+a few entity markers whatever the level size.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import pygame
+
+from drunner_core.enemy import Enemy, EnemyPool
+from drunner_core.fov import FogOfWar
+from drunner_core.level import Level
+from drunner_core.player import Player
+from drunner_core.render import (
+    BACKGROUND_COLOR,
+    ENEMY_COLOR,
+    PLAYER_COLOR,
+    TILE_COLORS,
+    enemy_tiles,
+)
+
+VIEW_COLOR = (230, 230, 230)
+BORDER_COLOR = (90, 90, 90)
+
+# Largest number of minimap pixels per tile (small levels are not blown up).
+MAX_PIXELS_PER_TILE = 4
+
+
+def _palette(channel: int) -> bytes:
+    # Tile value -> one color channel (magenta for unknown values, like draw_level).
+    colors = {int(tile): color for tile, color in TILE_COLORS.items()}
+    return bytes(colors.get(v, (255, 0, 255))[channel] for v in range(256))
+
+
+_PALETTE = tuple(_palette(c) for c in range(3))
+
+
+def render_tiles(level: Level, width: int, height: int) -> pygame.Surface:
+    """
+    Level tiles as a width x height surface, one palette lookup per tile.
+    """
+    tiles = level.tile_bytes()
+    rgb = bytearray(3 * len(tiles))
+    for c in range(3):
+        rgb[c::3] = tiles.translate(_PALETTE[c])
+    full = pygame.image.frombuffer(bytes(rgb), (level.width, level.height), "RGB")
+    return pygame.transform.scale(full, (width, height))
+
+
+class Minimap:
+    """
+    Cached minimap anchored to the top-right corner of the screen.
+
+    A minimap pixel counts as explored once any tile it covers was seen.
+    """
+
+    def __init__(self, max_size: int = 160, margin: int = 8) -> None:
+        self.max_size = max_size
+        self.margin = margin
+
+        self._level: Level | None = None
+        self._revision = -1
+        self._size = (0, 0)
+        self._tiles: pygame.Surface | None = None
+
+        # Fog: alpha per minimap pixel (255 = unexplored), the FogOfWar it
+        # mirrors and the FogOfWar.version it was last synced to.
+        self._unexplored = bytearray()
+        self._fog: FogOfWar | None = None
+        self._fog_version = -1
+
+        self._surface: pygame.Surface | None = None
+        self._markers: tuple[object, ...] | None = None
+
+    def size_for(self, level: Level) -> tuple[int, int]:
+        """
+        Minimap size in pixels for level (longest edge at most max_size).
+        """
+        scale = min(self.max_size / max(level.width, level.height), MAX_PIXELS_PER_TILE)
+        return max(1, int(level.width * scale)), max(1, int(level.height * scale))
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        level: Level,
+        player: Player,
+        enemies: Iterable[Enemy] | EnemyPool,
+        fog: FogOfWar | None = None,
+        view: tuple[int, int, int, int] | None = None,
+    ) -> tuple[pygame.Rect, bool]:
+        """
+        Blit the minimap with player, enemy and view markers.
+
+        Enemies are shown where the player can see them (fog), or inside view
+        (the camera's tile range) without fog. Returns the minimap rect and
+        whether anything in it changed since the last call.
+        """
+        surface, changed = self._sync(level, fog)
+        mw, mh = self._size
+        rect = pygame.Rect(screen.get_width() - mw - self.margin, self.margin, mw, mh)
+        screen.blit(surface, rect)
+
+        def to_px(x: int, y: int) -> tuple[int, int]:
+            return rect.x + x * mw // level.width, rect.y + y * mh // level.height
+
+        # Enemies come from a bounded tile range, never the whole pool.
+        if fog is not None:
+            r = fog.fov.radius
+            area = (player.x - r, player.y - r, player.x + r, player.y + r)
+            seen = [p for p in enemy_tiles(enemies, area) if fog.visible.is_set(*p)]
+        else:
+            seen = list(enemy_tiles(enemies, view)) if view is not None else []
+        enemy_px = sorted({to_px(x, y) for x, y in seen})
+        player_px = to_px(player.x, player.y)
+
+        view_rect = None
+        if view is not None:
+            x0, y0 = to_px(view[0], view[1])
+            x1, y1 = to_px(view[2] + 1, view[3] + 1)
+            view_rect = pygame.Rect(x0, y0, max(1, x1 - x0), max(1, y1 - y0))
+            pygame.draw.rect(screen, VIEW_COLOR, view_rect, width=1)
+        for px, py in enemy_px:
+            screen.fill(ENEMY_COLOR, (px - 1, py - 1, 2, 2))
+        screen.fill(PLAYER_COLOR, (player_px[0] - 1, player_px[1] - 1, 3, 3))
+        pygame.draw.rect(screen, BORDER_COLOR, rect.inflate(2, 2), width=1)
+
+        markers = (player_px, tuple(enemy_px), view_rect and tuple(view_rect))
+        changed = changed or markers != self._markers
+        self._markers = markers
+        # Markers may poke one pixel outside the map; the border covers that.
+        return rect.inflate(4, 4), changed
+
+    def _sync(self, level: Level, fog: FogOfWar | None) -> tuple[pygame.Surface, bool]:
+        """
+        Bring the cached layers up to date; return the composited surface and
+        whether it was rebuilt.
+        """
+        dirty = False
+        if self._tiles is None or self._level is not level or self._revision != level.revision:
+            self._size = self.size_for(level)
+            self._tiles = render_tiles(level, *self._size)
+            if self._level is not level:
+                self._fog = None  # force a fog rebuild for the new level
+            self._level = level
+            self._revision = level.revision
+            dirty = True
+
+        if fog is not None and (self._fog is not fog or self._fog_version != fog.version):
+            self._sync_fog(level, fog)
+            dirty = True
+
+        if dirty or self._surface is None:
+            surface = self._tiles.copy()
+            if fog is not None:
+                mw, mh = self._size
+                rgba = bytearray(4 * mw * mh)
+                for c in range(3):
+                    rgba[c::4] = bytes([BACKGROUND_COLOR[c]]) * (mw * mh)
+                rgba[3::4] = self._unexplored
+                surface.blit(pygame.image.frombuffer(bytes(rgba), (mw, mh), "RGBA"), (0, 0))
+            self._surface = surface
+            return surface, True
+        return self._surface, False
+
+    def _sync_fog(self, level: Level, fog: FogOfWar) -> None:
+        mw, mh = self._size
+        w, h = level.width, level.height
+        if self._fog is fog and fog.version == self._fog_version + 1:
+            # One FOV update since the last sync: only its tiles became explored.
+            indices: Iterable[int] = fog.visible_indices
+        else:
+            self._unexplored = bytearray(b"\xff") * (mw * mh)
+            indices = fog.explored.indices()
+
+        unexplored = self._unexplored
+        for i in indices:
+            y, x = divmod(i, w)
+            unexplored[(y * mh // h) * mw + x * mw // w] = 0
+        self._fog = fog
+        self._fog_version = fog.version
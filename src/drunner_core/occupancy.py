@@ -0,0 +1,172 @@
+# src/drunner_core/occupancy.py
+
+"""
+Spatial hash of enemy positions keyed by tile index.
+
+The index is maintained by enemy moves, so "is there an enemy on (x, y)?" is an
+O(1) lookup instead of a scan over all enemies. It also remembers which tile
+edges enemies crossed during the current tick, which lets the game detect a
+player and an enemy swapping places (they never share a tile at the end of the
+tick, but they did run into each other).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+
+class OccupancyGrid:
+    """
+    Enemy count per tile (flat array, index = y * width + x).
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.counts = array("I", [0]) * (width * height)
+
+        # Tile-index edges (from * size + to) moved along since begin_tick():
+        # single moves in a set, batches kept as recorded (searched on demand).
+        self._crossed: set[int] = set()
+        self._crossed_batches: list[Sequence[int]] = []
+
+    @classmethod
+    def from_positions(
+        cls, width: int, height: int, positions: Iterable[tuple[int, int]]
+    ) -> OccupancyGrid:
+        """
+        Build an index for the given enemy positions.
+        """
+        grid = cls(width, height)
+        for x, y in positions:
+            grid.add(x, y)
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Flat tile index of (x, y).
+        """
+        return y * self.width + x
+
+    def count(self, x: int, y: int) -> int:
+        """
+        Number of enemies on (x, y); 0 outside the grid.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return 0
+        return self.counts[y * self.width + x]
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        """
+        Return True if at least one enemy stands on (x, y).
+        """
+        return self.count(x, y) > 0
+
+    def occupied_in(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[tuple[int, int]]:
+        """
+        Yield each occupied (x, y) in the inclusive tile rectangle, row by row.
+
+        Only the rectangle's rows are read, so the cost depends on its area and
+        not on how many enemies exist elsewhere.
+        """
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.width - 1), min(y1, self.height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+        counts = self.counts
+        for y in range(y0, y1 + 1):
+            row = y * self.width
+            span = counts[row + x0 : row + x1 + 1]
+            if not any(span):
+                continue
+            for dx, n in enumerate(span):
+                if n:
+                    yield x0 + dx, y
+
+    def add(self, x: int, y: int) -> None:
+        """
+        Register an enemy on (x, y).
+        """
+        self.counts[y * self.width + x] += 1
+
+    def remove(self, x: int, y: int) -> None:
+        """
+        Unregister an enemy from (x, y).
+        """
+        i = y * self.width + x
+        if self.counts[i] == 0:
+            raise ValueError(f"No enemy registered at ({x},{y})")
+        self.counts[i] -= 1
+
+    def move(self, from_index: int, to_index: int) -> None:
+        """
+        Move one enemy between tile indices and remember the crossed edge.
+        """
+        self.counts[from_index] -= 1
+        self.counts[to_index] += 1
+        self._crossed.add(from_index * len(self.counts) + to_index)
+
+    def record_moves(self, edges: Sequence[int]) -> None:
+        """
+        Remember already-applied moves, encoded as from_index * size + to_index.
+
+        The batch is stored as is (a list or NumPy array), so recording costs
+        nothing per move; crossed() scans batches instead.
+        """
+        self._crossed_batches.append(edges)
+
+    def begin_tick(self) -> None:
+        """
+        Forget the edges crossed during the previous tick.
+        """
+        self._crossed.clear()
+        self._crossed_batches.clear()
+
+    def has_moves(self) -> bool:
+        """
+        Return True if any move was recorded since begin_tick().
+        """
+        return bool(self._crossed) or any(len(batch) for batch in self._crossed_batches)
+
+    def crossed(self, from_xy: tuple[int, int], to_xy: tuple[int, int]) -> bool:
+        """
+        Return True if an enemy moved from from_xy to to_xy since begin_tick().
+        """
+        a = self.index(*from_xy)
+        b = self.index(*to_xy)
+        edge = a * len(self.counts) + b
+        return edge in self._crossed or any(edge in batch for batch in self._crossed_batches)
+
+    def moves_in(self, x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int, int, int]]:
+        """
+        (from_x, from_y, to_x, to_y) of moves since begin_tick() that start or
+        end inside the inclusive tile rectangle.
+
+        NumPy batches are filtered with array ops before anything is decoded,
+        so a frame pays per move in the rectangle, not per move on the map.
+        """
+        size = len(self.counts)
+        rect = (self.width, x0, y0, x1, y1)
+        found: list[int] = [
+            e for e in self._crossed if _in_rect(e // size, *rect) or _in_rect(e % size, *rect)
+        ]
+        for edges in self._crossed_batches:
+            if isinstance(edges, list):
+                found.extend(
+                    e for e in edges if _in_rect(e // size, *rect) or _in_rect(e % size, *rect)
+                )
+            else:
+                hit = _in_rect(edges // size, *rect) | _in_rect(edges % size, *rect)
+                found.extend(edges[hit].tolist())
+
+        w = self.width
+        return [(f % w, f // w, t % w, t // w) for f, t in (divmod(e, size) for e in found)]
+
+
+def _in_rect(index: Any, width: int, x0: int, y0: int, x1: int, y1: int) -> Any:
+    # Works on ints and elementwise on NumPy arrays (hence & rather than and).
+    x = index % width
+    y = index // width
+    return (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
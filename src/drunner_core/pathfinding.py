@@ -0,0 +1,456 @@
+# src/drunner_core/pathfinding.py
+
+"""
+Path queries on a Level: flat A* and hierarchical HPA* for very large maps.
+
+HierarchicalPathfinder splits the grid into square clusters and precomputes an
+abstract graph whose nodes are entrance tiles on cluster borders. Intra-cluster
+edges hold BFS distances, and inter-cluster edges join the two tiles of each
+entrance. A long query searches this small graph and then refines each hop with
+an A* bounded to one cluster, so tile-level work stays near the path.
+Tile changes only rebuild the clusters that contain them (update_tiles).
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+
+from drunner_core.level import Level
+
+# Entrances of at least this many tiles get a transition at both ends
+# instead of one in the middle (as in the original HPA* paper).
+WIDE_ENTRANCE = 6
+
+# Cluster bounds (x0, y0, x1, y1), inclusive.
+_Bounds = tuple[int, int, int, int]
+
+
+def astar(
+    grid: bytearray | bytes,
+    stride: int,
+    start: int,
+    goal: int,
+    bounds: _Bounds | None = None,
+) -> list[int] | None:
+    """
+    4-way A* on a padded walkability grid (see Level.walkable_grid()).
+
+    start/goal are padded indices; bounds optionally restricts the search to a
+    tile rectangle. Returns the indices from start to goal, or None.
+    """
+    if start == goal:
+        return [start]
+
+    gx, gy = goal % stride, goal // stride
+    offsets = (1, -1, stride, -stride)
+
+    g_cost = {start: 0}
+    parent: dict[int, int] = {}
+    open_heap = [(abs(start % stride - gx) + abs(start // stride - gy), 0, start)]
+
+    while open_heap:
+        _f, g, u = heapq.heappop(open_heap)
+        if u == goal:
+            path = [u]
+            while u in parent:
+                u = parent[u]
+                path.append(u)
+            path.reverse()
+            return path
+        if g > g_cost[u]:
+            continue  # stale entry
+
+        ng = g + 1
+        for off in offsets:
+            v = u + off
+            if not grid[v]:
+                continue
+            vx, vy = v % stride, v // stride
+            if bounds is not None and not (
+                bounds[0] <= vx - 1 <= bounds[2] and bounds[1] <= vy - 1 <= bounds[3]
+            ):
+                continue
+            if ng < g_cost.get(v, ng + 1):
+                g_cost[v] = ng
+                parent[v] = u
+                heapq.heappush(open_heap, (ng + abs(vx - gx) + abs(vy - gy), ng, v))
+    return None
+
+
+def find_path_astar(
+    level: Level, start: tuple[int, int], goal: tuple[int, int]
+) -> list[tuple[int, int]] | None:
+    """
+    Flat A* over every tile (the baseline HPA* is measured against).
+    """
+    if not (level.is_walkable(*start) and level.is_walkable(*goal)):
+        return None
+    grid, stride = level.walkable_grid()
+    s = (start[1] + 1) * stride + start[0] + 1
+    g = (goal[1] + 1) * stride + goal[0] + 1
+    path = astar(grid, stride, s, g)
+    if path is None:
+        return None
+    return [(i % stride - 1, i // stride - 1) for i in path]
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* over a Level, with clusters of cluster_size x cluster_size tiles.
+
+    Keep it in sync with tile changes by calling update_tiles() after
+    Level.set_tile(); if the level changed without that, the next query
+    rebuilds the whole graph.
+    """
+
+    def __init__(self, level: Level, cluster_size: int = 16, segment_cache: int = 4096) -> None:
+        if cluster_size < 2:
+            raise ValueError(f"cluster_size must be >= 2, got {cluster_size}")
+        self.level = level
+        self.cluster_size = cluster_size
+
+        # LRU of refined entrance-to-entrance hops (shared by many queries).
+        self.segment_cache = segment_cache
+        self._segments: OrderedDict[tuple[int, int], list[tuple[int, int]]] = OrderedDict()
+        self._cols = (level.width + cluster_size - 1) // cluster_size
+        self._rows = (level.height + cluster_size - 1) // cluster_size
+        self.build()
+
+    @property
+    def node_count(self) -> int:
+        """
+        Number of entrance nodes in the abstract graph.
+        """
+        return len(self._adj)
+
+    def build(self) -> None:
+        """
+        (Re)build the abstract graph for the whole level.
+        """
+        self._grid, self._stride = self.level.walkable_grid()
+        self._revision = self.level.revision
+        self._segments.clear()
+
+        # Abstract graph keyed by padded tile index: node -> {neighbour: cost}.
+        self._adj: dict[int, dict[int, int]] = {}
+        self._cluster_nodes: list[set[int]] = [set() for _ in range(self._cols * self._rows)]
+
+        # Entrance transitions per border (cluster_a, cluster_b), and how many
+        # transitions use each node (corner tiles can serve two borders).
+        self._links: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        self._refs: dict[int, int] = {}
+
+        for c in range(len(self._cluster_nodes)):
+            for other in self._forward_neighbours(c):
+                self._build_border(c, other)
+        for c in range(len(self._cluster_nodes)):
+            self._connect_cluster(c)
+
+    def update_tiles(self, positions: Iterable[tuple[int, int]]) -> None:
+        """
+        Refresh the graph after the given tiles changed (e.g. via Level.set_tile).
+
+        Only the clusters containing those tiles and their neighbours are redone.
+        """
+        dirty: set[int] = set()
+        stride = self._stride
+        for x, y in positions:
+            self._grid[(y + 1) * stride + x + 1] = 1 if self.level.is_walkable(x, y) else 0
+            dirty.add(self._cluster_of(x, y))
+
+        borders = {tuple(sorted((c, n))) for c in dirty for n in self._all_neighbours(c)}
+        for a, b in sorted(borders):
+            self._build_border(a, b)
+
+        touched = dirty | {n for c in dirty for n in self._all_neighbours(c)}
+        for c in sorted(touched):
+            self._connect_cluster(c)
+        self._segments.clear()
+        self._revision = self.level.revision
+
+    def find_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[tuple[int, int]] | None:
+        """
+        Return the tile path from start to goal (both included), or None.
+
+        Near-optimal: the route is optimal on the abstract graph, refined hop by
+        hop inside clusters.
+        """
+        hops = self.find_abstract_path(start, goal)
+        if hops is None:
+            return None
+        return list(self._walk(hops))
+
+    def iter_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> Iterator[tuple[int, int]] | None:
+        """
+        Like find_path(), but each hop is refined only when the iterator gets to
+        it. An entity that replans often only pays for the tiles it walks.
+        """
+        hops = self.find_abstract_path(start, goal)
+        if hops is None:
+            return None
+        return self._walk(hops)
+
+    def find_abstract_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[tuple[int, int]] | None:
+        """
+        Return the waypoints (start, entrance tiles..., goal) of a path, or None.
+
+        Consecutive waypoints are adjacent or in the same cluster; refine() turns
+        each pair into tiles, so callers can refine lazily as an entity walks.
+        """
+        if self._revision != self.level.revision:
+            self.build()
+        if not (self.level.is_walkable(*start) and self.level.is_walkable(*goal)):
+            return None
+        if start == goal:
+            return [start]
+
+        stride = self._stride
+        s = (start[1] + 1) * stride + start[0] + 1
+        g = (goal[1] + 1) * stride + goal[0] + 1
+        s_cluster = self._cluster_of(*start)
+        g_cluster = self._cluster_of(*goal)
+
+        if s_cluster == g_cluster:
+            local = astar(self._grid, stride, s, g, self._bounds(s_cluster))
+            if local is not None:
+                return [start, goal]
+
+        # Temporary edges: start -> its cluster's entrances, entrances -> goal.
+        s_edges = self._cluster_distances(s, s_cluster)
+        g_edges = self._cluster_distances(g, g_cluster)
+        nodes = self._search(s, g, s_edges, g_edges)
+        if nodes is None:
+            return None
+        return [(i % stride - 1, i // stride - 1) for i in nodes]
+
+    def refine(self, a: tuple[int, int], b: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Tile path between consecutive waypoints (adjacent or in one cluster).
+        """
+        if abs(a[0] - b[0]) + abs(a[1] - b[1]) <= 1:
+            return [a] if a == b else [a, b]
+
+        stride = self._stride
+        ia = (a[1] + 1) * stride + a[0] + 1
+        ib = (b[1] + 1) * stride + b[0] + 1
+        key = (ia, ib)
+        cached = self._segments.get(key)
+        if cached is not None:
+            self._segments.move_to_end(key)
+            return cached
+
+        path = astar(
+            self._grid,
+            stride,
+            ia,
+            ib,
+            self._bounds(self._cluster_of(*a)),
+        )
+        if path is None:
+            raise ValueError(f"Waypoints {a} and {b} are not connected inside one cluster")
+        tiles = [(i % stride - 1, i // stride - 1) for i in path]
+
+        # Only entrance-to-entrance hops repeat across queries.
+        if ia in self._adj and ib in self._adj:
+            self._segments[key] = tiles
+            if len(self._segments) > self.segment_cache:
+                self._segments.popitem(last=False)
+        return tiles
+
+    def _walk(self, hops: list[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+        yield hops[0]
+        for a, b in pairwise(hops):
+            yield from self.refine(a, b)[1:]
+
+    # --- Abstract search ----------------------------------------------------
+
+    def _search(
+        self, s: int, g: int, s_edges: dict[int, int], g_edges: dict[int, int]
+    ) -> list[int] | None:
+        stride = self._stride
+        gx, gy = g % stride, g // stride
+        adj = self._adj
+
+        g_cost = {s: 0}
+        parent: dict[int, int] = {}
+        open_heap = [(0, 0, s)]
+        while open_heap:
+            _f, cost, u = heapq.heappop(open_heap)
+            if u == g:
+                path = [u]
+                while u in parent:
+                    u = parent[u]
+                    path.append(u)
+                path.reverse()
+                return path
+            if cost > g_cost[u]:
+                continue
+
+            edges = adj.get(u, {})
+            if u == s:
+                edges = {**edges, **s_edges}
+            if u in g_edges:
+                edges = {**edges, g: g_edges[u]}
+            for v, w in edges.items():
+                nc = cost + w
+                if nc < g_cost.get(v, nc + 1):
+                    g_cost[v] = nc
+                    parent[v] = u
+                    h = abs(v % stride - gx) + abs(v // stride - gy)
+                    heapq.heappush(open_heap, (nc + h, nc, v))
+        return None
+
+    # --- Graph construction -------------------------------------------------
+
+    def _build_border(self, a: int, b: int) -> None:
+        """
+        Recreate the entrance transitions between adjacent clusters a < b.
+        """
+        for na, nb in self._links.pop((a, b), []):
+            self._adj[na].pop(nb, None)
+            self._adj[nb].pop(na, None)
+            self._unref(na, a)
+            self._unref(nb, b)
+
+        grid, stride = self._grid, self._stride
+        ax0, ay0, ax1, ay1 = self._bounds(a)
+        if b == a + 1 and b % self._cols:
+            # Vertical border: column ax1 (in a) faces ax1 + 1 (in b).
+            pairs = [
+                ((y + 1) * stride + ax1 + 1, (y + 1) * stride + ax1 + 2)
+                for y in range(ay0, ay1 + 1)
+            ]
+        else:
+            # Horizontal border: row ay1 (in a) faces ay1 + 1 (in b).
+            pairs = [
+                ((ay1 + 1) * stride + x + 1, (ay1 + 2) * stride + x + 1)
+                for x in range(ax0, ax1 + 1)
+            ]
+
+        links: list[tuple[int, int]] = []
+        run: list[tuple[int, int]] = []
+        for pa, pb in [*pairs, (0, 0)]:  # sentinel closes the last run
+            if grid[pa] and grid[pb]:
+                run.append((pa, pb))
+                continue
+            if run:
+                if len(run) >= WIDE_ENTRANCE:
+                    links.extend((run[0], run[-1]))
+                else:
+                    links.append(run[len(run) // 2])
+                run = []
+
+        for na, nb in links:
+            self._ref(na, a)
+            self._ref(nb, b)
+            self._adj[na][nb] = 1
+            self._adj[nb][na] = 1
+        self._links[(a, b)] = links
+
+    def _connect_cluster(self, c: int) -> None:
+        """
+        Recompute intra-cluster edges (BFS distances) between c's entrances.
+        """
+        nodes = self._cluster_nodes[c]
+        for n in nodes:
+            edges = self._adj[n]
+            for m in [m for m in edges if m in nodes]:
+                del edges[m]
+
+        for n in nodes:
+            dist = self._cluster_distances(n, c)
+            for m, d in dist.items():
+                if m != n:
+                    self._adj[n][m] = d
+
+    def _cluster_distances(self, src: int, c: int) -> dict[int, int]:
+        """
+        BFS from padded index src inside cluster c; distances to c's entrances.
+        """
+        nodes = self._cluster_nodes[c]
+        if not nodes:
+            return {}
+
+        grid, stride = self._grid, self._stride
+        x0, y0, x1, y1 = self._bounds(c)
+        offsets = (1, -1, stride, -stride)
+
+        found: dict[int, int] = {}
+        seen = {src}
+        queue = deque([(src, 0)])
+        while queue:
+            u, d = queue.popleft()
+            if u in nodes:
+                found[u] = d
+                if len(found) == len(nodes):
+                    break
+            for off in offsets:
+                v = u + off
+                if v in seen or not grid[v]:
+                    continue
+                vx, vy = v % stride - 1, v // stride - 1
+                if x0 <= vx <= x1 and y0 <= vy <= y1:
+                    seen.add(v)
+                    queue.append((v, d + 1))
+        return found
+
+    def _ref(self, node: int, c: int) -> None:
+        self._refs[node] = self._refs.get(node, 0) + 1
+        self._adj.setdefault(node, {})
+        self._cluster_nodes[c].add(node)
+
+    def _unref(self, node: int, c: int) -> None:
+        left = self._refs[node] - 1
+        if left:
+            self._refs[node] = left
+            return
+        del self._refs[node]
+        for m in self._adj.pop(node):
+            self._adj[m].pop(node, None)
+        self._cluster_nodes[c].discard(node)
+
+    # --- Cluster geometry ---------------------------------------------------
+
+    def _cluster_of(self, x: int, y: int) -> int:
+        return (y // self.cluster_size) * self._cols + x // self.cluster_size
+
+    def _bounds(self, c: int) -> _Bounds:
+        size = self.cluster_size
+        cx, cy = c % self._cols, c // self._cols
+        x0, y0 = cx * size, cy * size
+        return (
+            x0,
+            y0,
+            min(x0 + size, self.level.width) - 1,
+            min(y0 + size, self.level.height) - 1,
+        )
+
+    def _forward_neighbours(self, c: int) -> list[int]:
+        """
+        Right and lower neighbour clusters (each border is visited once).
+        """
+        cx, cy = c % self._cols, c // self._cols
+        out = []
+        if cx + 1 < self._cols:
+            out.append(c + 1)
+        if cy + 1 < self._rows:
+            out.append(c + self._cols)
+        return out
+
+    def _all_neighbours(self, c: int) -> list[int]:
+        cx, cy = c % self._cols, c // self._cols
+        out = self._forward_neighbours(c)
+        if cx > 0:
+            out.append(c - 1)
+        if cy > 0:
+            out.append(c - self._cols)
+        return out
@@ -0,0 +1,107 @@
+# src/drunner_core/patrol.py
+
+"""
+Patrol routes: waypoints from level JSON expanded once into tile-by-tile loops.
+
+Every route is a closed loop spawn -> waypoint 1 -> ... -> waypoint n -> spawn.
+Shortest paths between consecutive waypoints are resolved at load time, so a
+patrolling enemy only advances an index into a flat coordinate table per move.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from drunner_core.flowfield import FlowField
+from drunner_core.level import Level
+
+
+class RouteError(ValueError):
+    """
+    Raised when a patrol route has a non-walkable or unreachable waypoint.
+    """
+
+
+def expand_route(
+    level: Level, start: tuple[int, int], waypoints: Sequence[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """
+    Return every tile of the closed loop start -> waypoints -> start.
+
+    The loop begins with start and does not repeat it at the end. Paths are
+    4-way shortest paths (ties broken like FlowField.next_step).
+    """
+    stops = [tuple(start), *(tuple(p) for p in waypoints)]
+    for x, y in stops:
+        if not level.is_walkable(x, y):
+            raise RouteError(f"Patrol waypoint is not walkable: ({x},{y})")
+
+    field = FlowField(level)
+    loop: list[tuple[int, int]] = [stops[0]]
+    for i in range(len(stops)):
+        src = stops[i]
+        dst = stops[(i + 1) % len(stops)]
+        if src == dst:
+            continue
+
+        field.retarget(*dst)
+        if field.distance(*src) is None:
+            raise RouteError(f"Patrol waypoint ({dst[0]},{dst[1]}) unreachable from {src}")
+
+        x, y = src
+        while (x, y) != dst:
+            dx, dy = field.next_step(x, y)
+            x, y = x + dx, y + dy
+            loop.append((x, y))
+
+    if len(loop) > 1:
+        loop.pop()  # back at start
+    return loop
+
+
+class PatrolTable:
+    """
+    Expanded routes of all enemies of a level, packed into flat int arrays.
+
+    Route i occupies xs/ys[offsets[i] : offsets[i] + lengths[i]]; length 0 means
+    the enemy has no route.
+    """
+
+    def __init__(self) -> None:
+        self.xs = array("i")
+        self.ys = array("i")
+        self.offsets = array("I")
+        self.lengths = array("I")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @classmethod
+    def from_level(cls, level: Level) -> PatrolTable:
+        """
+        Expand the waypoints in level.enemy_routes (raises RouteError).
+        """
+        table = cls()
+        for i, start in enumerate(level.enemies):
+            waypoints = level.enemy_routes[i] if level.enemy_routes else []
+            table.append(expand_route(level, start, waypoints) if waypoints else [])
+        return table
+
+    def append(self, loop: Sequence[tuple[int, int]]) -> None:
+        """
+        Add one expanded loop (empty for an enemy without a route).
+        """
+        self.offsets.append(len(self.xs))
+        self.lengths.append(len(loop))
+        for x, y in loop:
+            self.xs.append(x)
+            self.ys.append(y)
+
+    def route(self, index: int) -> list[tuple[int, int]]:
+        """
+        Expanded loop of enemy index (empty if it has none).
+        """
+        a = self.offsets[index]
+        b = a + self.lengths[index]
+        return list(zip(self.xs[a:b], self.ys[a:b], strict=True))
@@ -0,0 +1,214 @@
+# src/drunner_core/profiler.py
+
+"""
+Per-phase frame timing for the game loop.
+
+The loop calls mark(phase) after each phase; the time since the previous mark
+is charged to that phase (phases run several times per frame, such as
+simulation ticks, add up). Each finished frame feeds two structures per phase:
+
+- a ring buffer of the last `window` frames (rolling p50/p95/p99 for the overlay)
+- a log-bucketed histogram of the whole run (constant memory, for the summary)
+
+The summary also reports the achieved frame rate and the process CPU time
+spent between the first and the last frame.
+
+Recording costs one perf_counter_ns() call per mark and a few integer ops per
+phase per frame.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from time import perf_counter_ns, process_time_ns
+from typing import Any
+
+# Phases of one run_game frame, in loop order.
+PHASES = ("wait", "events", "input", "enemies", "rules", "render", "flip")
+
+FRAME = "frame"
+
+_NS_PER_MS = 1_000_000
+
+# LatencyHistogram: values below 2**_SUB_BITS + 1 get their own bucket, larger
+# ones keep _SUB_BITS bits of mantissa (relative bucket width <= 1/8).
+_SUB_BITS = 3
+_SUB = 1 << _SUB_BITS
+
+
+class LatencyHistogram:
+    """
+    Histogram of non-negative nanosecond durations with log-spaced buckets.
+    """
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        self.buckets: list[int] = []
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        """
+        Add one duration.
+        """
+        idx = _bucket(ns)
+        buckets = self.buckets
+        if idx >= len(buckets):
+            buckets.extend([0] * (idx + 1 - len(buckets)))
+        buckets[idx] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, q: float) -> int:
+        """
+        Approximate q-th percentile (0..100) in ns (bucket midpoint, clamped to max).
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * q // 100))
+        seen = 0
+        for idx, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                lo, hi = _bucket_bounds(idx)
+                return min((lo + hi) // 2, self.max)
+        return self.max  # pragma: no cover
+
+    def mean(self) -> float:
+        """
+        Mean duration in ns (0.0 if empty).
+        """
+        return self.total / self.count if self.count else 0.0
+
+
+def _bucket(ns: int) -> int:
+    if ns < 2 * _SUB:
+        return max(ns, 0)
+    shift = ns.bit_length() - _SUB_BITS - 1
+    return shift * _SUB + (ns >> shift)
+
+
+def _bucket_bounds(idx: int) -> tuple[int, int]:
+    # Inclusive lower bound, exclusive upper bound of bucket idx.
+    if idx < 2 * _SUB:
+        return idx, idx + 1
+    shift = idx // _SUB - 1
+    lo = (idx % _SUB + _SUB) << shift
+    return lo, lo + (1 << shift)
+
+
+class FrameProfiler:
+    """
+    Times named phases of each frame (see module docstring).
+    """
+
+    def __init__(self, phases: Iterable[str] = PHASES, window: int = 600) -> None:
+        if window <= 0:
+            raise ValueError(f"Profiler window must be positive, got {window}")
+        self.phases = tuple(phases)
+        self.window = window
+        self.frames = 0
+
+        names = (*self.phases, FRAME)
+        self._current = dict.fromkeys(self.phases, 0)
+        self._recent = {name: array("q", bytes(8 * window)) for name in names}
+        self._histograms = {name: LatencyHistogram() for name in names}
+        self._frame_start = 0
+        self._last = 0
+
+        # Wall and CPU clocks at the first begin_frame() and the last end_frame().
+        self._run_start: tuple[int, int] | None = None
+        self._run_end: tuple[int, int] | None = None
+
+    def begin_frame(self) -> None:
+        """
+        Start timing a frame.
+        """
+        self._frame_start = self._last = perf_counter_ns()
+        if self._run_start is None:
+            self._run_start = (self._frame_start, process_time_ns())
+
+    def mark(self, phase: str) -> None:
+        """
+        Charge the time since the previous mark (or begin_frame) to phase.
+        """
+        now = perf_counter_ns()
+        self._current[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """
+        Finish the frame and record its phase totals.
+        """
+        slot = self.frames % self.window
+        current = self._current
+        for phase in self.phases:
+            ns = current[phase]
+            self._recent[phase][slot] = ns
+            self._histograms[phase].record(ns)
+            current[phase] = 0
+
+        total = self._last - self._frame_start
+        self._recent[FRAME][slot] = total
+        self._histograms[FRAME].record(total)
+        self.frames += 1
+        self._run_end = (self._last, process_time_ns())
+
+    def last(self, name: str) -> int:
+        """
+        Time in ns of phase name (or FRAME) in the last finished frame (0 if none).
+        """
+        if not self.frames:
+            return 0
+        return self._recent[name][(self.frames - 1) % self.window]
+
+    def recent(self, name: str, q: float) -> float:
+        """
+        q-th percentile in ms of phase name (or FRAME) over the last window frames.
+        """
+        n = min(self.frames, self.window)
+        if not n:
+            return 0.0
+        values = sorted(self._recent[name][:n])
+        return values[min(n - 1, int(n * q / 100))] / _NS_PER_MS
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """
+        Whole-run histogram of phase name (or FRAME).
+        """
+        return self._histograms[name]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Whole-run stats: {"frames": n, "seconds": wall, "fps": achieved,
+        "cpu_seconds": process CPU, "phases": {name: {"p50_ms": ..., ...}}}.
+
+        Phases are in loop order followed by FRAME (the whole frame).
+        """
+        seconds = cpu_seconds = 0.0
+        if self._run_start is not None and self._run_end is not None:
+            seconds = (self._run_end[0] - self._run_start[0]) / 1e9
+            cpu_seconds = (self._run_end[1] - self._run_start[1]) / 1e9
+
+        phases: dict[str, dict[str, float]] = {}
+        for name in (*self.phases, FRAME):
+            h = self._histograms[name]
+            phases[name] = {
+                "mean_ms": round(h.mean() / _NS_PER_MS, 3),
+                "p50_ms": round(h.percentile(50) / _NS_PER_MS, 3),
+                "p95_ms": round(h.percentile(95) / _NS_PER_MS, 3),
+                "p99_ms": round(h.percentile(99) / _NS_PER_MS, 3),
+                "max_ms": round(h.max / _NS_PER_MS, 3),
+            }
+        return {
+            "frames": self.frames,
+            "seconds": round(seconds, 3),
+            "fps": round(self.frames / seconds, 2) if seconds > 0 else 0.0,
+            "cpu_seconds": round(cpu_seconds, 3),
+            "phases": phases,
+        }
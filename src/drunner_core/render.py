@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 import pygame
 
-from drunner_core.enemy import Enemy
+from drunner_core.enemy import Enemy, EnemyPool
+from drunner_core.fov import FogOfWar, TileBitset
 from drunner_core.level import Level, Tile
 from drunner_core.player import Player
+from drunner_core.profiler import FRAME, FrameProfiler
+from drunner_core.sprites import SpriteAtlas
 
 
 @dataclass(frozen=True)
@@ -41,64 +46,618 @@ def compute_render_params(level: Level, window_width: int, window_height: int) -
     return RenderParams(tile_size=tile_size, offset_x=offset_x, offset_y=offset_y)
 
 
-def draw_level(surface: pygame.Surface, level: Level, params: RenderParams) -> None:
+def tile_range(
+    width: int, height: int, params: RenderParams, view_width: int, view_height: int
+) -> tuple[int, int, int, int]:
     """
-    Draw the level grid using filled rectangles.
+    Inclusive (x0, y0, x1, y1) of the tiles of a width x height grid that land
+    inside a view_width x view_height surface. Empty (x0 > x1) if none do.
     """
-    # Basic palette (rects only; sprites come later if you want)
-    colors: dict[Tile, tuple[int, int, int]] = {
-        Tile.FLOOR: (40, 40, 40),
-        Tile.WALL: (110, 110, 110),
-        Tile.START: (40, 140, 40),
-        Tile.EXIT: (140, 40, 40),
-    }
+    x0, y0, x1, y1 = _view_tiles(params, view_width, view_height)
+    return max(0, x0), max(0, y0), min(width - 1, x1), min(height - 1, y1)
 
+
+def _view_tiles(
+    params: RenderParams, view_width: int, view_height: int
+) -> tuple[int, int, int, int]:
+    # Unclamped tile range covered by the view.
+    ts = params.tile_size
+    return (
+        -params.offset_x // ts,
+        -params.offset_y // ts,
+        (view_width - 1 - params.offset_x) // ts,
+        (view_height - 1 - params.offset_y) // ts,
+    )
+
+
+# Basic palette (rects only; sprites come later if you want)
+TILE_COLORS: dict[Tile, tuple[int, int, int]] = {
+    Tile.FLOOR: (40, 40, 40),
+    Tile.WALL: (110, 110, 110),
+    Tile.START: (40, 140, 40),
+    Tile.EXIT: (140, 40, 40),
+}
+
+BACKGROUND_COLOR = (20, 20, 20)
+PLAYER_COLOR = (220, 220, 80)
+ENEMY_COLOR = (200, 60, 60)
+
+# Entity sprite names -> fallback colors (used when the atlas has no sprite).
+ENTITY_COLORS: dict[str, tuple[int, int, int]] = {
+    "player": PLAYER_COLOR,
+    "enemy": ENEMY_COLOR,
+}
+
+# Fog overlay alpha per tile state: unexplored, explored (not visible), visible.
+FOG_ALPHA_UNEXPLORED = 255
+FOG_ALPHA_EXPLORED = 150
+
+# Approximate edge in pixels of one LevelSurfaceCache chunk.
+LEVEL_CHUNK_PX = 512
+
+
+def draw_level(
+    surface: pygame.Surface,
+    level: Level,
+    params: RenderParams,
+    tiles: tuple[int, int, int, int] | None = None,
+    atlas: SpriteAtlas | None = None,
+) -> None:
+    """
+    Draw the level grid using filled rectangles, or the atlas sprite named
+    after the tile (e.g. "wall") where there is one.
+
+    tiles limits drawing to an inclusive (x0, y0, x1, y1) range (default: the
+    whole level). This issues one fill or blit per tile; the game loop blits a
+    LevelSurfaceCache built with it instead of calling it every frame.
+    """
     ts = params.tile_size
     ox = params.offset_x
     oy = params.offset_y
+    x0, y0, x1, y1 = tiles if tiles is not None else (0, 0, level.width - 1, level.height - 1)
 
-    for x, y, tile in level.iter_tiles():
-        rect = pygame.Rect(ox + x * ts, oy + y * ts, ts, ts)
-        color = colors.get(tile, (255, 0, 255))  # magenta = unknown tile
-        pygame.draw.rect(surface, color, rect)
+    sprites: dict[Tile, pygame.Surface | None] = {}
+    for y in range(y0, y1 + 1):
+        row = level.tiles[y]
+        for x in range(x0, x1 + 1):
+            tile = row[x]
+            rect = pygame.Rect(ox + x * ts, oy + y * ts, ts, ts)
+            if atlas is not None:
+                if tile not in sprites:
+                    sprites[tile] = atlas.get(tile.name.lower(), ts)
+                sprite = sprites[tile]
+                if sprite is not None:
+                    surface.fill(BACKGROUND_COLOR, rect)  # under transparent pixels
+                    surface.blit(sprite, rect)
+                    continue
+            color = TILE_COLORS.get(tile, (255, 0, 255))  # magenta = unknown tile
+            surface.fill(color, rect)
 
     # Subtle border around the grid (helps readability)
     border = pygame.Rect(ox, oy, level.width * ts, level.height * ts)
     pygame.draw.rect(surface, (20, 20, 20), border, width=2)
 
 
-def draw_player(surface: pygame.Surface, player: Player, params: RenderParams) -> None:
+class LevelSurfaceCache:
     """
-    Draw the player as a padded rectangle within its tile.
+    The level pre-rendered into chunk Surfaces and blitted each frame.
+
+    The level is split into square chunks of about LEVEL_CHUNK_PX pixels that
+    are rendered the first time they come into view and kept in an LRU. draw()
+    only blits chunks overlapping the target surface, so a camera scrolling over
+    a huge level never renders (or holds) the whole level at once. Chunks are
+    dropped when the level, its tiles (Level.revision) or the tile size change;
+    offsets only move the blits.
     """
-    ts = params.tile_size
-    ox = params.offset_x
-    oy = params.offset_y
 
+    def __init__(self, max_chunks: int = 64, atlas: SpriteAtlas | None = None) -> None:
+        self.max_chunks = max_chunks
+        self.atlas = atlas
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._level: Level | None = None
+        self._key: tuple[int, int] | None = None
+
+    def draw(self, surface: pygame.Surface, level: Level, params: RenderParams) -> None:
+        """
+        Blit the visible part of the level at the render offsets.
+        """
+        ts = params.tile_size
+        key = (level.revision, ts)
+        if self._level is not level or self._key != key:
+            self._chunks.clear()
+            self._level = level
+            self._key = key
+
+        x0, y0, x1, y1 = tile_range(level.width, level.height, params, *surface.get_size())
+        if x0 > x1 or y0 > y1:
+            return
+
+        n = max(1, LEVEL_CHUNK_PX // ts)
+        for cy in range(y0 // n, y1 // n + 1):
+            for cx in range(x0 // n, x1 // n + 1):
+                chunk = self._chunk(level, cx, cy, n, ts)
+                surface.blit(chunk, (params.offset_x + cx * n * ts, params.offset_y + cy * n * ts))
+
+    def _chunk(self, level: Level, cx: int, cy: int, n: int, ts: int) -> pygame.Surface:
+        chunk = self._chunks.get((cx, cy))
+        if chunk is not None:
+            self._chunks.move_to_end((cx, cy))
+            return chunk
+
+        x0, y0 = cx * n, cy * n
+        x1 = min(x0 + n, level.width) - 1
+        y1 = min(y0 + n, level.height) - 1
+        surf = pygame.Surface(((x1 - x0 + 1) * ts, (y1 - y0 + 1) * ts))
+        # Level coordinates shifted so the chunk's first tile lands at (0, 0);
+        # the border falls on the chunks along the level edge.
+        local = RenderParams(tile_size=ts, offset_x=-x0 * ts, offset_y=-y0 * ts)
+        draw_level(surf, level, local, (x0, y0, x1, y1), self.atlas)
+        # Match the display format once so every blit is a plain copy.
+        chunk = surf.convert() if pygame.display.get_surface() else surf
+
+        self._chunks[(cx, cy)] = chunk
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+
+def render_fog(
+    level: Level,
+    fog: FogOfWar,
+    tile_size: int,
+    tiles: tuple[int, int, int, int] | None = None,
+) -> pygame.Surface:
+    """
+    Build the fog overlay as one SRCALPHA surface.
+
+    tiles limits the overlay to an inclusive (x0, y0, x1, y1) range (default:
+    the whole level); the surface's top-left is tile (x0, y0). Alpha is
+    computed per tile from the bitsets (one byte per tile, no per-tile draw
+    calls), then scaled up to the tile size.
+    """
+    x0, y0, x1, y1 = tiles if tiles is not None else (0, 0, level.width - 1, level.height - 1)
+    w, h = x1 - x0 + 1, y1 - y0 + 1
+    explored = fog.explored.expand_region(x0, y0, x1, y1, 1)
+    visible = fog.visible.expand_region(x0, y0, x1, y1, 2)
+    n = len(explored)
+    state = (int.from_bytes(explored, "little") | int.from_bytes(visible, "little")).to_bytes(
+        n, "little"
+    )
+
+    rgba = bytearray(4 * n)
+    rgba[3::4] = state.translate(_FOG_ALPHA)
+    small = pygame.image.frombuffer(bytes(rgba), (w, h), "RGBA")
+    return pygame.transform.scale(small, (w * tile_size, h * tile_size))
+
+
+# Tile state (explored = 1, visible = 3) -> overlay alpha.
+_FOG_ALPHA = bytes(
+    FOG_ALPHA_UNEXPLORED if i == 0 else FOG_ALPHA_EXPLORED if i == 1 else 0 for i in range(256)
+)
+
+
+class FogSurfaceCache:
+    """
+    Cached fog overlay for the tiles in view.
+
+    Rebuilt only when FogOfWar.version, the tile size or the visible tile range
+    (camera scroll) change.
+    """
+
+    def __init__(self) -> None:
+        self._surface: pygame.Surface | None = None
+        self._fog: FogOfWar | None = None
+        self._key: tuple[object, ...] | None = None
+
+    def draw(
+        self, surface: pygame.Surface, level: Level, fog: FogOfWar, params: RenderParams
+    ) -> None:
+        """
+        Blit the fog overlay at the render offsets.
+        """
+        tiles = tile_range(level.width, level.height, params, *surface.get_size())
+        x0, y0, x1, y1 = tiles
+        if x0 > x1 or y0 > y1:
+            return
+
+        key = (fog.version, params.tile_size, tiles)
+        if self._surface is None or self._fog is not fog or self._key != key:
+            self._surface = render_fog(level, fog, params.tile_size, tiles)
+            self._fog = fog
+            self._key = key
+        ts = params.tile_size
+        surface.blit(self._surface, (params.offset_x + x0 * ts, params.offset_y + y0 * ts))
+
+
+def enemy_tiles(
+    enemies: Iterable[Enemy] | EnemyPool, tiles: tuple[int, int, int, int]
+) -> Iterator[tuple[int, int]]:
+    """
+    Enemy positions inside an inclusive tile range.
+
+    An EnemyPool answers from its occupancy index (cost bounded by the range);
+    plain Enemy lists are filtered.
+    """
+    x0, y0, x1, y1 = tiles
+    if isinstance(enemies, EnemyPool):
+        return enemies.positions_in(x0, y0, x1, y1)
+    return ((e.x, e.y) for e in enemies if x0 <= e.x <= x1 and y0 <= e.y <= y1)
+
+
+def _enemy_draw_positions(
+    enemies: Iterable[Enemy] | EnemyPool, tiles: tuple[int, int, int, int], alpha: float
+) -> Iterator[tuple[float, float, int, int]]:
+    """
+    (draw_x, draw_y, tile_x, tile_y) of enemies inside an inclusive tile range.
+
+    With alpha < 1, enemies of an EnemyPool that moved during the last tick are
+    placed alpha of the way from their previous tile to the current one (this
+    includes enemies sliding into or out of the range).
+    """
+    moves = enemies.moves_in(*tiles) if alpha < 1.0 and isinstance(enemies, EnemyPool) else []
+    arriving = {(tx, ty): (fx, fy) for fx, fy, tx, ty in moves}
+    for x, y in enemy_tiles(enemies, tiles):
+        src = arriving.pop((x, y), None)
+        if src is None:
+            yield x, y, x, y
+        else:
+            yield _lerp(src[0], x, alpha), _lerp(src[1], y, alpha), x, y
+
+    # Moved out of the range; still partly visible while sliding.
+    x0, y0, x1, y1 = tiles
+    for (tx, ty), (fx, fy) in arriving.items():
+        if not (x0 <= tx <= x1 and y0 <= ty <= y1):
+            yield _lerp(fx, tx, alpha), _lerp(fy, ty, alpha), tx, ty
+
+
+def _lerp(a: int, b: int, alpha: float) -> float:
+    return a + (b - a) * alpha
+
+
+def _entity_rect(params: RenderParams, x: float, y: float) -> pygame.Rect:
+    """
+    Padded rectangle of an entity at a (possibly fractional) tile position.
+    """
+    ts = params.tile_size
     pad = max(2, ts // 8)
-    rect = pygame.Rect(
-        ox + player.x * ts + pad,
-        oy + player.y * ts + pad,
+    return pygame.Rect(
+        params.offset_x + round(x * ts) + pad,
+        params.offset_y + round(y * ts) + pad,
         ts - 2 * pad,
         ts - 2 * pad,
     )
-    pygame.draw.rect(surface, (220, 220, 80), rect)
 
 
-def draw_enemies(surface: pygame.Surface, enemies: list[Enemy], params: RenderParams) -> None:
+def _draw_entity(
+    surface: pygame.Surface, name: str, rect: pygame.Rect, atlas: SpriteAtlas | None
+) -> None:
     """
-    Draw enemies as padded rectangles within their tiles.
+    Blit the atlas sprite name into rect, or fill rect with its fallback color.
     """
-    ts = params.tile_size
-    ox = params.offset_x
-    oy = params.offset_y
+    sprite = atlas.get(name, rect.width, rect.height) if atlas is not None else None
+    if sprite is not None:
+        surface.blit(sprite, rect)
+    else:
+        pygame.draw.rect(surface, ENTITY_COLORS[name], rect)
 
-    pad = max(2, ts // 8)
-    for e in enemies:
-        rect = pygame.Rect(
-            ox + e.x * ts + pad,
-            oy + e.y * ts + pad,
-            ts - 2 * pad,
-            ts - 2 * pad,
-        )
-        pygame.draw.rect(surface, (200, 60, 60), rect)
+
+def draw_player(
+    surface: pygame.Surface,
+    player: Player,
+    params: RenderParams,
+    prev: tuple[int, int] | None = None,
+    alpha: float = 1.0,
+    atlas: SpriteAtlas | None = None,
+) -> None:
+    """
+    Draw the player as a padded rectangle (or the "player" sprite) within its tile.
+
+    With prev (the tile at the start of the last tick), the player is drawn
+    alpha of the way from prev to its current tile.
+    """
+    x: float = player.x
+    y: float = player.y
+    if prev is not None:
+        x, y = _lerp(prev[0], player.x, alpha), _lerp(prev[1], player.y, alpha)
+    _draw_entity(surface, "player", _entity_rect(params, x, y), atlas)
+
+
+def draw_enemies(
+    surface: pygame.Surface,
+    enemies: Iterable[Enemy] | EnemyPool,
+    params: RenderParams,
+    visible: TileBitset | None = None,
+    alpha: float = 1.0,
+    atlas: SpriteAtlas | None = None,
+) -> None:
+    """
+    Draw enemies as padded rectangles (or "enemy" sprites) within their tiles.
+
+    Only enemies inside the surface are visited. With visible (fog of war),
+    only enemies on visible tiles are drawn. alpha < 1 interpolates enemies that
+    moved during the last tick (see _enemy_draw_positions).
+    """
+    view = _view_tiles(params, *surface.get_size())
+    for x, y, tx, ty in _enemy_draw_positions(enemies, view, alpha):
+        if visible is not None and not visible.is_set(tx, ty):
+            continue
+        _draw_entity(surface, "enemy", _entity_rect(params, x, y), atlas)
+
+
+class DirtyRectRenderer:
+    """
+    Renders only what changed since the previous frame.
+
+    The background (clear color, cached level and fog) is composited once into a
+    screen-sized surface; when the fog changes, only the tiles around the old and
+    new field of view are recomposited. Each frame the entity rects that changed
+    (player or enemy moved, appeared or disappeared), any recomposited area and
+    the entities overlapping them are restored from it and redrawn, and render()
+    returns just those rects for pygame.display.update(). A frame where nothing
+    moved returns no rects at all.
+    """
+
+    def __init__(
+        self,
+        level_cache: LevelSurfaceCache,
+        fog_cache: FogSurfaceCache,
+        atlas: SpriteAtlas | None = None,
+    ) -> None:
+        self.level_cache = level_cache
+        self.fog_cache = fog_cache
+        self.atlas = atlas
+        self._background: pygame.Surface | None = None
+        self._bg_key: tuple[object, ...] | None = None
+        # Fog state composited into the background, and the tile bounds of its
+        # visible set (what a visibility change has to recomposite).
+        self._fog_version: int | None = None
+        self._fog_bounds: tuple[int, int, int, int] | None = None
+
+        # Entity ("player"/"enemy") drawn at each entity rect position last frame.
+        self._drawn: dict[tuple[int, int], str] = {}
+        self._extra: list[pygame.Rect] = []
+        self._full = True
+
+    def invalidate(self) -> None:
+        """
+        Force a full redraw on the next frame.
+        """
+        self._full = True
+
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        """
+        Also update rect on the next frame (e.g. an overlay drawn after render()).
+        """
+        self._extra.append(pygame.Rect(rect))
+
+    def render(
+        self,
+        screen: pygame.Surface,
+        level: Level,
+        params: RenderParams,
+        player: Player,
+        enemies: Iterable[Enemy] | EnemyPool,
+        fog: FogOfWar | None = None,
+        alpha: float = 1.0,
+        player_prev: tuple[int, int] | None = None,
+    ) -> list[pygame.Rect]:
+        """
+        Draw the frame onto screen and return the rects that need updating.
+
+        alpha and player_prev interpolate entities between simulation ticks,
+        like draw_enemies() and draw_player().
+        """
+        recomposited = self._ensure_background(screen, level, params, fog)
+
+        view = tile_range(level.width, level.height, params, *screen.get_size())
+        visible = fog.visible if fog is not None else None
+        current: dict[tuple[int, int], str] = {}
+        for x, y, tx, ty in _enemy_draw_positions(enemies, view, alpha):
+            if visible is None or visible.is_set(tx, ty):
+                current[_entity_rect(params, x, y).topleft] = "enemy"
+
+        px: float = player.x
+        py: float = player.y
+        if player_prev is not None:
+            px, py = _lerp(player_prev[0], player.x, alpha), _lerp(player_prev[1], player.y, alpha)
+        player_rect = _entity_rect(params, px, py)
+        current.pop(player_rect.topleft, None)
+        current[player_rect.topleft] = "player"  # drawn last, on top
+
+        size = player_rect.size
+        screen_rect = screen.get_rect()
+        if self._full:
+            screen.blit(self._background, (0, 0))
+            rects = [screen_rect]
+            redraw = set(current)
+        else:
+            previous = self._drawn
+            changed = {
+                pos
+                for pos in previous.keys() | current.keys()
+                if previous.get(pos) != current.get(pos)
+            }
+            restored = self._clipped(changed, size, screen_rect) + recomposited
+            redraw = self._overlapping(current, restored, size)
+            # Redrawn entities are restored too, so sprites with transparent
+            # pixels are not blended over their own previous image.
+            rects = self._clipped(changed | redraw, size, screen_rect) + recomposited
+            for rect in rects:
+                screen.blit(self._background, rect, rect)
+
+        for pos, name in current.items():
+            if pos in redraw:
+                _draw_entity(screen, name, pygame.Rect(pos, size), self.atlas)
+
+        self._full = False
+        rects.extend(self._extra)
+        self._extra = []
+        self._drawn = current
+        return rects
+
+    @staticmethod
+    def _clipped(
+        positions: Iterable[tuple[int, int]], size: tuple[int, int], bounds: pygame.Rect
+    ) -> list[pygame.Rect]:
+        rects = (pygame.Rect(pos, size).clip(bounds) for pos in positions)
+        return [r for r in rects if r.width and r.height]
+
+    @staticmethod
+    def _overlapping(
+        current: dict[tuple[int, int], str],
+        restored: list[pygame.Rect],
+        size: tuple[int, int],
+    ) -> set[tuple[int, int]]:
+        """
+        Entities touching a restored rect, plus (transitively) any entity they
+        overlap, so redrawing them in order keeps the stacking of a full redraw.
+        """
+        positions = list(current)
+        boxes = [pygame.Rect(pos, size) for pos in positions]
+        hit: set[int] = set()
+        frontier = restored
+        while frontier:
+            found = {i for r in frontier for i in r.collidelistall(boxes)} - hit
+            hit |= found
+            frontier = [boxes[i] for i in found]
+        return {positions[i] for i in hit}
+
+    def _ensure_background(
+        self, screen: pygame.Surface, level: Level, params: RenderParams, fog: FogOfWar | None
+    ) -> list[pygame.Rect]:
+        """
+        Bring the background up to date and return the screen rects it changed.
+
+        A new screen size, level revision, view or fog object rebuilds it and
+        forces a full redraw. A visibility change only recomposites the tiles
+        covered by the old and new field of view.
+        """
+        key = (screen.get_size(), level, level.revision, params, fog)
+        if self._background is None or key != self._bg_key:
+            bg = pygame.Surface(screen.get_size()).convert(screen)
+            bg.fill(BACKGROUND_COLOR)
+            self.level_cache.draw(bg, level, params)
+            if fog is not None:
+                self.fog_cache.draw(bg, level, fog, params)
+            self._background = bg
+            self._bg_key = key
+            self._fog_version = fog.version if fog is not None else None
+            self._fog_bounds = _visible_bounds(fog, level.width) if fog is not None else None
+            self._full = True
+            return []
+
+        if fog is None or fog.version == self._fog_version:
+            return []
+        old = self._fog_bounds
+        new = _visible_bounds(fog, level.width)
+        self._fog_version = fog.version
+        self._fog_bounds = new
+        if old is None or new is None:
+            bounds = old or new
+            if bounds is None:
+                return []
+        else:
+            bounds = (
+                min(old[0], new[0]),
+                min(old[1], new[1]),
+                max(old[2], new[2]),
+                max(old[3], new[3]),
+            )
+
+        vx0, vy0, vx1, vy1 = tile_range(level.width, level.height, params, *screen.get_size())
+        x0, y0 = max(bounds[0], vx0), max(bounds[1], vy0)
+        x1, y1 = min(bounds[2], vx1), min(bounds[3], vy1)
+        if x0 > x1 or y0 > y1:
+            return []
+
+        # Explored and visible only change inside the old and new field of view.
+        ts = params.tile_size
+        topleft = (params.offset_x + x0 * ts, params.offset_y + y0 * ts)
+        bg = self._background
+        rect = pygame.Rect(topleft, ((x1 - x0 + 1) * ts, (y1 - y0 + 1) * ts)).clip(bg.get_rect())
+        bg.set_clip(rect)
+        bg.fill(BACKGROUND_COLOR)
+        self.level_cache.draw(bg, level, params)
+        bg.blit(render_fog(level, fog, ts, (x0, y0, x1, y1)), topleft)
+        bg.set_clip(None)
+        return [rect]
+
+
+def _visible_bounds(fog: FogOfWar, width: int) -> tuple[int, int, int, int] | None:
+    """
+    Inclusive tile bounds (x0, y0, x1, y1) of fog.visible, or None if empty.
+    """
+    indices = fog.visible_indices
+    if not indices:
+        return None
+    xs = [i % width for i in indices]
+    return min(xs), indices[0] // width, max(xs), indices[-1] // width
+
+
+class ProfilerOverlay:
+    """
+    Toggleable panel with rolling p50/p95/p99 frame and phase timings (ms).
+
+    The text is re-rendered at most every refresh_ms; in between, draw() only
+    blits the cached panel.
+    """
+
+    def __init__(
+        self, profiler: FrameProfiler, visible: bool = False, refresh_ms: int = 250
+    ) -> None:
+        self.profiler = profiler
+        self.visible = visible
+        self.refresh_ms = refresh_ms
+        self._panel: pygame.Surface | None = None
+        self._rendered_at: int | None = None
+        self._font: pygame.font.Font | None = None
+
+    def toggle(self) -> None:
+        """
+        Show or hide the overlay.
+        """
+        self.visible = not self.visible
+        self._panel = None
+
+    def draw(self, screen: pygame.Surface, now_ms: int) -> tuple[pygame.Rect, bool]:
+        """
+        Blit the panel at the top-left corner.
+
+        Returns its rect and whether its content changed since the last draw.
+        """
+        changed = False
+        if (
+            self._panel is None
+            or self._rendered_at is None
+            or now_ms - self._rendered_at >= self.refresh_ms
+        ):
+            self._panel = self._render()
+            self._rendered_at = now_ms
+            changed = True
+        return screen.blit(self._panel, (8, 8)), changed
+
+    def _render(self) -> pygame.Surface:
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.Font(None, 18)
+
+        prof = self.profiler
+        table = [("phase", "p50", "p95", "p99 ms")]
+        for name in (*prof.phases, FRAME):
+            table.append((name, *(f"{prof.recent(name, q):.2f}" for q in (50, 95, 99))))
+
+        # The default font is proportional: lay cells out in fixed columns.
+        color = (230, 230, 230)
+        cells = [[self._font.render(text, True, color) for text in row] for row in table]
+        col_w = [max(row[c].get_width() for row in cells) + 10 for c in range(len(table[0]))]
+        line_h = self._font.get_linesize()
+
+        panel = pygame.Surface((sum(col_w) + 6, line_h * len(cells) + 8))
+        panel.fill((0, 0, 0))
+        for i, row in enumerate(cells):
+            x = 6
+            for c, cell in enumerate(row):
+                panel.blit(cell, (x, 4 + i * line_h))
+                x += col_w[c]
+        return panel
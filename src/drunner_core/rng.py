@@ -0,0 +1,93 @@
+# src/drunner_core/rng.py
+
+"""
+Small, reproducible random number sources for game entities.
+
+CounterRng is counter-based: draw n is a SplitMix64 hash of (key, n), so the whole
+state is two integers. It is cheap to create, can be split per entity from one run
+seed, and the same formula can be evaluated in bulk (see EnemyPool).
+"""
+
+from __future__ import annotations
+
+import secrets
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+MIX_MUL_1 = 0xBF58476D1CE4E5B9
+MIX_MUL_2 = 0x94D049BB133111EB
+
+
+class RandomSource(Protocol):
+    """
+    The subset of random.Random that entities rely on (injectable for tests).
+    """
+
+    def random(self) -> float: ...
+
+    def shuffle(self, x: list[Any]) -> None: ...
+
+
+def mix64(z: int) -> int:
+    """
+    SplitMix64 finaliser: scramble a 64-bit integer.
+    """
+    z &= MASK64
+    z = ((z ^ (z >> 30)) * MIX_MUL_1) & MASK64
+    z = ((z ^ (z >> 27)) * MIX_MUL_2) & MASK64
+    return z ^ (z >> 31)
+
+
+@dataclass(slots=True)
+class CounterRng:
+    """
+    Counter-based RNG: output n = mix64(key + (n + 1) * GOLDEN_GAMMA).
+
+    Not cryptographic; meant for deterministic gameplay randomness.
+    """
+
+    key: int
+    counter: int = 0
+
+    @classmethod
+    def split(cls, seed: int, stream: int) -> CounterRng:
+        """
+        Derive an independent generator for one entity from a run seed.
+        """
+        return cls(key=mix64(mix64(int(seed)) ^ (int(stream) * GOLDEN_GAMMA)))
+
+    @classmethod
+    def from_entropy(cls) -> CounterRng:
+        """
+        Seed from OS entropy (used when no run seed is available).
+        """
+        return cls(key=secrets.randbits(64))
+
+    def next_u64(self) -> int:
+        """
+        Return the next 64-bit output and advance the counter.
+        """
+        self.counter += 1
+        return mix64(self.key + self.counter * GOLDEN_GAMMA)
+
+    def random(self) -> float:
+        """
+        Return a float in [0.0, 1.0) with 53 bits of precision.
+        """
+        return (self.next_u64() >> 11) * (1.0 / (1 << 53))
+
+    def randbelow(self, n: int) -> int:
+        """
+        Return an int in [0, n) for small n (n < 2**32), via multiply-shift.
+        """
+        return ((self.next_u64() >> 32) * n) >> 32
+
+    def shuffle(self, x: list[Any]) -> None:
+        """
+        Shuffle a list in place (Fisher-Yates, same loop order as random.shuffle).
+        """
+        for i in reversed(range(1, len(x))):
+            j = self.randbelow(i + 1)
+            x[i], x[j] = x[j], x[i]
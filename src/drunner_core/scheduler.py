@@ -0,0 +1,207 @@
+# src/drunner_core/scheduler.py
+
+"""
+Hashed timer wheel for waking entities at integer due times.
+
+Entities that act on a timer (enemies moving every move_interval) are scheduled
+once per action instead of being polled every frame. Advancing the clock only
+visits the wheel slots the clock passed over, so per-frame cost is proportional
+to the number of entities that are due, not to the number scheduled.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # Optional: bulk scheduling of NumPy arrays.
+
+
+class _Slot:
+    """
+    Entries of one wheel slot: scalar (due, key) lists plus bulk array chunks.
+    """
+
+    __slots__ = ("chunks", "dues", "keys")
+
+    def __init__(self) -> None:
+        self.dues: list[int] = []
+        self.keys: list[int] = []
+        self.chunks: list[tuple[Any, Any]] = []
+
+
+class TimerWheel:
+    """
+    Timer wheel keyed by integer time (the caller picks the unit, e.g. microseconds).
+
+    Each slot covers slot_width time units. Due times further away than one lap
+    simply stay in their slot until the clock comes round to them.
+    """
+
+    def __init__(self, slot_width: int = 5_000, slots: int = 256) -> None:
+        if slot_width <= 0:
+            raise ValueError(f"slot_width must be positive, got {slot_width}")
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError(f"slots must be a power of two, got {slots}")
+
+        self.slot_width = slot_width
+        self.now = 0
+        self._slots = [_Slot() for _ in range(slots)]
+        self._mask = slots - 1
+        self._count = 0
+
+        # Slot tick up to which the wheel has been swept (that tick may still
+        # hold entries due later within it).
+        self._cursor = 0
+
+        # Keys scheduled at or before `now`; returned by the next pop_due().
+        self._expired: list[int] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, key: int, due: int) -> None:
+        """
+        Wake key once the clock reaches due.
+        """
+        self._count += 1
+        if due <= self.now:
+            self._expired.append(key)
+            return
+        slot = self._slots[(due // self.slot_width) & self._mask]
+        slot.dues.append(due)
+        slot.keys.append(key)
+
+    def schedule_many(self, keys: Sequence[int], dues: Sequence[int]) -> None:
+        """
+        schedule() for parallel sequences of keys and due times.
+
+        NumPy int arrays are bucketed in bulk (one chunk per touched slot).
+        """
+        if np is None or not isinstance(dues, np.ndarray):
+            for key, due in zip(keys, dues, strict=True):
+                self.schedule(key, due)
+            return
+
+        keys = np.asarray(keys)
+        self._count += len(keys)
+
+        past = dues <= self.now
+        if past.any():
+            self._expired.extend(keys[past].tolist())
+            keys, dues = keys[~past], dues[~past]
+        if not len(keys):
+            return
+
+        slot_ids = (dues // self.slot_width) & self._mask
+        order = np.argsort(slot_ids, kind="stable")
+        slot_ids, keys, dues = slot_ids[order], keys[order], dues[order]
+
+        bounds = np.flatnonzero(np.diff(slot_ids)) + 1
+        starts = np.concatenate(([0], bounds)).tolist()
+        ends = [*bounds.tolist(), len(keys)]
+        for s, a, b in zip(slot_ids[starts].tolist(), starts, ends, strict=True):
+            self._slots[s].chunks.append((dues[a:b], keys[a:b]))
+
+    def advance(self, now: int) -> None:
+        """
+        Move the clock forward to now (it never goes backwards).
+        """
+        if now > self.now:
+            self.now = now
+
+    def pop_due(self) -> list[int]:
+        """
+        Remove and return every key due at or before the current time.
+        """
+        fired = self._expired
+        self._expired = []
+
+        now = self.now
+        end = now // self.slot_width
+        # A sweep longer than one lap would only revisit the same slots.
+        start = max(self._cursor, end - self._mask)
+
+        for tick in range(start, end + 1):
+            slot = self._slots[tick & self._mask]
+            if slot.dues:
+                self._pop_scalars(slot, now, fired)
+            if slot.chunks:
+                self._pop_chunks(slot, now, fired)
+
+        self._cursor = end
+        self._count -= len(fired)
+        return fired
+
+    def next_due(self) -> int | None:
+        """
+        Earliest scheduled due time (now if something is already due), or None
+        if nothing is scheduled.
+
+        Scans forward from the cursor for at most one lap; only the first slot
+        holding an entry due within that lap is inspected in full.
+        """
+        if self._expired:
+            return self.now
+        if not self._count:
+            return None
+
+        w = self.slot_width
+        earliest: int | None = None
+        for tick in range(self._cursor, self._cursor + len(self._slots)):
+            slot = self._slots[tick & self._mask]
+            lowest = _slot_min(slot)
+            if lowest is None:
+                continue
+            # Entries of later laps share the slot; this lap's ones are < end.
+            if lowest < (tick + 1) * w:
+                return lowest
+            earliest = lowest if earliest is None else min(earliest, lowest)
+        return earliest
+
+    def clear(self) -> None:
+        """
+        Drop every scheduled key (the clock is kept).
+        """
+        for slot in self._slots:
+            slot.dues.clear()
+            slot.keys.clear()
+            slot.chunks.clear()
+        self._expired.clear()
+        self._count = 0
+
+    @staticmethod
+    def _pop_scalars(slot: _Slot, now: int, fired: list[int]) -> None:
+        dues: list[int] = []
+        keys: list[int] = []
+        for due, key in zip(slot.dues, slot.keys, strict=True):
+            if due <= now:
+                fired.append(key)
+            else:
+                dues.append(due)
+                keys.append(key)
+        slot.dues, slot.keys = dues, keys
+
+    @staticmethod
+    def _pop_chunks(slot: _Slot, now: int, fired: list[int]) -> None:
+        chunks: list[tuple[Any, Any]] = []
+        for dues, keys in slot.chunks:
+            due = dues <= now
+            if due.all():
+                fired.extend(keys.tolist())
+            elif due.any():
+                fired.extend(keys[due].tolist())
+                chunks.append((dues[~due], keys[~due]))
+            else:
+                chunks.append((dues, keys))
+        slot.chunks = chunks
+
+
+def _slot_min(slot: _Slot) -> int | None:
+    lows = [int(dues.min()) for dues, _keys in slot.chunks if len(dues)]
+    if slot.dues:
+        lows.append(min(slot.dues))
+    return min(lows) if lows else None
@@ -0,0 +1,135 @@
+# src/drunner_core/sprites.py
+
+"""
+Sprite atlas: tile and entity images loaded from assets_dir.
+
+Sprites live in assets/tiles/, either as one atlas image described by
+atlas.json:
+
+    {"image": "atlas.png", "sprites": {"wall": [0, 0, 16, 16], "player": [16, 0, 16, 16]}}
+
+or as separate PNGs named after the sprite (wall.png, player.png, ...).
+Tile sprites are named after the Tile (floor, wall, start, exit); entity sprites
+are player and enemy. Anything without a sprite is drawn as a colored rect.
+
+Images are converted to the display format once when loaded and scaled copies
+are cached per size, so drawing a sprite every frame is a plain blit.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+ATLAS_FILE = "atlas.json"
+
+
+class SpriteAtlasError(ValueError):
+    """
+    Raised when atlas.json or a sprite image is invalid.
+    """
+
+
+class SpriteAtlas:
+    """
+    Named sprites plus a cache of their scaled copies keyed by (name, size).
+    """
+
+    def __init__(self, sprites: dict[str, pygame.Surface] | None = None) -> None:
+        self._sprites = dict(sprites or {})
+        self._scaled: dict[tuple[str, int, int], pygame.Surface] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sprites
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def names(self) -> list[str]:
+        """
+        Sorted sprite names.
+        """
+        return sorted(self._sprites)
+
+    @classmethod
+    def load(cls, assets_dir: Path) -> SpriteAtlas:
+        """
+        Load sprites from assets_dir/tiles (an empty atlas if there are none).
+
+        Call after the display mode is set so images can be converted to its
+        format; without a display they are kept as loaded.
+        """
+        tiles_dir = Path(assets_dir) / "tiles"
+        if not tiles_dir.is_dir():
+            return cls()
+
+        atlas_path = tiles_dir / ATLAS_FILE
+        if atlas_path.is_file():
+            return cls(_load_atlas(atlas_path))
+        return cls({p.stem: _load_image(p) for p in sorted(tiles_dir.glob("*.png"))})
+
+    def get(self, name: str, width: int, height: int | None = None) -> pygame.Surface | None:
+        """
+        Sprite name scaled to width x height (square if height is None), or
+        None if there is no such sprite. Scaled copies are built once per size.
+        """
+        height = width if height is None else height
+        key = (name, width, height)
+        scaled = self._scaled.get(key)
+        if scaled is not None:
+            return scaled
+
+        sprite = self._sprites.get(name)
+        if sprite is None or width <= 0 or height <= 0:
+            return None
+        if sprite.get_size() != (width, height):
+            # Nearest-neighbour keeps pixel art crisp at integer tile sizes.
+            sprite = pygame.transform.scale(sprite, (width, height))
+        self._scaled[key] = sprite
+        return sprite
+
+    def clear_cache(self) -> None:
+        """
+        Drop every scaled copy (e.g. after the tile size changed for good).
+        """
+        self._scaled.clear()
+
+
+def _load_atlas(path: Path) -> dict[str, pygame.Surface]:
+    try:
+        data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise SpriteAtlasError(f"Invalid sprite atlas {path}: {e}") from e
+
+    image_name = data.get("image")
+    regions = data.get("sprites")
+    if not isinstance(image_name, str) or not isinstance(regions, dict):
+        raise SpriteAtlasError(f'{path.name}: expected "image" (str) and "sprites" (object).')
+
+    sheet = _load_image(path.parent / image_name)
+    bounds = sheet.get_rect()
+    sprites: dict[str, pygame.Surface] = {}
+    for name, region in regions.items():
+        if (
+            not isinstance(region, list)
+            or len(region) != 4
+            or not all(isinstance(v, int) for v in region)
+        ):
+            raise SpriteAtlasError(f"{path.name}: sprite {name!r} must be [x, y, w, h].")
+        rect = pygame.Rect(region)
+        if rect.width <= 0 or rect.height <= 0 or not bounds.contains(rect):
+            raise SpriteAtlasError(f"{path.name}: sprite {name!r} is outside {image_name}.")
+        # Subsurfaces share pixels with the (already converted) sheet.
+        sprites[name] = sheet.subsurface(rect)
+    return sprites
+
+
+def _load_image(path: Path) -> pygame.Surface:
+    try:
+        image = pygame.image.load(str(path))
+    except (OSError, pygame.error) as e:
+        raise SpriteAtlasError(f"Cannot load sprite image {path}: {e}") from e
+    return image.convert_alpha() if pygame.display.get_surface() else image
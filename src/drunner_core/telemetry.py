@@ -0,0 +1,170 @@
+# src/drunner_core/telemetry.py
+
+"""
+Per-frame telemetry: a fixed-size record per frame in a preallocated ring
+buffer, dumped to a compact binary file when the run ends.
+
+Each record is RECORD (little-endian, 20 bytes):
+
+    frame      uint32  frame index since the start of the run
+    frame_us   uint32  whole frame (see drunner_core.profiler)
+    update_us  uint32  simulation: input + enemies + rules phases
+    render_us  uint32  drawing (render phase, without the display flip)
+    enemies    uint16  enemies alive
+    moves      uint16  player moves applied during the frame
+
+Recording packs the values into the buffer in place (no allocation, no
+I/O); once `capacity` frames are recorded the oldest are overwritten. A dump
+is HEADER followed by the buffered records, oldest first:
+
+    magic b"DRTM", version uint16, record size uint16, records uint32,
+    frames recorded in total uint64
+
+read_telemetry() loads a dump; write_csv()/write_json() convert it for
+analysis (`python -m drunner telemetry telemetry_<timestamp>_<run_id>.bin`).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+MAGIC = b"DRTM"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHIQ")
+RECORD = struct.Struct("<IIIIHH")
+
+# Names of the RECORD fields, in order (CSV columns / JSON keys).
+FIELDS = ("frame", "frame_us", "update_us", "render_us", "enemies", "moves")
+
+# About 10 minutes at 60 fps (720 KB).
+DEFAULT_CAPACITY = 36_000
+
+_U16 = 0xFFFF
+_U32 = 0xFFFF_FFFF
+
+
+class TelemetryFormatError(ValueError):
+    """
+    Raised when a file is not a telemetry dump this version can read.
+    """
+
+
+class TelemetryRecorder:
+    """
+    Ring buffer of the last `capacity` frame records (see module docstring).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Telemetry capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.frames = 0
+        self._buffer = bytearray(capacity * RECORD.size)
+
+    def __len__(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def record(
+        self, frame_ns: int, update_ns: int, render_ns: int, enemies: int, moves: int
+    ) -> None:
+        """
+        Store one frame (durations in ns, stored as whole µs; values clamp
+        to their field's range).
+        """
+        RECORD.pack_into(
+            self._buffer,
+            (self.frames % self.capacity) * RECORD.size,
+            self.frames & _U32,
+            min(frame_ns // 1000, _U32),
+            min(update_ns // 1000, _U32),
+            min(render_ns // 1000, _U32),
+            min(enemies, _U16),
+            min(moves, _U16),
+        )
+        self.frames += 1
+
+    def to_bytes(self) -> bytes:
+        """
+        The dump: HEADER plus the buffered records, oldest first.
+        """
+        n = len(self)
+        header = HEADER.pack(MAGIC, VERSION, RECORD.size, n, self.frames)
+        if self.frames <= self.capacity:
+            return header + self._buffer[: n * RECORD.size]
+        split = (self.frames % self.capacity) * RECORD.size
+        return header + self._buffer[split:] + self._buffer[:split]
+
+    def dump(self, path: Path) -> Path:
+        """
+        Write the dump to path (atomically, via a temporary file) and return it.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(self.to_bytes())
+        os.replace(tmp, path)
+        return path
+
+
+@dataclass(frozen=True)
+class TelemetryDump:
+    """
+    Contents of a dump: records (tuples in FIELDS order), oldest first.
+    """
+
+    frames: int
+    records: list[tuple[int, ...]]
+
+    def rows(self) -> list[dict[str, int]]:
+        """
+        Records as dicts keyed by FIELDS.
+        """
+        return [dict(zip(FIELDS, r, strict=True)) for r in self.records]
+
+
+def read_telemetry(path: Path) -> TelemetryDump:
+    """
+    Load a dump written by TelemetryRecorder.dump().
+
+    Raises:
+        TelemetryFormatError: If the file is not a complete version-1 dump.
+    """
+    data = path.read_bytes()
+    if len(data) < HEADER.size:
+        raise TelemetryFormatError(f"{path}: too short for a telemetry header")
+    magic, version, record_size, count, frames = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise TelemetryFormatError(f"{path}: not a telemetry dump")
+    if version != VERSION or record_size != RECORD.size:
+        raise TelemetryFormatError(
+            f"{path}: unsupported telemetry version {version} (record size {record_size})"
+        )
+    body = memoryview(data)[HEADER.size :]
+    if len(body) != count * RECORD.size:
+        raise TelemetryFormatError(
+            f"{path}: expected {count} records, found {len(body) / RECORD.size:g}"
+        )
+    return TelemetryDump(frames=frames, records=list(RECORD.iter_unpack(body)))
+
+
+def write_csv(dump: TelemetryDump, f: IO[str]) -> None:
+    """
+    Write the records as CSV with a FIELDS header row.
+    """
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(FIELDS)
+    writer.writerows(dump.records)
+
+
+def write_json(dump: TelemetryDump, f: IO[str]) -> None:
+    """
+    Write {"frames": total recorded, "fields": FIELDS, "records": [{...}, ...]}.
+    """
+    json.dump({"frames": dump.frames, "fields": list(FIELDS), "records": dump.rows()}, f)
+    f.write("\n")
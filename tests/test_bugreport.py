@@ -1,13 +1,16 @@
 # tests/test_bugreport.py
 
 import json
+import logging
 from pathlib import Path
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+import drunner.bugreport as bugreport_mod
 from drunner import main as app_main
-from drunner.bugreport import run_guarded
+from drunner.bugreport import run_guarded, tail_text_file
+from drunner.log import RingBufferHandler
 
 
 def test_crash_report_created_on_exception(tmp_path: Path) -> None:
@@ -102,3 +105,160 @@ def test_entrypoint_creates_crash_report(tmp_path: Path, monkeypatch: MonkeyPatc
     # logfile is pointed out and/or tail is included (we expect both if you pass log_file_path in main.py)
     assert data.get("log_file") is not None
     assert data.get("log_tail") is not None
+
+
+@pytest.mark.parametrize(
+    ("command", "target", "call"),
+    [
+        ("thumbnails", "render_thumbnails", lambda: app_main.run_thumbnails()),
+        ("frames", "render_frames", lambda: app_main.run_frames(frames=1)),
+        ("stats", "ReportIndex", lambda: app_main.run_stats()),
+        ("telemetry", "read_telemetry", lambda: app_main.run_telemetry("t.bin")),
+    ],
+)
+def test_commands_write_crash_report_on_unexpected_error(
+    tmp_path: Path, monkeypatch: MonkeyPatch, command: str, target: str, call
+) -> None:
+    cfg = DummyCfg(root_dir=tmp_path, log_file=tmp_path / "logs" / "drunner.log")
+    cfg.levels_dir = tmp_path / "levels"
+    cfg.reports_dir = tmp_path / "reports"
+    cfg.assets_dir = tmp_path / "assets"
+    cfg.levels_dir.mkdir()
+    cfg.reports_dir.mkdir()
+    (cfg.reports_dir / "t.bin").write_bytes(b"")
+
+    monkeypatch.setattr(app_main, "load_config", lambda: cfg)
+    monkeypatch.setattr(app_main, "configure_logging", lambda _cfg: DummyLogger())
+
+    def boom(*_args, **_kwargs):
+        raise RuntimeError(f"{command} boom")
+
+    monkeypatch.setattr(app_main, target, boom)
+
+    assert call() == 1
+    (crash,) = (tmp_path / "reports").glob("crash_*.json")
+    assert f"{command} boom" in json.loads(crash.read_text(encoding="utf-8"))["stacktrace"]
+
+
+def test_tail_returns_last_lines(tmp_path: Path) -> None:
+    log = tmp_path / "big.log"
+    with log.open("w", encoding="utf-8") as f:
+        for i in range(20_000):
+            f.write(f"line {i}\n")
+
+    assert tail_text_file(log, max_lines=3) == "line 19997\nline 19998\nline 19999"
+    assert tail_text_file(log, max_lines=1) == "line 19999"
+
+    # Short files and files without a trailing newline.
+    short = tmp_path / "short.log"
+    short.write_bytes(b"a\r\nb\r\nc")
+    assert tail_text_file(short, max_lines=80) == "a\nb\nc"
+    assert tail_text_file(short, max_lines=2) == "b\nc"
+    assert tail_text_file(tmp_path / "missing.log") is None
+
+
+def test_tail_reads_only_the_end(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    log = tmp_path / "big.log"
+    log.write_bytes(b"x" * 1_000_000 + b"\nlast\n")
+    monkeypatch.setattr(bugreport_mod, "TAIL_BLOCK_SIZE", 64)
+
+    reads: list[int] = []
+    real_open = Path.open
+
+    def counting_open(self, *args, **kwargs):
+        f = real_open(self, *args, **kwargs)
+        real_read = f.read
+
+        def read(n=-1):
+            data = real_read(n)
+            reads.append(len(data))
+            return data
+
+        f.read = read
+        return f
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    assert tail_text_file(log, max_lines=1, max_bytes=4096) == "last"
+    assert sum(reads) <= 128
+
+    # A single huge line is cut at max_bytes.
+    reads.clear()
+    assert tail_text_file(log, max_lines=2, max_bytes=200) == "x" * 194 + "\nlast"
+    assert sum(reads) == 200
+
+
+def test_tail_skips_cut_utf8_characters(tmp_path: Path) -> None:
+    log = tmp_path / "utf8.log"
+    log.write_text("start\n" + "é" * 100 + "\nend\n", encoding="utf-8")
+
+    # 2-byte characters: an odd byte budget starts in the middle of one.
+    tail = tail_text_file(log, max_lines=5, max_bytes=16)
+    assert tail == "é" * 5 + "\nend"
+    assert "\ufffd" not in tail
+
+    # Invalid bytes inside the tail are replaced, not fatal.
+    log.write_bytes(b"ok\n\xff\xfe broken\n")
+    assert tail_text_file(log) == "ok\n\ufffd\ufffd broken"
+
+
+def test_ring_buffer_keeps_last_records_at_every_level() -> None:
+    logger = logging.getLogger("drunner.test_ring")
+    logger.setLevel(logging.DEBUG)
+    ring = RingBufferHandler(capacity=3)
+    ring.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger.addHandler(ring)
+    try:
+        for i in range(5):
+            logger.debug("step %d", i)
+        logger.info("done")
+    finally:
+        logger.removeHandler(ring)
+
+    assert ring.records() == ["DEBUG step 3", "DEBUG step 4", "INFO done"]
+    ring.clear()
+    assert ring.records() == []
+
+
+def test_ring_buffer_fixes_messages_at_log_time() -> None:
+    logger = logging.getLogger("drunner.test_ring_args")
+    logger.setLevel(logging.DEBUG)
+    ring = RingBufferHandler(capacity=5)
+    ring.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(ring)
+    try:
+        pos = [1, 1]
+        logger.debug("Player at %s", pos)
+        pos[0] = 99
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+    finally:
+        logger.removeHandler(ring)
+
+    first, second = ring.records()
+    assert first == "Player at [1, 1]"
+    assert second.startswith("failed\nTraceback") and "RuntimeError: boom" in second
+    # No traceback (and its frames) is kept alive by the buffer.
+    assert all(r.exc_info is None and r.args is None for r in ring._records)
+
+
+def test_crash_report_uses_records_without_reading_the_log(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    def no_tail(*_args, **_kwargs):
+        raise AssertionError("log file read on the crash path")
+
+    monkeypatch.setattr(bugreport_mod, "tail_text_file", no_tail)
+    monkeypatch.setattr(bugreport_mod, "recent_records", lambda: ["DEBUG a", "INFO b"])
+
+    path = bugreport_mod.write_crash_report(
+        project_root=tmp_path,
+        exc=RuntimeError("boom"),
+        cfg={},
+        run_id="ring",
+        log_file_path=tmp_path / "logs" / "drunner.log",
+    )
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["log_records"] == ["DEBUG a", "INFO b"]
+    assert data["log_tail"] is None
@@ -0,0 +1,62 @@
+# tests/test_camera.py
+
+from drunner_core.camera import Camera
+from drunner_core.enemy import EnemyPool
+from drunner_core.level import Level
+from drunner_core.occupancy import OccupancyGrid
+
+
+def _level(width: int, height: int) -> Level:
+    rows = ["S" + "." * (width - 1)] + ["." * width] * (height - 2) + ["." * (width - 1) + "E"]
+    return Level.from_ascii(rows)
+
+
+def test_small_level_is_fitted_and_centered() -> None:
+    cam = Camera(_level(10, 5), 200, 120, min_tile_size=8)
+    assert cam.tile_size == 20
+    assert not cam.scrolls
+    assert cam.params.offset_x == 0
+    assert cam.params.offset_y == (120 - 5 * 20) // 2
+    assert cam.tile_range() == (0, 0, 9, 4)
+    assert not cam.follow(9, 4)
+
+
+def test_large_level_keeps_min_tile_size_and_follows() -> None:
+    cam = Camera(_level(1000, 800), 160, 80, min_tile_size=8)  # 20x10 tiles in view
+    assert cam.tile_size == 8
+    assert cam.scrolls
+    assert cam.tile_range() == (0, 0, 19, 9)
+
+    # Inside the dead zone: no scroll.
+    assert not cam.follow(10, 5)
+
+    assert cam.follow(17, 5)
+    x0, _, x1, _ = cam.tile_range()
+    assert x1 - x0 == 19
+    assert x0 < 17 < x1 - 3
+
+    cam.center_on(500, 400)
+    assert cam.tile_range() == (490, 395, 509, 404)
+    assert cam.params.offset_x == -490 * 8
+
+    # Clamped at the far edge.
+    cam.center_on(999, 799)
+    assert cam.tile_range() == (980, 790, 999, 799)
+
+
+def test_occupied_in_scans_only_the_rectangle() -> None:
+    grid = OccupancyGrid.from_positions(6, 4, [(0, 0), (2, 1), (2, 1), (5, 3), (3, 2)])
+    assert list(grid.occupied_in(1, 1, 4, 3)) == [(2, 1), (3, 2)]
+    assert list(grid.occupied_in(-5, -5, 99, 99)) == [(0, 0), (2, 1), (3, 2), (5, 3)]
+    assert list(grid.occupied_in(4, 0, 3, 3)) == []
+
+
+def test_pool_positions_in_with_and_without_occupancy() -> None:
+    level = _level(8, 8)
+    pool = EnemyPool(seed=0)
+    for x, y in ((1, 1), (6, 6), (3, 4), (3, 4)):
+        pool.add(x, y)
+
+    before = sorted(pool.positions_in(0, 0, 4, 4))
+    pool.attach(level)
+    assert sorted(pool.positions_in(0, 0, 4, 4)) == before == [(1, 1), (3, 4)]
@@ -0,0 +1,63 @@
+# tests/test_cli.py
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from drunner.config import _project_root
+from drunner_core.telemetry import FIELDS, TelemetryRecorder
+
+# Runs the `drunner` console script's entry point (drunner.cli:main) in a
+# fresh interpreter, with the project root moved to a temporary directory.
+_SCRIPT = """
+import sys
+from pathlib import Path
+
+import drunner.config
+
+drunner.config._project_root = lambda: Path(sys.argv[1])
+
+from drunner.cli import main
+
+raise SystemExit(main(sys.argv[2:]))
+"""
+
+
+def _run_cli(root: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env.pop("PYGAME_HIDE_SUPPORT_PROMPT", None)
+    env["PYTHONPATH"] = str(_project_root() / "src")
+    return subprocess.run(
+        [sys.executable, "-c", _SCRIPT, str(root), *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+
+
+def _project(tmp_path: Path) -> Path:
+    shutil.copy(_project_root() / "config.toml", tmp_path / "config.toml")
+    return tmp_path
+
+
+def test_stats_json_stdout_parses(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    result = _run_cli(root, "stats", "--json")
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout)
+    assert data["totals"]["runs"] == 0
+
+
+def test_telemetry_csv_stdout_starts_with_header(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    recorder = TelemetryRecorder(capacity=4)
+    recorder.record(16_000_000, 1_000_000, 2_000_000, 1, 0)
+    recorder.dump(root / "reports" / "telemetry_x.bin")
+
+    result = _run_cli(root, "telemetry", "telemetry_x.bin")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == [",".join(FIELDS), "0,16000,1000,2000,1,0"]
@@ -0,0 +1,200 @@
+# tests/test_enemy_pool.py
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from drunner_core import enemy as enemy_mod
+from drunner_core.enemy import Enemy, EnemyPool
+from drunner_core.game_helpers import apply_next_move
+from drunner_core.level import Level, Tile
+from drunner_core.player import Player
+from drunner_core.rng import CounterRng
+
+
+def _level() -> Level:
+    return Level.from_ascii(
+        [
+            "##########",
+            "#........#",
+            "#.##..#..#",
+            "#..#..#..#",
+            "#..S...#.#",
+            "#.....#..#",
+            "#..#....E#",
+            "##########",
+        ],
+        name="pool_test",
+    )
+
+
+def _spawn(n: int, interval: float) -> list[Enemy]:
+    return [
+        Enemy(x=1 + (i % 8), y=1, move_interval=interval, rng=CounterRng.split(7, i))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("interval", [0.25, 0.0])
+def test_pool_matches_enemy_objects(
+    monkeypatch: MonkeyPatch, use_numpy: bool, interval: float
+) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = _level()
+    reference = _spawn(8, interval)
+    pool = EnemyPool.from_enemies(_spawn(8, interval))
+
+    # Mix of small and large (multi-step catch-up) frame times.
+    for dt in [0.0625, 0.125, 0.5, 0.0625, 1.0] * 6:
+        for e in reference:
+            e.update(dt, level)
+        pool.update(dt, level)
+
+        assert list(pool.iter_positions()) == [(e.x, e.y) for e in reference]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_mixed_intervals_and_stall_match_enemy_objects(
+    monkeypatch: MonkeyPatch, use_numpy: bool
+) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    def spawn() -> list[Enemy]:
+        return [
+            Enemy(
+                x=1 + (i % 8),
+                y=1,
+                move_interval=(0.125, 0.25, 0.5, 0.0)[i % 4],
+                rng=CounterRng.split(11, i),
+            )
+            for i in range(8)
+        ]
+
+    level = _level()
+    reference = spawn()
+    pool = EnemyPool.from_enemies(spawn())
+
+    # 100 s stall: both replay at most MAX_CATCH_UP_STEPS moves, then keep phase.
+    for dt in [0.0625, 100.0, 0.0625, 0.375, 0.125] * 4:
+        for e in reference:
+            e.update(dt, level)
+        pool.update(dt, level)
+
+        assert list(pool.iter_positions()) == [(e.x, e.y) for e in reference]
+
+
+def test_enemy_catch_up_is_capped() -> None:
+    level = _level()
+    e = Enemy(x=1, y=1, move_interval=0.25, rng=CounterRng.split(3, 0))
+
+    e.update(60.0, level)
+
+    assert e.rng.counter <= enemy_mod.MAX_CATCH_UP_STEPS * 4
+    assert 0.0 <= e._accum < e.move_interval
+
+
+def test_pool_splits_rng_from_seed() -> None:
+    a = EnemyPool(seed=99)
+    b = EnemyPool(seed=99)
+    for pool in (a, b):
+        for x in range(1, 9):
+            pool.add(x, 1, move_interval=0.0)
+
+    level = _level()
+    for _ in range(20):
+        a.update(0.1, level)
+        b.update(0.1, level)
+
+    assert list(a.iter_positions()) == list(b.iter_positions())
+
+
+def test_pool_any_at() -> None:
+    pool = EnemyPool()
+    pool.add(2, 3)
+    pool.add(4, 5)
+
+    assert pool.any_at(4, 5)
+    assert not pool.any_at(3, 2)
+    assert len(pool) == 2
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_next_move_in_and_moved_this_tick(monkeypatch: MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = _level()
+    pool = EnemyPool(seed=3)
+    assert pool.next_move_in() is None
+
+    pool.add(1, 1, move_interval=0.5)
+    pool.add(8, 1, move_interval=0.2)
+    pool.attach(level)
+    assert pool.next_move_in() == pytest.approx(0.2)
+
+    pool.begin_tick()
+    pool.update(0.15, level)
+    assert not pool.moved_this_tick()
+    assert pool.next_move_in() == pytest.approx(0.05)
+
+    pool.begin_tick()
+    pool.update(0.05, level)
+    assert pool.moved_this_tick()
+    assert pool.next_move_in() == pytest.approx(0.2)
+
+    pool.add(4, 5, move_interval=0.0)
+    assert pool.next_move_in() == 0.0
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_sees_tiles_walled_off_after_attach(monkeypatch: MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = Level.from_ascii(["#########", "#S.....E#", "#########"])
+    pool = EnemyPool(seed=4)
+    pool.add(3, 1, move_interval=0.05)
+    pool.attach(level)
+
+    # One step per update, so every tile the enemy enters is checked.
+    level.set_tile(4, 1, Tile.WALL)
+    for _ in range(100):
+        pool.begin_tick()
+        pool.update(0.05, level)
+        assert (4, 1) not in list(pool.iter_positions())
+
+
+def test_queued_moves_cannot_pass_through_an_enemy() -> None:
+    level = Level.from_ascii(["#######", "#S...E#", "#######"])
+    player = Player(x=1, y=1)
+    enemies = EnemyPool(seed=0)
+    enemies.add(2, 1, move_interval=1e9)
+    enemies.attach(level)
+
+    # Two key presses in the same tick: the first step lands on the enemy.
+    pending = [(1, 0), (1, 0)]
+    player_from = (player.x, player.y)
+    enemies.begin_tick()
+    assert apply_next_move(level, player, pending)
+    assert enemies.collides(player_from, (player.x, player.y))
+    assert pending == [(1, 0)]
+
+
+def test_queued_moves_stop_on_the_exit() -> None:
+    level = Level.from_ascii(["#####", "#SE.#", "#####"])
+    player = Player(x=1, y=1)
+    pending = [(1, 0), (1, 0)]
+    assert apply_next_move(level, player, pending)
+    assert level.tile_at(player.x, player.y) == Tile.EXIT
+    assert not apply_next_move(level, player, []) and pending == [(1, 0)]
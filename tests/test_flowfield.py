@@ -0,0 +1,111 @@
+# tests/test_flowfield.py
+
+import random
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from drunner_core import enemy as enemy_mod
+from drunner_core.enemy import Enemy, EnemyPool
+from drunner_core.flowfield import FlowField
+from drunner_core.generators import generate_level
+from drunner_core.level import EnemyKind, Level, Tile
+from drunner_core.rng import CounterRng
+
+
+def _walkable(level: Level) -> list[tuple[int, int]]:
+    return [(x, y) for x, y, _t in level.iter_tiles() if level.is_walkable(x, y)]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_incremental_retarget_matches_rebuild(seed: int) -> None:
+    level = generate_level(seed=seed, width=41, height=31)
+    rng = random.Random(seed)
+
+    x, y = _walkable(level)[0]
+    incremental = FlowField(level)
+    incremental.retarget(x, y)
+
+    for _ in range(200):
+        options = [
+            (x + dx, y + dy)
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if level.is_walkable(x + dx, y + dy)
+        ]
+        x, y = rng.choice(options)
+        incremental.retarget(x, y)
+
+        fresh = FlowField(level)
+        fresh.retarget(x, y)
+        assert incremental.dist == fresh.dist
+
+
+def test_next_step_walks_to_target() -> None:
+    level = generate_level(seed=5, width=41, height=31)
+    tiles = _walkable(level)
+    target, start = tiles[0], tiles[-1]
+
+    field = FlowField(level)
+    field.retarget(*target)
+
+    x, y = start
+    steps = 0
+    while (x, y) != target:
+        dx, dy = field.next_step(x, y)
+        assert level.is_walkable(x + dx, y + dy)
+        x, y = x + dx, y + dy
+        steps += 1
+
+    assert steps == field.distance(*start)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_chase_matches_enemy(monkeypatch: MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = generate_level(seed=8, width=41, height=31)
+    tiles = _walkable(level)
+    field = FlowField(level)
+    field.retarget(*tiles[0])
+
+    kinds = [EnemyKind.CHASE, EnemyKind.RANDOM] * 5
+    reference = [
+        Enemy(x=x, y=y, move_interval=0.0, rng=CounterRng.split(3, i), kind=k, flow=field)
+        for i, ((x, y), k) in enumerate(zip(tiles[-10:], kinds, strict=True))
+    ]
+    pool = EnemyPool.from_enemies(reference)
+    pool.flow = field
+
+    for _ in range(80):
+        for e in reference:
+            e.update(0.1, level)
+        pool.update(0.1, level)
+        assert list(pool.iter_positions()) == [(e.x, e.y) for e in reference]
+
+    # Chasers reach the target (and then hover around it).
+    assert all(field.distance(*pool.position(i)) <= 1 for i in range(0, 10, 2))
+
+
+def test_retarget_rebuilds_after_level_change() -> None:
+    level = generate_level(seed=6, width=41, height=31)
+    tiles = _walkable(level)
+    field = FlowField(level)
+    field.retarget(*tiles[0])
+
+    # Wall off a tile next to the target, then retarget to the same tile.
+    x, y = tiles[0]
+    wall = next(
+        (x + dx, y + dy)
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+        if level.is_walkable(x + dx, y + dy)
+    )
+    level.set_tile(*wall, Tile.WALL)
+    field.retarget(*tiles[0])
+
+    fresh = FlowField(level)
+    fresh.retarget(*tiles[0])
+    assert field.dist == fresh.dist
+    assert field.distance(*wall) is None
@@ -0,0 +1,120 @@
+# tests/test_fov.py
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from drunner_core import enemy as enemy_mod
+from drunner_core.enemy import EnemyPool
+from drunner_core.fov import FieldOfView, FogOfWar, TileBitset, compute_fov
+from drunner_core.level import EnemyKind, Level, Tile
+
+
+def _level() -> Level:
+    return Level.from_ascii(
+        [
+            "###########",
+            "#S....#...#",
+            "#.....#...#",
+            "#.....#..E#",
+            "###########",
+        ],
+        name="fov_test",
+    )
+
+
+def _visible(level: Level, x: int, y: int, radius: int) -> set[tuple[int, int]]:
+    return {(i % level.width, i // level.width) for i in compute_fov(level, x, y, radius)}
+
+
+def test_fov_is_blocked_by_walls() -> None:
+    level = _level()
+    seen = _visible(level, 1, 1, radius=20)
+
+    assert (1, 1) in seen
+    assert (5, 3) in seen  # open room
+    assert (6, 2) in seen  # the wall itself is visible
+    assert (8, 2) not in seen  # behind the wall
+
+
+def test_fov_respects_radius() -> None:
+    level = _level()
+    seen = _visible(level, 1, 1, radius=2)
+
+    assert (3, 1) in seen
+    assert (4, 1) not in seen
+
+
+def test_fov_cache_hits_and_invalidates_on_tile_change() -> None:
+    level = _level()
+    fov = FieldOfView(level, radius=20, cache_size=2)
+
+    first = fov.visible_from(1, 1)
+    assert fov.visible_from(1, 1) is first
+    assert (fov.hits, fov.misses) == (1, 1)
+    assert not fov.can_see((1, 1), (8, 2))
+
+    # Open a hole in the wall: cached results must not be reused.
+    level.set_tile(6, 1, Tile.FLOOR)
+    assert fov.visible_from(1, 1) is not first
+    assert fov.can_see((1, 1), (8, 1))
+
+
+def test_fov_cache_evicts_least_recently_used() -> None:
+    fov = FieldOfView(_level(), radius=3, cache_size=2)
+    fov.visible_from(1, 1)
+    fov.visible_from(2, 1)
+    fov.visible_from(1, 1)
+    fov.visible_from(3, 1)  # evicts (2, 1)
+
+    fov.visible_from(1, 1)
+    fov.visible_from(2, 1)
+    assert fov.misses == 4
+
+
+def test_bitset_ops() -> None:
+    a = TileBitset(5, 3)
+    a.add(4, 2)
+    a.add_indices([0, 7])
+    b = TileBitset(5, 3)
+    b.add(1, 0)
+
+    a.union_update(b)
+
+    assert len(a) == 4
+    assert (4, 2) in a and (1, 0) in a
+    assert not a.is_set(9, 9)
+    assert list(a.positions()) == [(0, 0), (1, 0), (2, 1), (4, 2)]
+    assert TileBitset(5, 3, a.data) == a
+
+
+def test_fog_explored_grows_with_moves() -> None:
+    level = _level()
+    fog = FogOfWar(FieldOfView(level, radius=3))
+
+    assert fog.update(1, 1)
+    assert not fog.update(1, 1)  # same origin: nothing to do
+    explored_before = len(fog.explored)
+
+    fog.update(4, 3)
+    assert len(fog.explored) > explored_before
+    assert (1, 1) in fog.explored
+    assert (1, 1) not in fog.visible
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_aggro_on_line_of_sight(monkeypatch: MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = _level()
+    pool = EnemyPool(seed=1)
+    pool.add(4, 2)  # same room as the player
+    pool.add(8, 2)  # behind the wall
+    pool.update(0.0, level)
+
+    fov = FieldOfView(level, radius=20)
+    assert pool.aggro(fov.visible_from(1, 1)) == 1
+    assert pool.aggro(fov.visible_from(1, 1)) == 0
+    assert [int(k) for k in pool._kind] == [EnemyKind.CHASE, EnemyKind.RANDOM]
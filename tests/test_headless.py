@@ -0,0 +1,123 @@
+# tests/test_headless.py
+
+import json
+from pathlib import Path
+
+import pygame
+
+from drunner.config import AppConfig
+from drunner_core.generators import generate_level
+from drunner_core.headless import (
+    INDEX_FILE,
+    render_frames,
+    render_thumbnail,
+    render_thumbnails,
+    thumbnail_key,
+)
+from drunner_core.level import Level, Tile
+from drunner_core.level_io import save_level
+from drunner_core.render import TILE_COLORS
+
+
+def _cfg(tmp_path: Path, **overrides) -> AppConfig:
+    values = {
+        "root_dir": tmp_path,
+        "logs_dir": tmp_path / "logs",
+        "reports_dir": tmp_path / "reports",
+        "levels_dir": tmp_path / "levels",
+        "assets_dir": tmp_path / "assets",
+        "console_level": "INFO",
+        "file_level": "DEBUG",
+        "log_file": tmp_path / "logs" / "drunner.log",
+        "window_width": 160,
+        "window_height": 96,
+        "fps": 60,
+        "title": "test",
+    }
+    values.update(overrides)
+    return AppConfig(**values)
+
+
+def test_thumbnail_fits_max_size() -> None:
+    level = Level.from_ascii(["#####", "#S.E#", "#####"])
+    thumb = render_thumbnail(level, max_size=64)
+    assert thumb.get_size() == (60, 36)  # 12 px tiles
+    assert tuple(thumb.get_at((18, 18)))[:3] == TILE_COLORS[Tile.START]
+
+    big = Level.from_ascii(["S" + "." * 499] + ["." * 500] * 248 + ["." * 499 + "E"])
+    assert render_thumbnail(big, max_size=100).get_size() == (100, 50)
+
+
+def test_thumbnail_key_depends_on_content_size_and_assets() -> None:
+    key = thumbnail_key(b"{}", 256)
+    assert key == thumbnail_key(b"{}", 256)
+    assert len({key, thumbnail_key(b"{ }", 256), thumbnail_key(b"{}", 128)}) == 3
+    assert thumbnail_key(b"{}", 256, "sprites") != key
+
+
+def _write_levels(levels_dir: Path) -> None:
+    for seed in range(3):
+        save_level(generate_level(seed, 21, 15), levels_dir / f"seed_{seed}.json")
+    # Same content under another name and a broken file.
+    sub = levels_dir / "copies"
+    sub.mkdir()
+    (sub / "again.json").write_bytes((levels_dir / "seed_0.json").read_bytes())
+    (levels_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+
+def test_batch_thumbnails_use_pool_and_content_cache(tmp_path: Path) -> None:
+    levels_dir = tmp_path / "levels"
+    levels_dir.mkdir()
+    _write_levels(levels_dir)
+    out = tmp_path / "thumbs"
+
+    results = render_thumbnails(levels_dir, out, size=64, jobs=2)
+    by_name = {r.level.name: r for r in results}
+    assert len(results) == 5
+    assert by_name["broken.json"].thumbnail is None and by_name["broken.json"].error
+    assert by_name["again.json"].thumbnail == by_name["seed_0.json"].thumbnail
+    assert not any(r.cached for r in results)
+
+    thumb = by_name["seed_1.json"].thumbnail
+    assert thumb is not None
+    assert pygame.image.load(str(thumb)).get_size() == (63, 45)
+    assert len(list(out.glob("*.png"))) == 3
+
+    index = json.loads((out / INDEX_FILE).read_text(encoding="utf-8"))
+    assert index["copies/again.json"] == index["seed_0.json"]
+    assert index["seed_1.json"] == thumb.name
+    assert "broken.json" not in index
+
+    # Second run: everything valid is cached, nothing is re-rendered.
+    mtime = thumb.stat().st_mtime_ns
+    again = render_thumbnails(levels_dir, out, size=64, jobs=1)
+    assert [r.cached for r in again if r.error is None] == [True] * 4
+    assert thumb.stat().st_mtime_ns == mtime
+
+    # Editing a level changes its key.
+    save_level(generate_level(9, 21, 15), levels_dir / "seed_1.json")
+    changed = {r.level.name: r for r in render_thumbnails(levels_dir, out, size=64, jobs=1)}
+    assert not changed["seed_1.json"].cached
+    assert changed["seed_1.json"].thumbnail != thumb
+
+
+def test_frames_are_written_headless(tmp_path: Path) -> None:
+    level = Level.from_ascii(
+        [
+            "##########",
+            "#S.......#",
+            "#........#",
+            "#.......E#",
+            "##########",
+        ]
+    )
+    level.enemies = [(5, 2)]
+    cfg = _cfg(tmp_path, fov_radius=0)
+
+    written = render_frames(cfg, level, tmp_path / "frames", frames=4, seed=1, every=30)
+    assert [p.name for p in written] == [f"frame_{i:05d}.png" for i in range(4)]
+    first = pygame.image.load(str(written[0]))
+    assert first.get_size() == (160, 96)
+    # Enemies move between frames.
+    frames = [pygame.image.tobytes(pygame.image.load(str(p)), "RGB") for p in written]
+    assert len(set(frames)) > 1
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from drunner_core.level import Level, Tile
+from drunner_core.level import EnemyKind, Level, Tile
 from drunner_core.level_io import LevelIOError, load_level, save_level
 
 
@@ -114,3 +114,41 @@ def test_save_includes_enemies(tmp_path: Path) -> None:
 
     data = json.loads(path.read_text(encoding="utf-8"))
     assert data["enemies"] == [[2, 1], [3, 3]]
+
+
+def test_load_level_with_typed_enemies_roundtrip(tmp_path: Path) -> None:
+    path = tmp_path / "typed.json"
+    payload = {
+        "version": 1,
+        "name": "typed",
+        "grid": _valid_grid(),
+        "enemies": [[2, 1], {"x": 3, "y": 3, "type": "chase"}, {"x": 1, "y": 3, "type": "basic"}],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    level = load_level(path)
+    assert level.enemies == [(2, 1), (3, 3), (1, 3)]
+    assert [level.enemy_kind(i) for i in range(3)] == [
+        EnemyKind.RANDOM,
+        EnemyKind.CHASE,
+        EnemyKind.RANDOM,
+    ]
+
+    out = tmp_path / "typed_out.json"
+    save_level(level, out)
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["enemies"] == [[2, 1], {"x": 3, "y": 3, "type": "chase"}, [1, 3]]
+
+
+def test_load_level_rejects_unknown_enemy_type(tmp_path: Path) -> None:
+    path = tmp_path / "bad_type.json"
+    payload = {
+        "version": 1,
+        "name": "bad_type",
+        "grid": _valid_grid(),
+        "enemies": [{"x": 3, "y": 3, "type": "teleport"}],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    with pytest.raises(LevelIOError):
+        load_level(path)
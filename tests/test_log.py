@@ -0,0 +1,180 @@
+# tests/test_log.py
+
+import gzip
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from drunner import log as log_mod
+from drunner.config import AppConfig
+from drunner.log import (
+    DroppingQueueHandler,
+    RotatingLogHandler,
+    configure_logging,
+    recent_records,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def drunner_logger() -> Iterator[logging.Logger]:
+    logger = logging.getLogger("drunner")
+    yield logger
+    shutdown_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def _cfg(tmp_path: Path, **overrides) -> AppConfig:
+    values = {
+        "root_dir": tmp_path,
+        "logs_dir": tmp_path / "logs",
+        "reports_dir": tmp_path / "reports",
+        "levels_dir": tmp_path / "levels",
+        "assets_dir": tmp_path / "assets",
+        "console_level": "CRITICAL",
+        "file_level": "INFO",
+        "log_file": tmp_path / "logs" / "drunner.log",
+        "window_width": 160,
+        "window_height": 96,
+        "fps": 60,
+        "title": "test",
+    }
+    values.update(overrides)
+    return AppConfig(**values)
+
+
+def test_queue_handler_drops_instead_of_blocking() -> None:
+    q: queue.Queue = queue.Queue(2)
+    handler = DroppingQueueHandler(q)
+    logger = logging.Logger("drunner.test_queue")
+    logger.addHandler(handler)
+
+    args = [1]
+    for i in range(5):
+        logger.info("record %d %s", i, args)
+    args.append(2)
+
+    assert handler.dropped == 3
+    first = q.get_nowait()
+    # Arguments are merged when queued, formatting is left to the listener.
+    assert (first.msg, first.args) == ("record 0 [1]", None)
+
+
+def test_file_output_is_written_in_the_background(
+    tmp_path: Path, drunner_logger: logging.Logger
+) -> None:
+    cfg = _cfg(tmp_path)
+    logger = configure_logging(cfg)
+    assert log_mod._listener is not None
+    assert [type(h) for h in logger.handlers] == [DroppingQueueHandler, log_mod.RingBufferHandler]
+
+    caller = threading.get_ident()
+    threads = set()
+
+    class Spy(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            threads.add(threading.get_ident())
+
+    log_mod._listener.handlers += (Spy(),)
+    for i in range(100):
+        logger.info("move %d", i)
+    logger.debug("only in memory")
+
+    assert shutdown_logging() == 0
+    assert threads and caller not in threads
+    lines = cfg.log_file.read_text(encoding="utf-8").splitlines()
+    assert lines[-1].endswith("| INFO | drunner | move 99")
+    assert not any("only in memory" in line for line in lines)
+    assert (recent_records() or [""])[-1].endswith("| DEBUG | drunner | only in memory")
+
+    # After shutdown records go straight to the file.
+    logger.info("late")
+    assert cfg.log_file.read_text(encoding="utf-8").splitlines()[-1].endswith("late")
+    assert shutdown_logging() == 0
+
+
+def test_shutdown_reports_dropped_records(tmp_path: Path, drunner_logger: logging.Logger) -> None:
+    cfg = _cfg(tmp_path, log_queue_size=1)
+    logger = configure_logging(cfg)
+    busy, release = threading.Event(), threading.Event()
+
+    class Slow(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            busy.set()
+            release.wait(5)
+
+    assert log_mod._listener is not None
+    log_mod._listener.handlers = (Slow(), *log_mod._listener.handlers)
+    logger.info("blocking the listener")
+    assert busy.wait(5)
+    for i in range(20):
+        logger.info("burst %d", i)  # at most one fits in the queue
+    release.set()
+
+    dropped = shutdown_logging()
+    assert dropped >= 19
+    text = cfg.log_file.read_text(encoding="utf-8")
+    written = text.count("| burst ") + text.count("blocking the listener")
+    assert written + dropped == 21
+    assert f"Dropped {dropped} log records" in text
+
+
+def _log(handler: logging.Handler, count: int, text: str = "x" * 40) -> None:
+    logger = logging.Logger("drunner.test_rotate")
+    logger.addHandler(handler)
+    for i in range(count):
+        logger.info("%s %d", text, i)
+
+
+def test_size_rotation_compresses_and_keeps_newest(tmp_path: Path) -> None:
+    path = tmp_path / "drunner.log"
+    handler = RotatingLogHandler(path, rotate="size", max_bytes=200, keep=3)
+    _log(handler, 40)
+    handler.close()  # waits for the archiver
+
+    rotated = handler.rotated_files()
+    assert len(rotated) == 3
+    assert all(p.name.startswith("drunner_") and p.name.endswith(".log.gz") for p in rotated)
+    assert not list(tmp_path.glob("*.tmp"))
+    with gzip.open(rotated[-1], "rt", encoding="utf-8") as f:
+        last_rotated = f.read().splitlines()[-1]
+    first_active = path.read_text(encoding="utf-8").splitlines()[0]
+    assert int(first_active.split()[-1]) == int(last_rotated.split()[-1]) + 1
+
+
+def test_time_rotation_and_none(tmp_path: Path) -> None:
+    handler = RotatingLogHandler(tmp_path / "hourly.log", rotate="hourly", compress=False)
+    assert handler.rollover_at is not None and handler.rollover_at > time.time()
+    _log(handler, 3)
+    handler.rollover_at = time.time() - 1
+    _log(handler, 1)
+    handler.close()
+    assert [p.suffix for p in handler.rotated_files()] == [".log"]
+    assert (tmp_path / "hourly.log").read_text(encoding="utf-8").count("\n") == 1
+
+    never = RotatingLogHandler(tmp_path / "never.log", rotate="none", max_bytes=10)
+    _log(never, 20)
+    never.close()
+    assert never.rotated_files() == []
+
+
+def test_startup_prunes_old_rotated_files(tmp_path: Path) -> None:
+    old = time.time() - 10 * 86400
+    for i in range(3):
+        p = tmp_path / f"drunner_20200101_00000{i}_000.log"
+        p.write_text("old\n", encoding="utf-8")
+        os.utime(p, (old, old))
+    recent = tmp_path / "drunner_20990101_000000_000.log"
+    recent.write_text("recent\n", encoding="utf-8")
+
+    handler = RotatingLogHandler(tmp_path / "drunner.log", max_age_days=7)
+    handler.close()
+    assert [p.name for p in handler.rotated_files()] == [recent.name + ".gz"]
@@ -0,0 +1,116 @@
+# tests/test_minimap.py
+
+import pygame
+
+from drunner_core.enemy import EnemyPool
+from drunner_core.fov import FieldOfView, FogOfWar
+from drunner_core.level import Level, Tile
+from drunner_core.minimap import Minimap, render_tiles
+from drunner_core.player import Player
+from drunner_core.render import TILE_COLORS
+
+
+def _level(width: int = 40, height: int = 30) -> Level:
+    rows = ["S" + "." * (width - 1)] + ["." * width] * (height - 2) + ["." * (width - 1) + "E"]
+    level = Level.from_ascii(rows, name="minimap")
+    for y in range(height):
+        level.set_tile(width // 2, y, Tile.WALL if y % 4 else Tile.FLOOR)
+    return level
+
+
+def test_render_tiles_maps_palette_per_tile() -> None:
+    level = _level(8, 6)
+    surface = render_tiles(level, 8, 6)
+    for y in range(6):
+        for x in range(8):
+            assert tuple(surface.get_at((x, y)))[:3] == TILE_COLORS[level.tile_at(x, y)]
+
+    assert render_tiles(level, 16, 12).get_at((9, 3))[:3] == TILE_COLORS[Tile.WALL]
+
+
+def test_size_is_bounded_and_keeps_aspect() -> None:
+    minimap = Minimap(max_size=100)
+    assert minimap.size_for(_level(1000, 500)) == (100, 50)
+    # Small levels are not blown up beyond a few pixels per tile.
+    assert minimap.size_for(_level(10, 5)) == (40, 20)
+
+
+def _composited(minimap: Minimap) -> bytes:
+    assert minimap._surface is not None
+    return pygame.image.tobytes(minimap._surface, "RGB")
+
+
+def test_incremental_fog_matches_full_rebuild() -> None:
+    level = _level(120, 90)
+    fog = FogOfWar(FieldOfView(level, radius=6))
+    player = Player(x=0, y=0)
+    enemies = EnemyPool(seed=1)
+    screen = pygame.Surface((320, 240))
+
+    incremental = Minimap(max_size=64)
+    for x, y in [(0, 0), (5, 3), (12, 8), (30, 20), (31, 20), (90, 70)]:
+        player.x, player.y = x, y
+        fog.update(x, y)
+        incremental.draw(screen, level, player, enemies, fog)
+
+    rebuilt = Minimap(max_size=64)
+    rebuilt.draw(screen, level, player, enemies, fog)
+    assert incremental._unexplored == rebuilt._unexplored
+    assert _composited(incremental) == _composited(rebuilt)
+    assert 0 < incremental._unexplored.count(0) < len(incremental._unexplored)
+
+
+def test_redraw_reports_changes_only() -> None:
+    level = _level()
+    fog = FogOfWar(FieldOfView(level, radius=4))
+    player = Player(x=0, y=0)
+    enemies = EnemyPool(seed=2)
+    enemies.add(2, 2, move_interval=0.0)
+    fog.update(player.x, player.y)
+    screen = pygame.Surface((320, 240))
+    minimap = Minimap(max_size=80)
+
+    rect, changed = minimap.draw(screen, level, player, enemies, fog, (0, 0, 9, 9))
+    assert changed
+    assert screen.get_rect().contains(rect)
+    surface = minimap._surface
+
+    # Nothing moved: no change and the cached surface is reused.
+    assert minimap.draw(screen, level, player, enemies, fog, (0, 0, 9, 9)) == (rect, False)
+    assert minimap._surface is surface
+
+    # A new view rect is a marker change; the cached layers stay.
+    assert minimap.draw(screen, level, player, enemies, fog, (4, 0, 13, 9))[1]
+    assert minimap._surface is surface
+
+    # Moving and seeing new tiles rebuilds the composite.
+    player.x = 6
+    fog.update(player.x, player.y)
+    assert minimap.draw(screen, level, player, enemies, fog, (4, 0, 13, 9))[1]
+    assert minimap._surface is not surface
+
+    # Tile edits bump Level.revision and rebuild the tile layer.
+    surface = minimap._surface
+    level.set_tile(3, 3, Tile.WALL)
+    assert minimap.draw(screen, level, player, enemies, fog, (4, 0, 13, 9))[1]
+    assert minimap._surface is not surface
+
+
+def test_enemy_markers_follow_visibility() -> None:
+    level = _level()
+    fog = FogOfWar(FieldOfView(level, radius=3))
+    player = Player(x=0, y=0)
+    enemies = EnemyPool(seed=3)
+    enemies.add(2, 1, move_interval=1e9)
+    enemies.add(15, 25, move_interval=1e9)
+    fog.update(player.x, player.y)
+    minimap = Minimap(max_size=80)
+
+    minimap.draw(pygame.Surface((320, 240)), level, player, enemies, fog)
+    assert minimap._markers is not None
+    assert len(minimap._markers[1]) == 1
+
+    # Without fog the camera view decides.
+    minimap.draw(pygame.Surface((320, 240)), level, player, enemies, None, (10, 20, 20, 29))
+    assert len(minimap._markers[1]) == 1
+    assert minimap._markers[2] is not None
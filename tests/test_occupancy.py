@@ -0,0 +1,130 @@
+# tests/test_occupancy.py
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from drunner_core import enemy as enemy_mod
+from drunner_core.enemy import EnemyPool
+from drunner_core.level import Level
+from drunner_core.occupancy import OccupancyGrid
+
+
+def _level() -> Level:
+    return Level.from_ascii(
+        [
+            "########",
+            "#S.....#",
+            "#......#",
+            "#......#",
+            "#.....E#",
+            "########",
+        ],
+        name="occupancy_test",
+    )
+
+
+def test_occupancy_counts_and_moves() -> None:
+    occ = OccupancyGrid.from_positions(4, 3, [(1, 1), (1, 1), (2, 0)])
+
+    assert occ.count(1, 1) == 2
+    assert occ.is_occupied(2, 0)
+    assert not occ.is_occupied(9, 9)
+
+    occ.move(occ.index(1, 1), occ.index(2, 1))
+    assert occ.count(1, 1) == 1
+    assert occ.count(2, 1) == 1
+
+    occ.remove(2, 0)
+    with pytest.raises(ValueError):
+        occ.remove(2, 0)
+
+
+def test_occupancy_detects_swaps_within_tick() -> None:
+    occ = OccupancyGrid.from_positions(4, 3, [(1, 1)])
+
+    occ.begin_tick()
+    occ.move(occ.index(1, 1), occ.index(2, 1))
+    assert occ.crossed((1, 1), (2, 1))
+    assert not occ.crossed((2, 1), (1, 1))
+
+    occ.begin_tick()
+    assert not occ.crossed((1, 1), (2, 1))
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("block", [False, True])
+def test_pool_keeps_occupancy_in_sync(
+    monkeypatch: MonkeyPatch, use_numpy: bool, block: bool
+) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = _level()
+    pool = EnemyPool(seed=5)
+    pool.block_enemies = block
+    for x in range(1, 7):
+        pool.add(x, 2, move_interval=0.0)
+
+    for _ in range(40):
+        pool.begin_tick()
+        pool.update(0.1, level)
+
+        positions = list(pool.iter_positions())
+        expected = OccupancyGrid.from_positions(level.width, level.height, positions)
+        assert pool.occupancy is not None
+        assert pool.occupancy.counts == expected.counts
+        if block:
+            assert len(set(positions)) == len(positions)
+
+
+def test_pool_collides_on_swap() -> None:
+    level = _level()
+    pool = EnemyPool(seed=1)
+    pool.add(3, 1)
+    pool.attach(level)
+
+    # Enemy steps 3,1 -> 2,1 while the player steps 2,1 -> 3,1.
+    pool.begin_tick()
+    pool._commit_one(0, 2, 1)
+
+    assert pool.collides((2, 1), (3, 1))
+    assert not pool.collides((4, 1), (3, 1))
+    assert pool.collides((3, 1), (2, 1))  # same tile
+
+
+def test_moves_in_filters_by_rectangle() -> None:
+    grid = OccupancyGrid.from_positions(10, 10, [(1, 1), (8, 8)])
+    grid.move(grid.index(1, 1), grid.index(2, 1))
+    size = len(grid.counts)
+    grid.record_moves([grid.index(8, 8) * size + grid.index(8, 9)])
+
+    assert grid.moves_in(0, 0, 4, 4) == [(1, 1, 2, 1)]
+    assert grid.moves_in(8, 9, 9, 9) == [(8, 8, 8, 9)]
+    grid.begin_tick()
+    assert grid.moves_in(0, 0, 9, 9) == []
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_moves_in_matches_position_changes(monkeypatch: MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = _level()
+    pool = EnemyPool(seed=5)
+    for i in range(12):
+        pool.add(1 + i % 6, 1 + i // 6 * 2, move_interval=0.0)
+    pool.attach(level)
+
+    before = list(pool.iter_positions())
+    pool.begin_tick()
+    pool.update(0.0, level)
+    after = list(pool.iter_positions())
+
+    expected = sorted((*a, *b) for a, b in zip(before, after, strict=True) if a != b)
+    assert expected
+    assert sorted(pool.moves_in(0, 0, 7, 5)) == expected
+    assert all(y <= 2 or ty <= 2 for _, y, _, ty in pool.moves_in(0, 0, 7, 2))
@@ -0,0 +1,81 @@
+# tests/test_pathfinding.py
+
+import random
+from itertools import pairwise
+
+from drunner_core.generators import generate_level
+from drunner_core.level import Level, Tile
+from drunner_core.pathfinding import HierarchicalPathfinder, find_path_astar
+
+
+def _walkable(level: Level) -> list[tuple[int, int]]:
+    return [(x, y) for x, y, _t in level.iter_tiles() if level.is_walkable(x, y)]
+
+
+def _assert_valid_path(level: Level, path: list[tuple[int, int]]) -> None:
+    for (ax, ay), (bx, by) in pairwise(path):
+        assert abs(ax - bx) + abs(ay - by) == 1
+        assert level.is_walkable(bx, by)
+
+
+def test_hpa_paths_are_valid_and_near_optimal() -> None:
+    level = generate_level(seed=5, width=61, height=61)
+    hpa = HierarchicalPathfinder(level, cluster_size=8)
+    tiles = _walkable(level)
+    rng = random.Random(0)
+
+    for _ in range(40):
+        a, b = rng.choice(tiles), rng.choice(tiles)
+        flat = find_path_astar(level, a, b)
+        path = hpa.find_path(a, b)
+
+        assert (flat is None) == (path is None)
+        if flat is None:
+            continue
+        assert path[0] == a and path[-1] == b
+        _assert_valid_path(level, path)
+        assert len(path) <= len(flat) * 1.5
+
+
+def test_hpa_iter_path_matches_find_path() -> None:
+    level = generate_level(seed=2, width=41, height=41)
+    hpa = HierarchicalPathfinder(level, cluster_size=8)
+    tiles = _walkable(level)
+
+    it = hpa.iter_path(tiles[0], tiles[-1])
+    assert it is not None
+    assert list(it) == hpa.find_path(tiles[0], tiles[-1])
+
+
+def test_hpa_unreachable_and_blocked_targets() -> None:
+    level = Level.from_ascii(
+        [
+            "##########",
+            "#S..#....#",
+            "#...#...E#",
+            "##########",
+        ]
+    )
+    hpa = HierarchicalPathfinder(level, cluster_size=3)
+
+    assert hpa.find_path((1, 1), (8, 2)) is None
+    assert hpa.find_path((1, 1), (4, 1)) is None  # wall
+    assert hpa.find_path((1, 1), (1, 1)) == [(1, 1)]
+
+
+def test_hpa_incremental_update_matches_rebuild() -> None:
+    level = generate_level(seed=9, width=61, height=61)
+    hpa = HierarchicalPathfinder(level, cluster_size=8)
+    floors = [(x, y) for x, y, t in level.iter_tiles() if t == Tile.FLOOR]
+    rng = random.Random(3)
+
+    for _ in range(20):
+        x, y = rng.choice(floors)
+        level.set_tile(x, y, Tile.WALL)
+        hpa.update_tiles([(x, y)])
+
+    fresh = HierarchicalPathfinder(level, cluster_size=8)
+    assert hpa._adj == fresh._adj
+
+    a, b = _walkable(level)[0], _walkable(level)[-1]
+    assert hpa.find_path(a, b) == fresh.find_path(a, b)
@@ -0,0 +1,104 @@
+# tests/test_patrol.py
+
+import json
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from drunner_core import enemy as enemy_mod
+from drunner_core.enemy import Enemy, EnemyPool
+from drunner_core.level import EnemyKind, Level
+from drunner_core.level_io import LevelIOError, load_level, save_level
+from drunner_core.patrol import PatrolTable, RouteError, expand_route
+
+
+def _level() -> Level:
+    return Level.from_ascii(
+        [
+            "#########",
+            "#S......#",
+            "#.###.#.#",
+            "#.....#E#",
+            "#########",
+        ],
+        name="patrol_test",
+    )
+
+
+def test_expand_route_builds_closed_loop_of_adjacent_tiles() -> None:
+    loop = expand_route(_level(), (1, 1), [(5, 3)])
+
+    assert loop[0] == (1, 1)
+    assert (5, 3) in loop
+    assert len(set(loop)) == len(loop)
+    for (ax, ay), (bx, by) in zip(loop, loop[1:] + loop[:1], strict=True):
+        assert abs(ax - bx) + abs(ay - by) == 1
+
+
+def test_expand_route_rejects_bad_waypoints() -> None:
+    level = _level()
+    with pytest.raises(RouteError):
+        expand_route(level, (1, 1), [(2, 2)])  # wall
+
+    walled = Level.from_ascii(["#####", "#S#.#", "#.#E#", "#####"])
+    with pytest.raises(RouteError):
+        expand_route(walled, (1, 1), [(3, 1)])  # unreachable
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_patrol_matches_enemy(monkeypatch: MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy and enemy_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(enemy_mod, "np", None)
+
+    level = _level()
+    loop = tuple(expand_route(level, (1, 1), [(5, 3)]))
+    reference = Enemy(x=1, y=1, move_interval=0.0, kind=EnemyKind.PATROL, route=loop)
+    pool = EnemyPool.from_enemies([reference])
+    pool.add(7, 1)  # a random walker alongside
+
+    for step in range(2 * len(loop)):
+        reference.update(0.0, level)
+        pool.update(0.0, level)
+        assert pool.position(0) == (reference.x, reference.y) == loop[(step + 1) % len(loop)]
+
+
+def test_load_level_expands_and_roundtrips_patrols(tmp_path: Path) -> None:
+    path = tmp_path / "patrol.json"
+    payload = {
+        "version": 1,
+        "grid": [[int(t) for t in row] for row in _level().tiles],
+        "enemies": [[7, 1], {"x": 1, "y": 3, "type": "patrol", "route": [[5, 1], [5, 3]]}],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    level = load_level(path)
+    assert level.enemy_kind(1) == EnemyKind.PATROL
+    assert level.enemy_route(1) == [(5, 1), (5, 3)]
+    assert level.patrols is not None
+    assert level.patrols.route(0) == []
+    assert level.patrols.route(1) == PatrolTable.from_level(level).route(1)
+
+    out = tmp_path / "out.json"
+    save_level(level, out)
+    assert load_level(out).enemy_routes == level.enemy_routes
+
+
+@pytest.mark.parametrize(
+    "enemy",
+    [
+        {"x": 1, "y": 3, "type": "patrol"},
+        {"x": 1, "y": 3, "type": "patrol", "route": [[2, 2]]},
+        {"x": 1, "y": 3, "type": "chase", "route": [[5, 1]]},
+    ],
+)
+def test_load_level_rejects_invalid_routes(tmp_path: Path, enemy: dict) -> None:
+    path = tmp_path / "bad.json"
+    payload = {"version": 1, "grid": [[int(t) for t in row] for row in _level().tiles]}
+    payload["enemies"] = [enemy]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    with pytest.raises(LevelIOError):
+        load_level(path)
@@ -0,0 +1,91 @@
+# tests/test_profiler.py
+
+import random
+
+import pygame
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from drunner_core import profiler as profiler_mod
+from drunner_core.profiler import FRAME, FrameProfiler, LatencyHistogram
+from drunner_core.render import ProfilerOverlay
+
+
+def test_histogram_percentiles_within_bucket_error() -> None:
+    rng = random.Random(3)
+    values = sorted(rng.randrange(1, 50_000_000) for _ in range(5000))
+    h = LatencyHistogram()
+    for v in values:
+        h.record(v)
+
+    assert h.count == 5000
+    assert h.max == values[-1]
+    assert h.mean() == pytest.approx(sum(values) / len(values))
+    for q in (50, 95, 99):
+        exact = values[int(len(values) * q / 100) - 1]
+        assert h.percentile(q) == pytest.approx(exact, rel=0.07)
+
+    small = LatencyHistogram()
+    for v in (0, 3, 3, 7):
+        small.record(v)
+    assert small.percentile(50) == 3
+    assert small.percentile(100) == 7
+    assert LatencyHistogram().percentile(50) == 0
+
+
+def test_profiler_charges_time_to_phases(monkeypatch: MonkeyPatch) -> None:
+    now = [0]
+    monkeypatch.setattr(profiler_mod, "perf_counter_ns", lambda: now[0])
+
+    def advance(ms: float) -> None:
+        now[0] += int(ms * 1_000_000)
+
+    prof = FrameProfiler(phases=("events", "update", "render"), window=4)
+    assert prof.last(FRAME) == 0
+    for frame in range(10):
+        prof.begin_frame()
+        advance(1)
+        prof.mark("events")
+        for _tick in range(2):  # phases inside a loop add up
+            advance(0.5 + frame)
+            prof.mark("update")
+        advance(3)
+        prof.mark("render")
+        prof.end_frame()
+
+    assert prof.frames == 10
+    # Rolling window covers frames 6..9 only.
+    assert prof.recent("update", 0) == pytest.approx(1 + 2 * 6)
+    assert prof.recent("update", 99) == pytest.approx(1 + 2 * 9)
+    assert prof.recent("render", 50) == pytest.approx(3)
+    assert prof.recent(FRAME, 99) == pytest.approx(1 + 1 + 2 * 9 + 3)
+    # Last frame (9), in ns.
+    assert prof.last("update") == 2 * 9_500_000
+    assert prof.last(FRAME) == (1 + 2 * 9.5 + 3) * 1_000_000
+
+    summary = prof.summary()
+    assert summary["frames"] == 10
+    assert summary["seconds"] == pytest.approx((10 * 5 + 2 * sum(range(10))) / 1000)
+    assert summary["fps"] == pytest.approx(10 / summary["seconds"], rel=1e-3)
+    assert summary["cpu_seconds"] >= 0
+    assert list(summary["phases"]) == ["events", "update", "render", FRAME]
+    assert summary["phases"]["events"]["p50_ms"] == pytest.approx(1, rel=0.07)
+    assert summary["phases"]["update"]["max_ms"] == pytest.approx(19)
+
+
+def test_overlay_refreshes_at_most_every_refresh_ms() -> None:
+    prof = FrameProfiler()
+    prof.begin_frame()
+    for phase in prof.phases:
+        prof.mark(phase)
+    prof.end_frame()
+
+    overlay = ProfilerOverlay(prof, visible=True, refresh_ms=250)
+    screen = pygame.Surface((320, 240))
+    rect, changed = overlay.draw(screen, 1000)
+    assert changed and rect.width > 0 and screen.get_rect().contains(rect)
+    assert overlay.draw(screen, 1100) == (rect, False)
+    assert overlay.draw(screen, 1250)[1]
+
+    overlay.toggle()
+    assert not overlay.visible
@@ -0,0 +1,242 @@
+# tests/test_render.py
+
+import pygame
+
+import drunner_core.render as render_mod
+from drunner_core.enemy import EnemyPool
+from drunner_core.fov import FieldOfView, FogOfWar
+from drunner_core.level import Level, Tile
+from drunner_core.player import Player
+from drunner_core.render import (
+    BACKGROUND_COLOR,
+    FOG_ALPHA_EXPLORED,
+    FOG_ALPHA_UNEXPLORED,
+    DirtyRectRenderer,
+    FogSurfaceCache,
+    LevelSurfaceCache,
+    RenderParams,
+    draw_enemies,
+    draw_level,
+    draw_player,
+    render_fog,
+    tile_range,
+)
+
+
+def _level() -> Level:
+    return Level.from_ascii(
+        [
+            "########",
+            "#S...#.#",
+            "#....#E#",
+            "########",
+        ],
+        name="render_test",
+    )
+
+
+def test_level_cache_matches_direct_draw_and_is_reused() -> None:
+    level = _level()
+    params = RenderParams(tile_size=4, offset_x=3, offset_y=2)
+
+    direct = pygame.Surface((40, 30))
+    draw_level(direct, level, params)
+
+    cached = pygame.Surface((40, 30))
+    cache = LevelSurfaceCache()
+    cache.draw(cached, level, params)
+    chunks = dict(cache._chunks)
+    cache.draw(cached, level, RenderParams(4, 0, 0))
+
+    assert pygame.image.tobytes(direct, "RGB") == _drawn(level, params, (40, 30))
+    assert cache._chunks == chunks
+    assert all(cache._chunks[k] is v for k, v in chunks.items())
+
+
+def _drawn(level: Level, params: RenderParams, size: tuple[int, int]) -> bytes:
+    surface = pygame.Surface(size)
+    LevelSurfaceCache().draw(surface, level, params)
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def test_level_cache_chunks_match_direct_draw_when_scrolled(monkeypatch) -> None:
+    level = Level.from_ascii(["S" + "." * 38 + "E"] + ["#." * 20] * 29, name="big")
+    monkeypatch.setattr(render_mod, "LEVEL_CHUNK_PX", 12)  # 3x3-tile chunks
+    params = RenderParams(tile_size=4, offset_x=-37, offset_y=-21)
+
+    direct = pygame.Surface((50, 30))
+    draw_level(direct, level, params)
+    assert _drawn(level, params, (50, 30)) == pygame.image.tobytes(direct, "RGB")
+
+    cache = LevelSurfaceCache()
+    cache.draw(pygame.Surface((50, 30)), level, params)
+    # Only chunks overlapping the 13x8 visible tiles were rendered.
+    assert len(cache._chunks) == 5 * 4
+
+
+def test_level_cache_rebuilds_on_tile_or_size_change() -> None:
+    level = _level()
+    cache = LevelSurfaceCache()
+    surface = pygame.Surface((40, 20))
+    cache.draw(surface, level, RenderParams(4, 0, 0))
+    first = cache._chunks[(0, 0)]
+
+    cache.draw(surface, level, RenderParams(5, 0, 0))
+    assert cache._chunks[(0, 0)] is not first
+
+    cache.draw(surface, level, RenderParams(4, 0, 0))
+    before = cache._chunks[(0, 0)]
+    level.set_tile(2, 1, Tile.WALL)
+    cache.draw(surface, level, RenderParams(4, 0, 0))
+    assert cache._chunks[(0, 0)] is not before
+    assert surface.get_at((2 * 4 + 1, 1 * 4 + 1))[:3] == (110, 110, 110)
+
+
+def test_tile_range_clamps_to_level_and_view() -> None:
+    params = RenderParams(tile_size=10, offset_x=-25, offset_y=5)
+    assert tile_range(100, 100, params, 60, 40) == (2, 0, 8, 3)
+    assert tile_range(5, 2, params, 60, 40) == (2, 0, 4, 1)
+    # Level entirely off screen: empty range.
+    x0, _, x1, _ = tile_range(2, 2, params, 60, 40)
+    assert x0 > x1
+
+
+def test_fog_overlay_alpha_per_tile_state() -> None:
+    level = _level()
+    fog = FogOfWar(FieldOfView(level, radius=2))
+    fog.update(1, 1)
+    fog.update(3, 1)  # some tiles seen from (1, 1) drop out of view
+
+    overlay = render_fog(level, fog, tile_size=2)
+    assert overlay.get_size() == (16, 8)
+
+    def alpha(x: int, y: int) -> int:
+        return overlay.get_at((x * 2, y * 2)).a
+
+    assert alpha(3, 1) == 0  # visible
+    assert alpha(7, 3) == FOG_ALPHA_UNEXPLORED
+    explored_only = next(
+        (x, y) for x, y in fog.explored.positions() if not fog.visible.is_set(x, y)
+    )
+    assert alpha(*explored_only) == FOG_ALPHA_EXPLORED
+
+
+def _full_frame(level, params, player, enemies, fog) -> bytes:
+    screen = pygame.Surface((48, 24))
+    screen.fill(BACKGROUND_COLOR)
+    LevelSurfaceCache().draw(screen, level, params)
+    FogSurfaceCache().draw(screen, level, fog, params)
+    draw_enemies(screen, enemies, params, visible=fog.visible)
+    draw_player(screen, player, params)
+    return pygame.image.tobytes(screen, "RGB")
+
+
+def test_dirty_renderer_matches_full_redraw() -> None:
+    level = _level()
+    params = RenderParams(tile_size=5, offset_x=4, offset_y=2)
+    fog = FogOfWar(FieldOfView(level, radius=3))
+    player = Player(x=1, y=1)
+    enemies = EnemyPool(seed=4)
+    enemies.add(3, 2, move_interval=0.0)
+    enemies.add(4, 1, move_interval=0.0)
+
+    screen = pygame.Surface((48, 24))
+    renderer = DirtyRectRenderer(LevelSurfaceCache(), FogSurfaceCache())
+    fog.update(player.x, player.y)
+    assert renderer.render(screen, level, params, player, enemies, fog) == [screen.get_rect()]
+
+    # Nothing moved: nothing to update.
+    assert renderer.render(screen, level, params, player, enemies, fog) == []
+
+    for step in range(12):
+        if step % 4 == 0:
+            player.x = 1 + (step // 4) % 3
+            fog.update(player.x, player.y)
+        enemies.update(0.0, level)
+        rects = renderer.render(screen, level, params, player, enemies, fog)
+        assert all(screen.get_rect().contains(r) for r in rects)
+        assert pygame.image.tobytes(screen, "RGB") == _full_frame(
+            level, params, player, enemies, fog
+        )
+
+
+def test_dirty_renderer_fog_change_updates_only_the_field_of_view() -> None:
+    level = Level.from_ascii(["S.....", "......", ".....E"], name="fog_move")
+    params = RenderParams(tile_size=8, offset_x=0, offset_y=0)
+    fog = FogOfWar(FieldOfView(level, radius=1))
+    player = Player(x=2, y=1)
+    enemies = EnemyPool(seed=2)
+
+    screen = pygame.Surface((48, 24))
+    renderer = DirtyRectRenderer(LevelSurfaceCache(), FogSurfaceCache())
+    fog.update(player.x, player.y)
+    renderer.render(screen, level, params, player, enemies, fog)
+
+    player.x += 1
+    assert fog.update(player.x, player.y)
+    rects = renderer.render(screen, level, params, player, enemies, fog)
+
+    # Old and new fields of view cover tiles (1..4, 0..2), plus the player's
+    # old and new rects inside them.
+    assert screen.get_rect() not in rects
+    assert len(rects) == 3
+    assert pygame.Rect(8, 0, 32, 24) in rects
+    assert pygame.image.tobytes(screen, "RGB") == _full_frame(level, params, player, enemies, fog)
+
+
+def test_dirty_renderer_culls_to_view_and_matches_full_redraw() -> None:
+    rows = ["S" + "." * 30] + ["." * 31] * 18 + ["." * 30 + "E"]
+    level = Level.from_ascii(rows, name="scroll")
+    player = Player(x=0, y=0)
+    enemies = EnemyPool(seed=1)
+    for x, y in ((2, 1), (20, 15), (29, 18)):
+        enemies.add(x, y, move_interval=1e9)
+    enemies.attach(level)
+
+    screen = pygame.Surface((48, 24))
+    renderer = DirtyRectRenderer(LevelSurfaceCache(), FogSurfaceCache())
+    views = (
+        ((0, 0), 1),
+        ((-20 * 4, -14 * 4), 2),
+    )
+    for (ox, oy), in_view in views:
+        params = RenderParams(tile_size=4, offset_x=ox, offset_y=oy)
+        renderer.render(screen, level, params, player, enemies)
+
+        full = pygame.Surface((48, 24))
+        full.fill(BACKGROUND_COLOR)
+        LevelSurfaceCache().draw(full, level, params)
+        draw_enemies(full, enemies, params)
+        draw_player(full, player, params)
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(full, "RGB")
+        # Only enemies inside the 12x6 view are tracked.
+        assert list(renderer._drawn.values()).count("enemy") == in_view
+
+
+def test_interpolated_dirty_frames_match_full_redraw() -> None:
+    level = Level.from_ascii(["S......", ".......", ".......", "......E"], name="lerp")
+    params = RenderParams(tile_size=8, offset_x=2, offset_y=1)
+    player = Player(x=0, y=0)
+    enemies = EnemyPool(seed=9)
+    for x, y in ((2, 1), (3, 2), (5, 1), (4, 3)):
+        enemies.add(x, y, move_interval=0.0)
+    enemies.attach(level)
+
+    screen = pygame.Surface((60, 36))
+    renderer = DirtyRectRenderer(LevelSurfaceCache(), FogSurfaceCache())
+    for _tick in range(6):
+        player_prev = (player.x, player.y)
+        enemies.begin_tick()
+        player.x = min(player.x + 1, 6)
+        enemies.update(0.0, level)
+        assert enemies.moves_in(0, 0, 6, 3)
+
+        for alpha in (0.0, 0.25, 0.6, 1.0):
+            renderer.render(screen, level, params, player, enemies, None, alpha, player_prev)
+
+            full = pygame.Surface((60, 36))
+            full.fill(BACKGROUND_COLOR)
+            LevelSurfaceCache().draw(full, level, params)
+            draw_enemies(full, enemies, params, alpha=alpha)
+            draw_player(full, player, params, prev=player_prev, alpha=alpha)
+            assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(full, "RGB")
@@ -1,12 +1,28 @@
 # tests/test_report.py
 
+import gzip
 import json
+import logging
 import re
+import threading
 from pathlib import Path
 
+import pygame
 import pytest
 
-from drunner.report import write_run_report
+import drunner.report as report_mod
+import drunner_core.game as game_mod
+from drunner.config import AppConfig
+from drunner.report import (
+    RUNS_FILE,
+    JsonlReportSink,
+    ReportWriteError,
+    ReportWriter,
+    make_run_report,
+    segment_order,
+    segment_path,
+    write_run_report,
+)
 
 
 def test_write_run_report_creates_file_and_fields(tmp_path: Path) -> None:
@@ -38,3 +54,214 @@ def test_write_run_report_creates_file_and_fields(tmp_path: Path) -> None:
 
     # timestamp format: YYYYMMDD_HHMMSS_mmm
     assert re.fullmatch(r"\d{8}_\d{6}_\d{3}", data["timestamp"]) is not None
+
+
+def test_write_run_report_includes_profile(tmp_path: Path) -> None:
+    profile = {"frames": 2, "phases": {"frame": {"p50_ms": 1.5}}}
+    out = write_run_report(
+        project_root=tmp_path,
+        result="LOST",
+        duration_seconds=2.0,
+        level_source="ascii:test",
+        seed=1,
+        profile=profile,
+    )
+    assert json.loads(out.read_text(encoding="utf-8"))["profile"] == profile
+
+
+def _write_jsonl(tmp_path: Path, i: int, **kwargs) -> Path:
+    return write_run_report(
+        project_root=tmp_path,
+        result="WON" if i % 2 else "LOST",
+        duration_seconds=float(i),
+        level_source="levels/demo.json",
+        seed=i,
+        run_id=f"run{i}",
+        report_format="jsonl",
+        **kwargs,
+    )
+
+
+def _read_segment(path: Path) -> list[dict]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_jsonl_report_appends_one_line_per_run(tmp_path: Path) -> None:
+    paths = {_write_jsonl(tmp_path, i) for i in range(3)}
+    assert paths == {tmp_path / "reports" / RUNS_FILE}
+    assert not list((tmp_path / "reports").glob("run_*.json"))
+
+    rows = _read_segment(tmp_path / "reports" / RUNS_FILE)
+    assert [r["run_id"] for r in rows] == ["run0", "run1", "run2"]
+    assert rows[1]["result"] == "WON"
+    assert rows[2]["duration_seconds"] == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_jsonl_report_rotates_by_size(tmp_path: Path, compress: bool) -> None:
+    for i in range(20):
+        _write_jsonl(tmp_path, i, max_bytes=600, compress=compress)
+
+    active = tmp_path / "reports" / RUNS_FILE
+    segments = JsonlReportSink(active).segments()
+    assert segments[-1] == active
+    assert len(segments) > 2
+    assert all(p.stat().st_size <= 600 for p in segments if p.suffix == ".jsonl")
+    assert all(p.name.endswith(".jsonl.gz" if compress else ".jsonl") for p in segments[:-1])
+
+    # Nothing is lost or reordered across rotations.
+    rows = [row for p in segments for row in _read_segment(p)]
+    assert [r["seed"] for r in rows] == list(range(20))
+
+
+def test_segment_path_skips_names_in_use(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(report_mod, "_make_timestamp", lambda: "20260101_120000_000")
+    active = tmp_path / "drunner.log"
+
+    first = segment_path(active)
+    assert first.name == "drunner_20260101_120000_000.log"
+    first.with_name(first.name + ".gz").touch()
+    second = segment_path(active)
+    assert second.name == "drunner_20260101_120000_000_1.log"
+    second.touch()
+    assert segment_path(active).name == "drunner_20260101_120000_000_2.log"
+    assert segment_order(second, "drunner") > segment_order(first, "drunner")
+
+
+def test_unknown_report_format_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="report format"):
+        write_run_report(
+            project_root=tmp_path,
+            result="WON",
+            duration_seconds=1.0,
+            level_source="x",
+            report_format="xml",
+        )
+
+
+def _report(i: int):
+    return make_run_report(
+        result="WON", duration_seconds=i, level_source="x", seed=i, run_id=f"r{i}"
+    )
+
+
+def test_report_writer_batches_in_background(tmp_path: Path, monkeypatch) -> None:
+    save = report_mod.save_run_reports
+    started, release = threading.Event(), threading.Event()
+    batches: list[list[str]] = []
+
+    def slow_save(reports, **kwargs):
+        batches.append([r.run_id for r in reports])
+        started.set()
+        release.wait(5)
+        return save(reports, **kwargs)
+
+    monkeypatch.setattr(report_mod, "save_run_reports", slow_save)
+    writer = ReportWriter(tmp_path, report_format="jsonl")
+    writer.submit(_report(0))
+    assert started.wait(5)  # the thread is now blocked writing the first report
+    for i in range(1, 6):
+        writer.submit(_report(i))  # returns immediately while the thread is busy
+    release.set()
+
+    paths = writer.close()
+    assert paths == [tmp_path / "reports" / RUNS_FILE] * 6
+    assert batches == [["r0"], ["r1", "r2", "r3", "r4", "r5"]]
+    rows = _read_segment(paths[0])
+    assert [r["run_id"] for r in rows] == [f"r{i}" for i in range(6)]
+
+    assert writer.close() == paths  # idempotent
+    with pytest.raises(RuntimeError):
+        writer.submit(_report(9))
+
+
+def test_report_writer_retries_then_raises(tmp_path: Path, monkeypatch) -> None:
+    save = report_mod.save_run_reports
+    failures = {"left": 1}
+
+    def flaky_save(reports, **kwargs):
+        if failures["left"]:
+            failures["left"] -= 1
+            raise OSError("disk full")
+        return save(reports, **kwargs)
+
+    monkeypatch.setattr(report_mod, "save_run_reports", flaky_save)
+    writer = ReportWriter(tmp_path)
+    writer.submit(_report(1))
+    # The thread's attempt fails; close() retries it and succeeds.
+    (path,) = writer.close()
+    assert json.loads(path.read_text(encoding="utf-8"))["run_id"] == "r1"
+
+    failures["left"] = 2
+    writer = ReportWriter(tmp_path)
+    writer.submit(_report(2))
+    with pytest.raises(ReportWriteError, match="r2") as exc_info:
+        writer.close()
+    assert [r.run_id for r in exc_info.value.reports] == ["r2"]
+    assert isinstance(exc_info.value.__cause__, OSError)
+
+
+def test_report_writer_uses_configured_reports_dir(tmp_path: Path) -> None:
+    reports_dir = tmp_path / "out" / "runs"
+    writer = ReportWriter(tmp_path, report_format="jsonl", reports_dir=reports_dir)
+    writer.submit(_report(1))
+    assert writer.close() == [reports_dir / RUNS_FILE]
+    assert not (tmp_path / "reports").exists()
+
+
+class _LostReportWriter:
+    # ReportWriter whose report can never be written.
+    def __init__(self, *_args, **_kwargs) -> None:
+        pass
+
+    def submit(self, report) -> None:
+        pass
+
+    def close(self) -> list[Path]:
+        raise ReportWriteError("Could not write 1 run report(s)", [])
+
+
+def _game_cfg(tmp_path: Path) -> AppConfig:
+    return AppConfig(
+        root_dir=tmp_path,
+        logs_dir=tmp_path / "logs",
+        reports_dir=tmp_path / "reports",
+        levels_dir=tmp_path / "levels",
+        assets_dir=tmp_path / "assets",
+        console_level="INFO",
+        file_level="DEBUG",
+        log_file=tmp_path / "logs" / "drunner.log",
+        window_width=160,
+        window_height=96,
+        fps=0,
+        title="test",
+    )
+
+
+def test_lost_report_does_not_mask_a_game_crash(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setattr(game_mod, "ReportWriter", _LostReportWriter)
+
+    def no_window(*_args):
+        raise ValueError("no display")
+
+    monkeypatch.setattr(game_mod, "_open_window", no_window)
+    with pytest.raises(ValueError, match="no display"):
+        game_mod.run_game(_game_cfg(tmp_path), logging.getLogger("drunner.test_game"))
+
+
+def test_lost_report_raises_on_clean_exit(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setattr(game_mod, "ReportWriter", _LostReportWriter)
+    open_window = game_mod._open_window
+
+    def open_and_quit(*args):
+        window = open_window(*args)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return window
+
+    monkeypatch.setattr(game_mod, "_open_window", open_and_quit)
+    with pytest.raises(ReportWriteError):
+        game_mod.run_game(_game_cfg(tmp_path), logging.getLogger("drunner.test_game"))
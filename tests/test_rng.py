@@ -0,0 +1,53 @@
+# tests/test_rng.py
+
+import random
+import sys
+
+from drunner_core.enemy import Enemy
+from drunner_core.level import Level
+from drunner_core.rng import CounterRng
+
+
+def test_same_key_same_sequence() -> None:
+    a = CounterRng(key=123)
+    b = CounterRng(key=123)
+    assert [a.random() for _ in range(10)] == [b.random() for _ in range(10)]
+
+
+def test_split_streams_differ_and_are_reproducible() -> None:
+    first = [CounterRng.split(42, i).random() for i in range(100)]
+    again = [CounterRng.split(42, i).random() for i in range(100)]
+    other_seed = [CounterRng.split(43, i).random() for i in range(100)]
+
+    assert first == again
+    assert len(set(first)) == 100
+    assert first != other_seed
+
+
+def test_random_range_and_shuffle_is_permutation() -> None:
+    rng = CounterRng.split(1, 0)
+    values = [rng.random() for _ in range(1000)]
+    assert all(0.0 <= v < 1.0 for v in values)
+
+    items = list(range(10))
+    rng.shuffle(items)
+    assert sorted(items) == list(range(10))
+    assert all(0 <= rng.randbelow(4) < 4 for _ in range(100))
+
+
+def test_counter_rng_is_small() -> None:
+    assert sys.getsizeof(CounterRng(key=2**63)) < sys.getsizeof(random.Random()) // 10
+
+
+def test_enemy_walk_reproducible_per_run_seed() -> None:
+    level = Level.from_ascii(["#####", "#S..#", "#...#", "#..E#", "#####"], name="t")
+
+    def walk() -> list[tuple[int, int]]:
+        e = Enemy(x=2, y=2, move_interval=0.0, rng=CounterRng.split(2024, 0))
+        path = []
+        for _ in range(30):
+            e.update(1.0, level)
+            path.append((e.x, e.y))
+        return path
+
+    assert walk() == walk()
@@ -0,0 +1,85 @@
+# tests/test_scheduler.py
+
+import pytest
+
+from drunner_core.scheduler import TimerWheel
+
+
+def test_wheel_fires_only_due_keys() -> None:
+    wheel = TimerWheel(slot_width=10, slots=8)
+    wheel.schedule(1, 25)
+    wheel.schedule(2, 40)
+    wheel.schedule(3, 25)
+
+    wheel.advance(24)
+    assert wheel.pop_due() == []
+
+    wheel.advance(30)
+    assert sorted(wheel.pop_due()) == [1, 3]
+    assert len(wheel) == 1
+
+    wheel.advance(40)
+    assert wheel.pop_due() == [2]
+    assert len(wheel) == 0
+
+
+def test_wheel_handles_due_times_beyond_one_lap() -> None:
+    wheel = TimerWheel(slot_width=10, slots=4)  # one lap = 40
+    wheel.schedule(7, 125)
+
+    for now in range(0, 120, 5):
+        wheel.advance(now)
+        assert wheel.pop_due() == []
+
+    # A jump over several laps still finds it, without sweeping every lap.
+    wheel.advance(1_000)
+    assert wheel.pop_due() == [7]
+
+
+def test_wheel_schedule_in_the_past_fires_next_pop() -> None:
+    wheel = TimerWheel(slot_width=10, slots=4)
+    wheel.advance(100)
+    wheel.schedule(5, 90)
+
+    assert wheel.pop_due() == [5]
+    assert wheel.pop_due() == []
+
+
+def test_wheel_rejects_bad_shape() -> None:
+    with pytest.raises(ValueError):
+        TimerWheel(slot_width=0)
+    with pytest.raises(ValueError):
+        TimerWheel(slots=100)
+
+
+def test_wheel_next_due() -> None:
+    wheel = TimerWheel(slot_width=10, slots=4)  # one lap = 40
+    assert wheel.next_due() is None
+
+    wheel.schedule(1, 135)  # a later lap, in the same slot as 15
+    wheel.schedule(2, 77)
+    assert wheel.next_due() == 77
+
+    wheel.schedule(3, 15)
+    assert wheel.next_due() == 15
+
+    wheel.advance(20)
+    assert wheel.pop_due() == [3]
+    assert wheel.next_due() == 77
+
+    wheel.advance(100)
+    assert wheel.pop_due() == [2]
+    assert wheel.next_due() == 135
+
+    wheel.schedule(4, 50)  # already due
+    assert wheel.next_due() == 100
+
+
+def test_wheel_next_due_with_bulk_chunks() -> None:
+    np = pytest.importorskip("numpy")
+    wheel = TimerWheel(slot_width=10, slots=4)
+    wheel.schedule_many(np.arange(4), np.array([95, 63, 200, 64]))
+    assert wheel.next_due() == 63
+    wheel.advance(70)
+    assert sorted(wheel.pop_due()) == [1, 3]
+    assert wheel.next_due() == 95
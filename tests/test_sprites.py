@@ -0,0 +1,108 @@
+# tests/test_sprites.py
+
+import json
+from pathlib import Path
+
+import pygame
+import pytest
+
+from drunner_core.enemy import EnemyPool
+from drunner_core.level import Level
+from drunner_core.player import Player
+from drunner_core.render import (
+    BACKGROUND_COLOR,
+    DirtyRectRenderer,
+    FogSurfaceCache,
+    LevelSurfaceCache,
+    RenderParams,
+    draw_enemies,
+    draw_level,
+    draw_player,
+)
+from drunner_core.sprites import SpriteAtlas, SpriteAtlasError
+
+
+def _write_atlas(tiles_dir: Path) -> None:
+    tiles_dir.mkdir(parents=True)
+    sheet = pygame.Surface((8, 4), pygame.SRCALPHA)
+    sheet.fill((0, 0, 200, 255), pygame.Rect(0, 0, 4, 4))  # wall
+    sheet.fill((0, 250, 0, 128), pygame.Rect(4, 0, 4, 4))  # enemy, half transparent
+    pygame.image.save(sheet, str(tiles_dir / "sheet.png"))
+    (tiles_dir / "atlas.json").write_text(
+        json.dumps(
+            {"image": "sheet.png", "sprites": {"wall": [0, 0, 4, 4], "enemy": [4, 0, 4, 4]}}
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_load_atlas_and_cache_scaled_copies(tmp_path: Path) -> None:
+    _write_atlas(tmp_path / "tiles")
+    atlas = SpriteAtlas.load(tmp_path)
+
+    assert atlas.names() == ["enemy", "wall"]
+    wall = atlas.get("wall", 12)
+    assert wall is not None and wall.get_size() == (12, 12)
+    assert wall.get_at((11, 11))[:3] == (0, 0, 200)
+    assert atlas.get("wall", 12) is wall
+    assert atlas.get("wall", 12, 6) is not wall
+    assert atlas.get("player", 12) is None
+
+
+def test_load_separate_pngs_and_missing_dir(tmp_path: Path) -> None:
+    assert len(SpriteAtlas.load(tmp_path)) == 0
+
+    (tmp_path / "tiles").mkdir()
+    pygame.image.save(pygame.Surface((2, 2)), str(tmp_path / "tiles" / "floor.png"))
+    assert SpriteAtlas.load(tmp_path).names() == ["floor"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"image": "sheet.png"},
+        {"image": "sheet.png", "sprites": {"wall": [0, 0, 4]}},
+        {"image": "sheet.png", "sprites": {"wall": [6, 0, 4, 4]}},
+        {"image": "missing.png", "sprites": {}},
+    ],
+)
+def test_invalid_atlas_raises(tmp_path: Path, data: dict) -> None:
+    _write_atlas(tmp_path / "tiles")
+    (tmp_path / "tiles" / "atlas.json").write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(SpriteAtlasError):
+        SpriteAtlas.load(tmp_path)
+
+
+def test_sprites_drawn_and_dirty_frames_match_full_redraw(tmp_path: Path) -> None:
+    _write_atlas(tmp_path / "tiles")
+    atlas = SpriteAtlas.load(tmp_path)
+    level = Level.from_ascii(["#S....#", "#.....#", "#....E#"], name="sprites")
+    params = RenderParams(tile_size=8, offset_x=0, offset_y=0)
+
+    surface = pygame.Surface((56, 24))
+    draw_level(surface, level, params, atlas=atlas)
+    assert surface.get_at((3, 3))[:3] == (0, 0, 200)  # wall sprite
+    assert surface.get_at((11, 3))[:3] != (0, 0, 200)  # START has no sprite: rect
+
+    player = Player(x=1, y=0)
+    enemies = EnemyPool(seed=2)
+    for x, y in ((2, 1), (3, 1), (4, 2)):
+        enemies.add(x, y, move_interval=0.0)
+    enemies.attach(level)
+
+    screen = pygame.Surface((56, 24))
+    renderer = DirtyRectRenderer(LevelSurfaceCache(atlas=atlas), FogSurfaceCache(), atlas)
+    for _tick in range(5):
+        prev = (player.x, player.y)
+        enemies.begin_tick()
+        player.x = min(player.x + 1, 5)
+        enemies.update(0.0, level)
+        for alpha in (0.3, 1.0, 1.0):
+            renderer.render(screen, level, params, player, enemies, None, alpha, prev)
+
+            full = pygame.Surface((56, 24))
+            full.fill(BACKGROUND_COLOR)
+            LevelSurfaceCache(atlas=atlas).draw(full, level, params)
+            draw_enemies(full, enemies, params, alpha=alpha, atlas=atlas)
+            draw_player(full, player, params, prev=prev, alpha=alpha, atlas=atlas)
+            assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(full, "RGB")
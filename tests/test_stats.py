@@ -0,0 +1,180 @@
+# tests/test_stats.py
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import drunner.stats as stats_mod
+from drunner.report import RUNS_FILE, JsonlReportSink, make_run_report, write_run_report
+from drunner.stats import ReportIndex, format_table
+
+
+def _write(root: Path, i: int, fmt: str, **kwargs) -> Path:
+    return write_run_report(
+        project_root=root,
+        result="WON" if i % 3 == 0 else "LOST",
+        duration_seconds=float(i),
+        level_source=f"levels/l{i % 2}.json",
+        seed=i % 4,
+        run_id=f"r{i:03d}",
+        version="0.4.0",
+        report_format=fmt,
+        **kwargs,
+    )
+
+
+def test_update_reads_files_and_jsonl_incrementally(tmp_path: Path) -> None:
+    reports = tmp_path / "reports"
+    for i in range(6):
+        _write(tmp_path, i, "file")
+    for i in range(6, 12):
+        _write(tmp_path, i, "jsonl")
+
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        scan = index.update(reports)
+        assert (scan.runs, scan.sources, scan.invalid) == (12, 7, 0)
+        assert len(index) == 12
+
+        # Nothing changed: every source is skipped.
+        scan = index.update(reports)
+        assert (scan.runs, scan.sources, scan.skipped) == (0, 0, 7)
+
+        # New report file plus appended lines: only those are read.
+        _write(tmp_path, 12, "file")
+        _write(tmp_path, 13, "jsonl")
+        (reports / "crash_x.json").write_text("{}", encoding="utf-8")  # not a run report
+        scan = index.update(reports)
+        assert (scan.runs, scan.sources) == (2, 2)
+        assert len(index) == 14
+
+
+def test_partial_jsonl_line_is_read_on_the_next_scan(tmp_path: Path) -> None:
+    reports = tmp_path / "reports"
+    _write(tmp_path, 1, "jsonl")
+    line = json.dumps({"run_id": "late", "timestamp": "t", "result": "WON"}) + "\n"
+    with (reports / RUNS_FILE).open("a", encoding="utf-8") as f:
+        f.write(line[:10])
+
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        assert index.update(reports).runs == 1
+        with (reports / RUNS_FILE).open("a", encoding="utf-8") as f:
+            f.write(line[10:] + "not json\n")
+        scan = index.update(reports)
+        assert (scan.runs, scan.invalid) == (1, 1)
+        assert index.totals()["runs"] == 2
+
+
+def test_lines_appended_while_reading_are_read_next_time(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reports = tmp_path / "reports"
+    for i in range(3):
+        _write(tmp_path, i, "jsonl")
+    read_lines = stats_mod._read_lines
+
+    def read_then_append(f, consumed):
+        yield from read_lines(f, consumed)
+        # The game appends a run after the read, before the offset is saved.
+        _write(tmp_path, 99, "jsonl")
+
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        monkeypatch.setattr(stats_mod, "_read_lines", read_then_append)
+        assert index.update(reports).runs == 3
+        monkeypatch.undo()
+
+        assert index.update(reports).runs == 1
+        assert len(index) == 4
+
+
+def test_rotation_never_counts_a_run_twice(tmp_path: Path) -> None:
+    reports = tmp_path / "reports"
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        for i in range(30):
+            _write(tmp_path, i, "jsonl", max_bytes=800)
+            if i % 7 == 0:
+                index.update(reports)
+        index.update(reports)
+        assert len(JsonlReportSink(reports / RUNS_FILE).segments()) > 3
+        assert len(index) == 30
+
+        index.rebuild()
+        assert len(index) == 0
+        assert index.update(reports).runs == 30
+
+
+def test_rotated_file_that_grew_past_the_old_offset_is_read_from_the_start(
+    tmp_path: Path,
+) -> None:
+    reports = tmp_path / "reports"
+    for i in range(3):
+        _write(tmp_path, i, "jsonl")
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        assert index.update(reports).runs == 3
+
+        # Rotated, then the new runs.jsonl grows beyond the stored offset
+        # before the next scan.
+        old_size = (reports / RUNS_FILE).stat().st_size
+        JsonlReportSink(reports / RUNS_FILE, compress=False).rotate()
+        for i in range(3, 10):
+            _write(tmp_path, i, "jsonl")
+        assert (reports / RUNS_FILE).stat().st_size > old_size
+
+        index.update(reports)
+        assert len(index) == 10
+
+
+def test_ingest_streams_jsonl_archives_once(tmp_path: Path) -> None:
+    archive = tmp_path / "archive.jsonl.gz"
+    with gzip.open(archive, "wt", encoding="utf-8") as f:
+        for i in range(25):
+            report = make_run_report(
+                result="WON", duration_seconds=i, level_source="ci", run_id=f"a{i}"
+            )
+            f.write(json.dumps(report.__dict__) + "\n")
+
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        assert index.ingest(archive).runs == 25
+        assert index.ingest(archive).skipped == 1
+        assert index.totals() == {"runs": 25, "wins": 25, "win_rate": 1.0}
+
+
+def test_aggregates_by_group(tmp_path: Path) -> None:
+    for i in range(1, 101):
+        _write(tmp_path, i, "jsonl")
+    with ReportIndex(tmp_path / "index.sqlite3") as index:
+        index.update(tmp_path / "reports")
+
+        by_level = {row["level_source"]: row for row in index.aggregate("level_source")}
+        odd = by_level["levels/l1.json"]  # durations 1, 3, ..., 99
+        assert odd["runs"] == 50
+        assert odd["wins"] == sum(1 for i in range(1, 101, 2) if i % 3 == 0)
+        assert odd["mean_s"] == pytest.approx(50.0)
+        assert (odd["p50_s"], odd["p90_s"], odd["p99_s"]) == (49.0, 89.0, 99.0)
+
+        by_seed = index.aggregate("seed", limit=2)
+        assert [row["runs"] for row in by_seed] == [25, 25]
+        assert [row["seed"] for row in by_seed] == [0, 1]
+        assert index.aggregate("version")[0]["runs"] == 100
+
+        with pytest.raises(ValueError):
+            index.aggregate("run_id; DROP TABLE runs")
+
+
+def test_format_table_aligns_columns() -> None:
+    table = format_table([{"name": "a", "runs": 5}, {"name": "longer", "runs": 12}])
+    assert table.splitlines() == ["name    runs", "a          5", "longer    12"]
+    assert format_table([]) == "(no runs)"
+
+
+def test_index_is_reused_across_connections(tmp_path: Path) -> None:
+    _write(tmp_path, 1, "file")
+    db = tmp_path / "index.sqlite3"
+    with ReportIndex(db) as index:
+        index.update(tmp_path / "reports")
+    with ReportIndex(db) as index:
+        assert len(index) == 1
+        assert index.update(tmp_path / "reports").skipped == 1
+    assert os.path.getsize(db) > 0
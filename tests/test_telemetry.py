@@ -0,0 +1,87 @@
+# tests/test_telemetry.py
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from drunner_core.telemetry import (
+    FIELDS,
+    HEADER,
+    RECORD,
+    TelemetryFormatError,
+    TelemetryRecorder,
+    read_telemetry,
+    write_csv,
+    write_json,
+)
+
+
+def _record(recorder: TelemetryRecorder, frames: int) -> None:
+    for i in range(frames):
+        recorder.record(16_000_000 + i * 1000, 2_000_000, 5_000_000, 3, i % 2)
+
+
+def test_dump_round_trip(tmp_path: Path) -> None:
+    recorder = TelemetryRecorder(capacity=10)
+    _record(recorder, 4)
+    path = recorder.dump(tmp_path / "reports" / "telemetry_x.bin")
+    assert path.stat().st_size == HEADER.size + 4 * RECORD.size
+
+    dump = read_telemetry(path)
+    assert dump.frames == 4
+    assert dump.records[0] == (0, 16_000, 2_000, 5_000, 3, 0)
+    assert dump.rows()[3] == dict(zip(FIELDS, (3, 16_003, 2_000, 5_000, 3, 1), strict=True))
+
+
+def test_ring_keeps_the_newest_frames_in_order(tmp_path: Path) -> None:
+    recorder = TelemetryRecorder(capacity=5)
+    _record(recorder, 12)
+    assert len(recorder) == 5
+
+    dump = read_telemetry(recorder.dump(tmp_path / "t.bin"))
+    assert dump.frames == 12
+    assert [r[0] for r in dump.records] == [7, 8, 9, 10, 11]
+
+
+def test_values_clamp_to_field_range() -> None:
+    recorder = TelemetryRecorder(capacity=1)
+    recorder.record(10**16, 0, 999, 70_000, 1)
+    _, frame_us, _, render_us, enemies, _ = RECORD.unpack_from(recorder.to_bytes(), HEADER.size)
+    assert (frame_us, render_us, enemies) == (0xFFFF_FFFF, 0, 0xFFFF)
+
+
+def test_csv_and_json_output(tmp_path: Path) -> None:
+    recorder = TelemetryRecorder(capacity=4)
+    _record(recorder, 2)
+    dump = read_telemetry(recorder.dump(tmp_path / "t.bin"))
+
+    out = io.StringIO()
+    write_csv(dump, out)
+    assert out.getvalue().splitlines() == [
+        ",".join(FIELDS),
+        "0,16000,2000,5000,3,0",
+        "1,16001,2000,5000,3,1",
+    ]
+
+    out = io.StringIO()
+    write_json(dump, out)
+    data = json.loads(out.getvalue())
+    assert data["frames"] == 2 and data["fields"] == list(FIELDS)
+    assert data["records"][1]["frame_us"] == 16001
+
+
+def test_invalid_dumps_are_rejected(tmp_path: Path) -> None:
+    recorder = TelemetryRecorder(capacity=4)
+    _record(recorder, 3)
+    data = recorder.to_bytes()
+
+    for name, content in [("short", data[:5]), ("magic", b"XXXX" + data[4:]), ("cut", data[:-1])]:
+        path = tmp_path / f"{name}.bin"
+        path.write_bytes(content)
+        with pytest.raises(TelemetryFormatError):
+            read_telemetry(path)
+
+    with pytest.raises(ValueError):
+        TelemetryRecorder(capacity=0)